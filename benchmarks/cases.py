@@ -0,0 +1,79 @@
+import threading
+from typing import List, Dict, Any, Callable
+
+from clockclock24_py.constants.config import ANIMATION_TIME, ANIMATION_DELAY
+from clockclock24_py.renderers.raster import Rasterizer
+from clockclock24_py.utils.engine import (
+    Sequence,
+    compute_sequences,
+    get_wait_sequence,
+    reset_timer,
+    run
+)
+from clockclock24_py.utils.layout import NB_NUMBERS
+from clockclock24_py.utils.timers import get_time_timer, get_timers
+from clockclock24_py.utils.utils import get_max_animation_time, Timeout
+
+def tile_timer(timer: List[List[List[Dict[str, Any]]]],
+               nb_numbers: int) -> List[List[List[Dict[str, Any]]]]:
+    """Repeat the numbers of a timer to get a grid with more numbers"""
+    return [timer[i % len(timer)] for i in range(nb_numbers)]
+
+def get_sequences(nb_numbers: int) -> List[Sequence]:
+    """Get the sequences of a cycle, tiled to the grid size"""
+    shapes = [tile_timer(timer, nb_numbers) for timer in get_timers(False)]
+    return [
+        Sequence(timer=shapes[0], animation_time=ANIMATION_TIME, delay=ANIMATION_DELAY,
+                 animation_type="start"),
+        get_wait_sequence(shapes[0]),
+        Sequence(timer=shapes[1], animation_time=ANIMATION_TIME, is_reverse=True),
+        Sequence(timer=tile_timer(get_time_timer(), nb_numbers), seq_type="time",
+                 animation_time=ANIMATION_TIME, animation_type="end"),
+    ]
+
+def bench_engine_run(nb_numbers: int) -> Callable[[], Any]:
+    """Plan a full cycle with engine.run"""
+    timer = get_time_timer()
+    return lambda: run(timer, {"animation_time": ANIMATION_TIME})
+
+def bench_compute_sequences(nb_numbers: int) -> Callable[[], Any]:
+    """Compute the timer states of a cycle"""
+    timer = tile_timer(get_time_timer(), nb_numbers)
+    sequences = get_sequences(nb_numbers)
+    return lambda: compute_sequences(sequences, timer)
+
+def bench_reset_timer(nb_numbers: int) -> Callable[[], Any]:
+    """Reset the last timer state of a cycle"""
+    timer = compute_sequences(get_sequences(nb_numbers),
+                              tile_timer(get_time_timer(), nb_numbers))[-1]
+    return lambda: reset_timer(timer)
+
+def bench_get_max_animation_time(nb_numbers: int) -> Callable[[], Any]:
+    """Find the longest animation of a timer state"""
+    timer = compute_sequences(get_sequences(nb_numbers),
+                              tile_timer(get_time_timer(), nb_numbers))[0]
+    return lambda: get_max_animation_time(timer)
+
+def bench_timeout(nb_numbers: int) -> Callable[[], Any]:
+    """Schedule a zero length Timeout and wait for its callback"""
+    def schedule():
+        done = threading.Event()
+        Timeout(0).then(done.set).start()
+        done.wait()
+    return schedule
+
+def bench_render_frame(nb_numbers: int) -> Callable[[], Any]:
+    """Render a frame with the headless rasterizer"""
+    timer = tile_timer(get_time_timer(), nb_numbers)
+    rasterizer = Rasterizer(nb_numbers * 60, 140, nb_numbers)
+    return lambda: rasterizer.render(timer)
+
+# Benchmarks with the grid sizes they support, None for every size
+BENCHMARKS = {
+    "engine.run": (bench_engine_run, [NB_NUMBERS]),
+    "compute_sequences": (bench_compute_sequences, None),
+    "reset_timer": (bench_reset_timer, None),
+    "get_max_animation_time": (bench_get_max_animation_time, None),
+    "timeout": (bench_timeout, [NB_NUMBERS]),
+    "render_frame": (bench_render_frame, None),
+}
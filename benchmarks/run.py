@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+ClockClock24 Python - Benchmarks
+
+Time the engine, the scheduler and the headless renderer at several grid
+sizes, write the results as JSON and compare them with a stored baseline.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 4,16 --output results.json
+    python -m benchmarks.run --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import List, Dict, Any, Callable, Optional
+
+from benchmarks.cases import BENCHMARKS
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = [4, 16, 64]
+DEFAULT_THRESHOLD = 0.25  # Slowdown ratio reported as a regression
+
+def time_function(function: Callable[[], Any], repeat: int = 5,
+                  min_time: float = 0.05) -> float:
+    """Get the best time of a function call in milliseconds"""
+    # Find how many calls take long enough to be timed reliably
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+def run_benchmarks(sizes: List[int], names: Optional[List[str]] = None,
+                   repeat: int = 5) -> Dict[str, float]:
+    """Run the benchmarks and return the milliseconds per call of each"""
+    results = {}
+    for name, (factory, supported_sizes) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        for size in sizes if supported_sizes is None else supported_sizes:
+            key = f"{name}[{size}]"
+            results[key] = time_function(factory(size), repeat)
+            print(f"{key:<32} {results[key]:10.4f} ms", file=sys.stderr)
+    return results
+
+def compare_results(results: Dict[str, float], baseline: Dict[str, float],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Get the benchmarks that are slower than the baseline by more than the threshold"""
+    regressions = []
+    for key, value in results.items():
+        reference = baseline.get(key)
+        if reference and value > reference * (1 + threshold):
+            regressions.append(f"{key}: {value:.4f} ms, baseline {reference:.4f} ms "
+                               f"(+{(value / reference - 1) * 100:.0f}%)")
+    return regressions
+
+def load_results(path: str) -> Dict[str, float]:
+    """Load the results of a previous run"""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+def save_results(path: str, results: Dict[str, float]):
+    """Save results with the environment they were measured in"""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Run the benchmarks from the command line"""
+    parser = argparse.ArgumentParser(description="ClockClock24 benchmarks")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated numbers of numbers in the grid")
+    parser.add_argument("--only", help="comma separated benchmark names")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    parser.add_argument("--output", help="file the JSON results are written to")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store the results as the new baseline")
+    options = parser.parse_args(args)
+
+    sizes = [int(size) for size in options.sizes.split(",")]
+    names = options.only.split(",") if options.only else None
+    results = run_benchmarks(sizes, names, options.repeat)
+
+    if options.output:
+        save_results(options.output, results)
+    else:
+        json.dump({"results": results}, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if options.save_baseline:
+        save_results(options.baseline, results)
+        return 0
+
+    if not os.path.exists(options.baseline):
+        return 0
+
+    regressions = compare_results(results, load_results(options.baseline), options.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+"""
+ClockClock24 Python - Soak test
+
+Fast-forward many animation cycles of ClockClock24 on a virtual clock with a
+stub canvas, and fail when memory, threads or canvas items keep growing.
+
+    python -m benchmarks.soak --cycles 2000
+
+With --threads, retarget cycles in real time instead, so that every timeout
+runs in its own thread, and fail when the live threads keep growing.
+
+    python -m benchmarks.soak --threads --cycles 200
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from typing import List, Dict, Any, Callable, Optional
+
+from clockclock24_py.components.clockclock24 import ClockClock24
+from clockclock24_py.utils import utils
+
+DEFAULT_CYCLES = 1000
+DEFAULT_CHECKPOINTS = 10
+DEFAULT_MAX_MEMORY_GROWTH = 512 * 1024  # bytes allowed after the warm-up checkpoint
+DEFAULT_MAX_THREAD_GROWTH = 0
+DEFAULT_FRAME_INTERVAL = 1000  # virtual milliseconds between two sampled frames, drawing is not what grows
+DEFAULT_THREAD_INTERVAL = 20  # milliseconds between two retargeted cycles in real time
+DEFAULT_THREAD_ANIMATION_TIME = 2000  # milliseconds, longer than the interval so steps are cancelled
+DEFAULT_MAX_REAL_THREAD_GROWTH = 4  # threads of the timeouts that are about to finish
+
+class StubTk:
+    """A Tcl interpreter stand-in that applies the batched canvas scripts"""
+
+    def __init__(self, canvas: "StubCanvas"):
+        self.canvas = canvas
+
+    def eval(self, script: str):
+        """Apply the coords commands of a script"""
+        for line in script.split("\n"):
+            words = line.split()
+            if len(words) > 2 and words[1] == "coords":
+                self.canvas.coords(int(words[2]), *map(float, words[3:]))
+
+    def call(self, *args: Any):
+        """Accept any direct Tcl command"""
+        return ""
+
+class StubCanvas:
+    """A canvas without Tk that keeps track of its items"""
+
+    def __init__(self):
+        self.items: Dict[int, List[float]] = {}
+        self.ids = itertools.count(1)
+        self.tk = StubTk(self)
+
+    def __str__(self):
+        return ".stub"
+
+    def create(self, *coords: float, **options: Any) -> int:
+        """Create an item and return its id"""
+        item = next(self.ids)
+        self.items[item] = list(coords)
+        return item
+
+    create_oval = create_line = create_rectangle = create_image = create
+
+    def delete(self, item: Any):
+        """Delete an item, or every item with "all" """
+        if item == "all":
+            self.items.clear()
+        else:
+            self.items.pop(item, None)
+
+    def coords(self, item: int, *coords: float):
+        """Move an item"""
+        if item in self.items and coords:
+            self.items[item] = list(coords)
+
+    def scale(self, *args: Any):
+        """Scaling does not change the number of items"""
+
+    def move(self, *args: Any):
+        """Moving does not change the number of items"""
+
+    def find_all(self) -> List[int]:
+        """Get every item id"""
+        return list(self.items)
+
+class StubRoot:
+    """A root window without Tk, its after callbacks run on the virtual clock"""
+
+    def __init__(self, width: int = 800, height: int = 600):
+        self.width = width
+        self.height = height
+        self.jobs = {}
+        self.job_ids = itertools.count(1)
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def bind(self, sequence: str, function: Callable[..., Any]):
+        """Key bindings are never triggered"""
+
+    def after(self, time_ms: int, function: Callable[[], Any]) -> str:
+        """Run a function after a virtual delay"""
+        job = f"after#{next(self.job_ids)}"
+        timeout = utils.Timeout(time_ms)
+        timeout.then(lambda: (self.jobs.pop(job, None), function()))
+        self.jobs[job] = timeout.start()
+        return job
+
+    def after_cancel(self, job: str):
+        """Cancel a function scheduled with after"""
+        timeout = self.jobs.pop(job, None)
+        if timeout:
+            timeout.cancel()
+
+def take_checkpoint(cycle: int, canvas: StubCanvas,
+                    scheduler: utils.VirtualScheduler) -> Dict[str, Any]:
+    """Measure the memory, threads and canvas items"""
+    gc.collect()
+    return {
+        "cycle": cycle,
+        "memory": tracemalloc.get_traced_memory()[0],
+        "threads": threading.active_count(),
+        "canvas_items": len(canvas.find_all()),
+        "pending_timeouts": scheduler.get_pending(),
+        "virtual_time_ms": scheduler.now,
+    }
+
+def run_soak(cycles: int = DEFAULT_CYCLES, checkpoints: int = DEFAULT_CHECKPOINTS,
+             max_memory_growth: int = DEFAULT_MAX_MEMORY_GROWTH,
+             max_thread_growth: int = DEFAULT_MAX_THREAD_GROWTH,
+             frame_ms: int = DEFAULT_FRAME_INTERVAL) -> Dict[str, Any]:
+    """Run cycles on a virtual clock and report any unbounded growth"""
+    scheduler = utils.VirtualScheduler()
+    previous_scheduler = utils.set_scheduler(scheduler)
+    tracemalloc.start()
+    try:
+        canvas = StubCanvas()
+        clock = None
+        clock = ClockClock24(StubRoot(), canvas)
+        clock.renderer.frame_ms = frame_ms
+
+        # Count the cycles as the timeouts start them
+        counter = itertools.count(1)
+        start_cycle = clock.start_cycle
+        completed = [0]
+
+        def counting_start_cycle():
+            completed[0] = next(counter)
+            start_cycle()
+
+        clock.start_cycle = counting_start_cycle
+
+        every = max(1, cycles // checkpoints)
+        results = []
+        snapshot = None
+        while completed[0] < cycles:
+            if not scheduler.run_next():
+                break
+            if completed[0] and completed[0] % every == 0 and (
+                    not results or results[-1]["cycle"] != completed[0]):
+                results.append(take_checkpoint(completed[0], canvas, scheduler))
+                if len(results) == 1:
+                    snapshot = tracemalloc.take_snapshot()
+
+        failures = []
+        if len(results) >= 2:
+            first, last = results[0], results[-1]
+            memory_growth = last["memory"] - first["memory"]
+            if memory_growth > max_memory_growth:
+                top = tracemalloc.take_snapshot().compare_to(snapshot, "lineno")[:5]
+                failures.append(f"memory grew by {memory_growth} bytes: "
+                                + "; ".join(str(stat) for stat in top))
+            if last["threads"] - first["threads"] > max_thread_growth:
+                failures.append(f"threads grew from {first['threads']} to {last['threads']}")
+            if last["canvas_items"] > first["canvas_items"]:
+                failures.append(f"canvas items grew from {first['canvas_items']} "
+                                f"to {last['canvas_items']}")
+        if completed[0] < cycles:
+            failures.append(f"only {completed[0]} of {cycles} cycles ran")
+
+        return {"cycles": completed[0], "checkpoints": results, "failures": failures}
+    finally:
+        if clock is not None and clock.watchdog:
+            clock.watchdog.stop()
+        tracemalloc.stop()
+        utils.set_scheduler(previous_scheduler)
+
+def run_thread_soak(cycles: int = 200, checkpoints: int = DEFAULT_CHECKPOINTS,
+                    interval_ms: int = DEFAULT_THREAD_INTERVAL,
+                    max_thread_growth: int = DEFAULT_MAX_REAL_THREAD_GROWTH) -> Dict[str, Any]:
+    """Retarget cycles on real timeout threads and report a growing thread count"""
+    canvas = StubCanvas()
+    clock = ClockClock24(StubRoot(), canvas)
+    clock.animation_time = DEFAULT_THREAD_ANIMATION_TIME
+    try:
+        every = max(1, cycles // checkpoints)
+        results = []
+        for cycle in range(1, cycles + 1):
+            # Cancels the running step and the next cycle, like the space bar
+            clock.start_cycle(interrupt=True)
+            time.sleep(interval_ms / 1000)
+            if cycle % every == 0:
+                results.append({
+                    "cycle": cycle,
+                    "threads": threading.active_count(),
+                    "pending_timeouts": utils.get_pending_timeouts(),
+                    "canvas_items": len(canvas.find_all()),
+                })
+
+        failures = []
+        if len(results) >= 2:
+            first, last = results[0], results[-1]
+            if last["threads"] - first["threads"] > max_thread_growth:
+                failures.append(f"threads grew from {first['threads']} to {last['threads']}")
+        return {"cycles": cycles, "checkpoints": results, "failures": failures}
+    finally:
+        if clock.watchdog:
+            clock.watchdog.stop()
+        clock.renderer.stop()
+        for timeout in (clock.sequence_timeout, clock.timeout):
+            if timeout:
+                timeout.cancel()
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Run the soak test from the command line"""
+    parser = argparse.ArgumentParser(description="ClockClock24 soak test")
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES, help="cycles to run")
+    parser.add_argument("--checkpoints", type=int, default=DEFAULT_CHECKPOINTS,
+                        help="number of measurements")
+    parser.add_argument("--max-memory-growth", type=int, default=DEFAULT_MAX_MEMORY_GROWTH,
+                        help="bytes of traced memory allowed to grow after warm-up")
+    parser.add_argument("--threads", action="store_true",
+                        help="retarget cycles in real time with a thread per timeout")
+    options = parser.parse_args(args)
+
+    if options.threads:
+        result = run_thread_soak(options.cycles, options.checkpoints)
+    else:
+        result = run_soak(options.cycles, options.checkpoints, options.max_memory_growth)
+    json.dump(result, sys.stdout, indent=2)
+    print()
+    for failure in result["failures"]:
+        print(f"FAILURE {failure}", file=sys.stderr)
+    return 1 if result["failures"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+from clockclock24_py.constants.config import DISPLAY_BACKEND, BLIT_MIN_CLOCKS
+from clockclock24_py.renderers.raster import Rasterizer
+from clockclock24_py.utils.canvas_batch import CanvasBatch
+from clockclock24_py.utils.layout import get_grid_size
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+def get_display_backend(nb_clocks: int, backend: str = DISPLAY_BACKEND) -> str:
+    """Choose between the vector canvas and the blit backend"""
+    if backend != "auto":
+        return backend
+    return "blit" if nb_clocks >= BLIT_MIN_CLOCKS else "canvas"
+
+class BlitDisplay:
+    """Display whole frames rendered by the rasterizer in a single photo image"""
+
+    def __init__(self, canvas: "tk.Canvas", width: int, height: int, clock_size: float,
+                 timer: List[List[List[Dict[str, Any]]]]):
+        """
+        Initialize a blit display
+
+        Args:
+            canvas: The canvas to draw on
+            width: The width of the displayed frames
+            height: The height of the displayed frames
+            clock_size: The size of each clock
+            timer: The timer to display first
+        """
+        import tkinter as tk
+
+        nb_numbers, nb_lines = get_grid_size(timer)
+        self.canvas = canvas
+        self.rasterizer = Rasterizer(
+            max(1, width), max(1, height), nb_numbers, nb_lines, clock_size
+        )
+        self.image = tk.PhotoImage(master=canvas, width=width, height=height)
+        self.item = canvas.create_image(0, 0, image=self.image, anchor="nw")
+        self.update(timer)
+
+    def update(self, timer: List[List[List[Dict[str, Any]]]],
+               batch: Optional[CanvasBatch] = None):
+        """Render the timer and push the frame into the photo image"""
+        self.rasterizer.render(timer)
+        data = self.rasterizer.to_pgm()
+        if batch:
+            batch.call(self.image.name, "put", data, "-format", "ppm")
+        else:
+            self.canvas.tk.call(self.image.name, "put", data, "-format", "ppm")
@@ -1,21 +1,28 @@
-import tkinter as tk
 import math
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
 from clockclock24_py.components.needle import Needle
+from clockclock24_py.utils import instrumentation
+from clockclock24_py.utils.canvas_batch import CanvasBatch
+from clockclock24_py.utils.layout import get_needle_sizes, get_center_dot_size
 from clockclock24_py.constants.config import (
     ANIMATION_START_TIMING,
     ANIMATION_END_TIMING,
     ANIMATION_DEFAULT_TIMING,
     ANIMATION_TIMING_CONFIG,
     CLOCK_BACKGROUND_COLOR,
+    CLOCK_OUTLINE_COLOR,
     NEEDLE_BACKGROUND_COLOR
 )
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 class Clock:
     """A clock component with two needles"""
     
-    def __init__(self, canvas: tk.Canvas, x: float, y: float, size: float, 
+    def __init__(self, canvas: "tk.Canvas", x: float, y: float, size: float, 
                 clock_data: Dict[str, Any]):
         """
         Initialize a clock
@@ -45,14 +52,12 @@ class Clock:
             self.x - self.size/2, self.y - self.size/2,
             self.x + self.size/2, self.y + self.size/2,
             fill=CLOCK_BACKGROUND_COLOR,
-            outline="#1a1a1a",
+            outline=CLOCK_OUTLINE_COLOR,
             width=1
         )
         
         # Calculate needle dimensions
-        needle_width = max(2, self.size / 25)  # Ensure needle is visible
-        hours_needle_length = self.size * 0.35  # Shorter hour hand
-        minutes_needle_length = self.size * 0.45  # Longer minute hand
+        needle_width, hours_needle_length, minutes_needle_length = get_needle_sizes(self.size)
         
         # Create the needles
         self.hours_needle = Needle(
@@ -72,7 +77,7 @@ class Clock:
         )
         
         # Draw center dot
-        dot_size = max(3, self.size / 20)
+        dot_size = get_center_dot_size(self.size)
         self.center_dot = self.canvas.create_oval(
             self.x - dot_size/2, self.y - dot_size/2,
             self.x + dot_size/2, self.y + dot_size/2,
@@ -83,8 +88,12 @@ class Clock:
         # Set initial rotation
         self.update(self.clock_data)
         
-    def update(self, clock_data: Dict[str, Any]):
+    def update(self, clock_data: Dict[str, Any], batch: Optional[CanvasBatch] = None):
         """Update the clock with new data"""
+        recorder = instrumentation.recorder
+        if recorder is not None:
+            start = time.perf_counter()
+            
         self.clock_data = clock_data
         
         # Get rotation angles
@@ -92,15 +101,14 @@ class Clock:
         minutes_angle = self.clock_data.get("minutes", 0)
         
         # Rotate the needles
-        self.rotate_needle(self.hours_needle, hours_angle)
-        self.rotate_needle(self.minutes_needle, minutes_angle)
+        self.rotate_needle(self.hours_needle, hours_angle, batch)
+        self.rotate_needle(self.minutes_needle, minutes_angle, batch)
         
-    def rotate_needle(self, needle: Needle, angle: float):
-        """Rotate a needle to the specified angle"""
-        # Delete the old needle
-        if needle.needle:
-            self.canvas.delete(needle.needle)
+        if recorder is not None:
+            recorder.add("clock_update", start)
         
+    def rotate_needle(self, needle: Needle, angle: float, batch: Optional[CanvasBatch] = None):
+        """Rotate a needle to the specified angle"""
         # Convert angle to radians and adjust for canvas coordinates
         # In tkinter, 0 degrees is east, and angles increase clockwise
         # We need to adjust by -90 to make 0 degrees point north
@@ -110,10 +118,34 @@ class Clock:
         end_x = self.x + needle.height * math.cos(radians)
         end_y = self.y + needle.height * math.sin(radians)
         
+        # Once the needle is a line, move it in place instead of recreating it
+        if needle.is_line:
+            if batch:
+                batch.coords(needle.needle, self.x, self.y, end_x, end_y)
+            else:
+                self.canvas.coords(needle.needle, self.x, self.y, end_x, end_y)
+            return
+        
+        # Delete the old needle
+        if needle.needle:
+            self.canvas.delete(needle.needle)
+        
         # Draw a simple line for the needle
+        needle.is_line = True
         needle.needle = self.canvas.create_line(
             self.x, self.y, end_x, end_y,
             fill=NEEDLE_BACKGROUND_COLOR,
             width=needle.width,
-            capstyle=tk.ROUND
-        )
\ No newline at end of file
+            capstyle="round"
+        )
+        
+    def rescale(self, origin_x: float, origin_y: float, factor: float, 
+                dx: float, dy: float):
+        """Scale the clock geometry around an origin, then move it"""
+        self.x = origin_x + (self.x - origin_x) * factor + dx
+        self.y = origin_y + (self.y - origin_y) * factor + dy
+        self.size *= factor
+        for needle in (self.hours_needle, self.minutes_needle):
+            needle.x = self.x
+            needle.y = self.y
+            needle.height *= factor
@@ -1,42 +1,177 @@
-import tkinter as tk
+import os
+import signal
+import sys
 import threading
 import time
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
 from clockclock24_py.components.number import Number
+from clockclock24_py.components.blit import BlitDisplay, get_display_backend
 from clockclock24_py.constants.config import (
     NB_COLUMN_CLOCKS,
     ANIMATION_TIME,
-    CLOCK_MAX_SIZE,
-    CLOCK_PADDING,
-    GLOBAL_PADDING_CLOCK,
     GLOBAL_PADDING_MOBILE_CLOCK,
     CLOCK_BACKGROUND_COLOR,
-    BACKGROUND_COLOR
+    BACKGROUND_COLOR,
+    BATCH_CANVAS_UPDATES,
+    RESIZE_DEBOUNCE,
+    FRAME_DEADLINE,
+    FRAME_STATS_INTERVAL,
+    FRAME_STATS_ENV,
+    PROFILE_DURATION,
+    PROFILE_MODE,
+    PROFILE_ENV,
+    METRICS_HOST,
+    METRICS_PORT_ENV,
+    METRICS_TEXTFILE_ENV,
+    METRICS_TEXTFILE_INTERVAL,
+    WATCHDOG_THRESHOLD,
+    WATCHDOG_INTERVAL
 )
+from clockclock24_py.utils import events, instrumentation, metrics, profiling
 from clockclock24_py.utils.timers import get_time_timer
-from clockclock24_py.utils.utils import get_max_animation_time, start_timeout, run_sequences
-from clockclock24_py.utils.engine import run, reset_timer
+from clockclock24_py.utils.utils import get_env_port, get_time_ms, start_timeout
+from clockclock24_py.utils.engine import reset_timer
+from clockclock24_py.utils.canvas_batch import CanvasBatch
+from clockclock24_py.utils.fanout import DisplayCore, SamplingRenderer
+from clockclock24_py.utils.planning import (
+    get_plan_options,
+    get_remaining_time,
+    get_timeline,
+    plan_cycle
+)
+from clockclock24_py.utils.watchdog import Watchdog
+from clockclock24_py.utils.layout import (
+    get_clock_size,
+    get_number_positions,
+    get_colon_dots,
+    get_nb_clocks
+)
+
+if TYPE_CHECKING:
+    import tkinter as tk
 
 class ClockClock24:
     """The main ClockClock24 component that displays the time using 24 clocks"""
     
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: "tk.Tk", canvas: Optional["tk.Canvas"] = None,
+                 core: Optional[DisplayCore] = None):
         """
         Initialize the ClockClock24 component
         
         Args:
             root: The Tkinter root window
+            canvas: The canvas to draw on, created with the other widgets if not given
+            core: Plans the cycles shared with other displays, the clock plans its own if not given
         """
         self.root = root
+        self.core = core
+        self.renderer = None
         self.timer = get_time_timer()
         self.is_running = False
         self.timeout = None
+        self.sequence_timeout = None
+        self.timeline = None
+        self.cycle_start = 0
         self.animation_time = ANIMATION_TIME
+        # The shared core plans the cycles with its own options
+        self.plan_options = get_plan_options() if core is None else None
+        self.backend = get_display_backend(get_nb_clocks(self.timer))
+        self.blit = None
+        self.resize_job = None
+        self.layout_width = 0
+        self.layout_height = 0
+        self.metrics_server = None
+        self.watchdog = None
+        self.is_minute_cycle = False
+        self.cycle_count = 0
+        self.resize_stats = {
+            "scale_count": 0,
+            "last_scale_ms": 0.0,
+            "max_scale_ms": 0.0,
+            "rebuild_count": 0,
+            "last_rebuild_ms": 0.0,
+        }
+        
+        # Create the widgets unless a canvas is provided
+        if canvas is None:
+            canvas = self.create_widgets()
+        self.canvas = canvas
+        
+        # Collect the needle updates of each frame into a single Tcl call
+        self.batch = CanvasBatch(self.canvas, BATCH_CANVAS_UPDATES)
+        
+        # Calculate initial clock size
+        self.clock_size = self.get_clock_size()
+        
+        # Create the numbers
+        self.numbers = []
+        self.create_numbers()
+        
+        # Bind keyboard events
+        self.root.bind("<space>", lambda e: self.trigger_cycle())
+        self.root.bind("<F2>", lambda e: self.print_frame_summary())
+        self.root.bind("<F3>", lambda e: self.dump_events())
+        
+        # Record frame timings when a stats file is configured
+        self.frame_stats_path = os.environ.get(FRAME_STATS_ENV)
+        if self.frame_stats_path:
+            instrumentation.enable(FRAME_DEADLINE)
+            self.root.after(FRAME_STATS_INTERVAL, self.write_frame_stats)
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.print_frame_summary())
+            
+        # Profile the running cycles without restarting
+        self.root.bind("<F9>", lambda e: self.start_profiling())
+        if hasattr(signal, "SIGUSR2"):
+            signal.signal(signal.SIGUSR2, lambda signum, frame: self.start_profiling())
+        profile_setting = os.environ.get(PROFILE_ENV)
+        if profile_setting:
+            seconds, _, mode = profile_setting.partition(":")
+            try:
+                self.start_profiling(int(float(seconds) * 1000), mode or PROFILE_MODE)
+            except ValueError as error:
+                print(f"Ignoring {PROFILE_ENV}={profile_setting!r}: {error}", file=sys.stderr)
+            
+        # Export metrics for the fleet monitoring
+        metrics_port = get_env_port(METRICS_PORT_ENV)
+        self.metrics_textfile = os.environ.get(METRICS_TEXTFILE_ENV)
+        if metrics_port is not None or self.metrics_textfile:
+            metrics.enable()
+        if metrics_port is not None:
+            from clockclock24_py.utils.metrics_server import MetricsServer
+            try:
+                self.metrics_server = MetricsServer(
+                    metrics.registry, METRICS_HOST, metrics_port
+                ).start()
+            except OSError as error:
+                print(f"Metrics not served on port {metrics_port}: {error}", file=sys.stderr)
+        if self.metrics_textfile:
+            self.root.after(METRICS_TEXTFILE_INTERVAL, self.write_metrics)
+            
+        # Report the stalls of the main loop with its stack
+        if WATCHDOG_THRESHOLD:
+            self.watchdog = Watchdog(
+                self.root.after, WATCHDOG_THRESHOLD, WATCHDOG_INTERVAL
+            ).start()
+        
+        # Start the animation cycle, or follow the cycles of the shared core
+        if core is not None:
+            self.renderer = core.add_renderer(SamplingRenderer(self.show_timer, self.root.after))
+        else:
+            # The needles are drawn along the timeline of each cycle, not at its shapes
+            self.renderer = SamplingRenderer(self.show_timer, self.root.after)
+            self.start_next_cycle(1000)
+        
+        # Handle window resize
+        self.root.bind("<Configure>", self.on_resize)
+        
+    def create_widgets(self) -> "tk.Canvas":
+        """Create the frame, the canvas and the labels"""
+        import tkinter as tk
         
         # Create the main frame
-        self.frame = tk.Frame(root, bg=CLOCK_BACKGROUND_COLOR)
+        self.frame = tk.Frame(self.root, bg=CLOCK_BACKGROUND_COLOR)
         self.frame.pack(fill=tk.BOTH, expand=True)
         
         # Create the canvas
@@ -67,111 +202,50 @@ class ClockClock24:
         )
         self.footer_label.place(relx=0.5, rely=0.95, anchor=tk.CENTER)
         
-        # Calculate initial clock size
-        self.clock_size = self.get_clock_size()
-        
-        # Create the numbers
-        self.numbers = []
-        self.create_numbers()
-        
-        # Bind keyboard events
-        self.root.bind("<space>", lambda e: self.start_cycle())
-        
-        # Start the animation cycle
-        self.start_next_cycle(1000)
-        
-        # Handle window resize
-        self.root.bind("<Configure>", self.on_resize)
+        return self.canvas
         
     def get_clock_size(self) -> float:
         """Calculate the appropriate clock size based on window dimensions"""
         window_width = self.root.winfo_width() or 800  # Default to 800 if not yet configured
         window_height = self.root.winfo_height() or 600  # Default to 600 if not yet configured
         
-        # Use the smaller dimension to ensure clocks fit
-        min_dimension = min(window_width, window_height)
-        
-        # Calculate available width for all 4 numbers (each with 2 clocks side by side)
-        # Total width = 8 clocks in a row + spacing between hours and minutes
-        horizontal_clocks = 8  # 4 digits × 2 clocks per digit
-        horizontal_padding = GLOBAL_PADDING_CLOCK * 2  # Left and right padding
-        horizontal_spacing = CLOCK_PADDING * (horizontal_clocks - 1)  # Between clocks
-        colon_spacing = CLOCK_PADDING * 4  # Extra space for colon between hours and minutes
-        
-        available_width = window_width - horizontal_padding - horizontal_spacing - colon_spacing
-        clock_size_width = available_width / horizontal_clocks
-        
-        # Calculate available height for 3 clocks vertically
-        vertical_clocks = 3  # 3 clocks per digit vertically
-        vertical_padding = GLOBAL_PADDING_CLOCK * 2  # Top and bottom padding
-        vertical_spacing = CLOCK_PADDING * (vertical_clocks - 1)  # Between clocks
-        label_space = 80  # Space for labels
-        
-        available_height = window_height - vertical_padding - vertical_spacing - label_space
-        clock_size_height = available_height / vertical_clocks
-        
-        # Use the smaller size to ensure everything fits
-        clock_size = min(clock_size_width, clock_size_height, CLOCK_MAX_SIZE)
-        
-        return max(clock_size, 30)  # Ensure minimum size of 30 pixels
+        return get_clock_size(window_width, window_height)
         
     def create_numbers(self):
         """Create the four numbers that display the time"""
         # Clear existing numbers and canvas
         self.canvas.delete("all")
         self.numbers = []
-        
-        # Calculate the total width and height of the display
-        clock_size = self.clock_size
-        number_width = 2 * (clock_size + CLOCK_PADDING)
-        number_height = 3 * (clock_size + CLOCK_PADDING)
-        
-        # Add spacing between hour and minute pairs (colon space)
-        colon_spacing = clock_size
+        self.blit = None
         
         # Calculate the starting position to center the entire display
+        clock_size = self.clock_size
         canvas_width = self.root.winfo_width()
         canvas_height = self.root.winfo_height()
+        self.layout_width = canvas_width
+        self.layout_height = canvas_height
         
-        total_width = 4 * number_width + colon_spacing
-        start_x = (canvas_width - total_width) / 2
-        start_y = (canvas_height - number_height) / 2
+        # Render whole frames into a single image for dense walls
+        if self.backend == "blit":
+            self.blit = BlitDisplay(
+                self.canvas, canvas_width, canvas_height, clock_size, self.timer
+            )
+            return
         
         # Draw colon (two dots between hours and minutes)
-        colon_x = start_x + 2 * number_width + colon_spacing/2
-        dot_radius = clock_size / 8
-        dot_spacing = clock_size / 3
-        
-        # Top dot of colon
-        self.canvas.create_oval(
-            colon_x - dot_radius, 
-            start_y + number_height/2 - dot_spacing - dot_radius,
-            colon_x + dot_radius, 
-            start_y + number_height/2 - dot_spacing + dot_radius,
-            fill="#e8e8e8",
-            outline=""
-        )
-        
-        # Bottom dot of colon
-        self.canvas.create_oval(
-            colon_x - dot_radius, 
-            start_y + number_height/2 + dot_spacing - dot_radius,
-            colon_x + dot_radius, 
-            start_y + number_height/2 + dot_spacing + dot_radius,
-            fill="#e8e8e8",
-            outline=""
-        )
+        for dot_x, dot_y, dot_radius in get_colon_dots(canvas_width, canvas_height, clock_size):
+            self.canvas.create_oval(
+                dot_x - dot_radius, 
+                dot_y - dot_radius,
+                dot_x + dot_radius, 
+                dot_y + dot_radius,
+                fill="#e8e8e8",
+                outline=""
+            )
         
         # Create the four numbers (HH:MM)
-        for i in range(4):
-            # Add extra spacing between hours and minutes (between digits 1 and 2)
-            x_offset = 0
-            if i >= 2:
-                x_offset = colon_spacing
-                
-            x = start_x + i * number_width + x_offset
-            y = start_y
-            
+        positions = get_number_positions(canvas_width, canvas_height, clock_size)
+        for i, (x, y) in enumerate(positions):
             number = Number(
                 canvas=self.canvas,
                 x=x,
@@ -184,9 +258,56 @@ class ClockClock24:
             
     def update_numbers(self):
         """Update the numbers with the current timer data"""
+        recorder = instrumentation.recorder
+        registry = metrics.registry
+        if recorder is not None:
+            start = recorder.begin_frame()
+        elif registry is not None:
+            start = time.perf_counter()
+            
+        self.batch.begin_frame()
+        if self.blit:
+            self.blit.update(self.timer, self.batch)
         for i, number in enumerate(self.numbers):
             if i < len(self.timer):
-                number.update(self.timer[i])
+                number.update(self.timer[i], self.batch)
+        self.batch.flush()
+        
+        if recorder is not None:
+            recorder.end_frame(start)
+        if registry is not None:
+            registry.observe_frame(start)
+        
+    def get_frame_stats(self) -> Dict[str, Any]:
+        """Get the round trips and milliseconds spent per frame"""
+        return self.batch.get_stats()
+        
+    def print_frame_summary(self):
+        """Print the frame timings, starting the recording if needed"""
+        recorder = instrumentation.recorder
+        if recorder is None:
+            instrumentation.enable(FRAME_DEADLINE)
+            print("Frame timing recording started", file=sys.stderr)
+            return
+        print(recorder.format_summary(), file=sys.stderr)
+        
+    def write_frame_stats(self):
+        """Write the frame timings to the stats file and schedule the next write"""
+        recorder = instrumentation.recorder
+        if recorder is not None:
+            recorder.write_summary(self.frame_stats_path, {"canvas": self.get_frame_stats()})
+        self.root.after(FRAME_STATS_INTERVAL, self.write_frame_stats)
+        
+    def dump_events(self, path: Optional[str] = None) -> str:
+        """Write the recent cycle events to a JSON Lines file without blocking"""
+        return events.log.dump(path)
+        
+    def write_metrics(self):
+        """Write the metrics to the textfile and schedule the next write"""
+        registry = metrics.registry
+        if registry is not None:
+            registry.write_textfile(self.metrics_textfile)
+        self.root.after(METRICS_TEXTFILE_INTERVAL, self.write_metrics)
             
     def on_resize(self, event):
         """Handle window resize event"""
@@ -196,70 +317,160 @@ class ClockClock24:
             self._last_width = event.width
             self._last_height = event.height
             
-            # Recalculate clock size
-            self.clock_size = self.get_clock_size()
+            # Nothing to rescale yet, build the layout right away
+            if self.layout_width <= 1 or self.layout_height <= 1:
+                self.rebuild_numbers()
+                return
+                
+            # Rescale the existing items while the size is changing
+            if self.numbers:
+                self.scale_numbers(event.width, event.height)
+            
+            # Rebuild everything once the size has settled
+            if self.resize_job:
+                self.root.after_cancel(self.resize_job)
+            self.resize_job = self.root.after(RESIZE_DEBOUNCE, self.rebuild_numbers)
+            
+    def scale_numbers(self, width: int, height: int):
+        """Rescale the drawn numbers in place to fit the new window size"""
+        start = time.perf_counter()
+        
+        old_size = self.clock_size
+        self.clock_size = self.get_clock_size()
+        factor = self.clock_size / old_size
+        
+        # Scale around the previous center, then move to the new center
+        old_x = self.layout_width / 2
+        old_y = self.layout_height / 2
+        dx = width / 2 - old_x
+        dy = height / 2 - old_y
+        
+        self.canvas.scale("all", old_x, old_y, factor, factor)
+        self.canvas.move("all", dx, dy)
+        for number in self.numbers:
+            number.rescale(old_x, old_y, factor, dx, dy)
             
-            # Redraw the numbers
-            self.create_numbers()
+        self.layout_width = width
+        self.layout_height = height
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        self.resize_stats["scale_count"] += 1
+        self.resize_stats["last_scale_ms"] = elapsed
+        self.resize_stats["max_scale_ms"] = max(self.resize_stats["max_scale_ms"], elapsed)
+        
+    def rebuild_numbers(self):
+        """Recalculate the clock size and redraw the numbers"""
+        start = time.perf_counter()
+        self.resize_job = None
+        
+        # Recalculate clock size
+        self.clock_size = self.get_clock_size()
+        
+        # Redraw the numbers
+        self.create_numbers()
+        
+        self.resize_stats["rebuild_count"] += 1
+        self.resize_stats["last_rebuild_ms"] = (time.perf_counter() - start) * 1000
+        
+    def get_resize_stats(self) -> Dict[str, Any]:
+        """Get the redraw times measured while resizing"""
+        return dict(self.resize_stats)
+        
+    def start_profiling(self, duration_ms: int = PROFILE_DURATION, mode: str = PROFILE_MODE):
+        """Profile the animation cycles for a while and write a .pstats file"""
+        session = profiling.start_profiling(duration_ms, mode=mode)
+        if session:
+            print(f"Profiling for {duration_ms / 1000:g} s into {session.path}", file=sys.stderr)
         
     def get_remaining_time(self) -> int:
         """Get the remaining time before the next minute change"""
-        seconds_in_milli = datetime.now().second * 1000
-        return 60 * 1000 - seconds_in_milli
+        return get_remaining_time()
         
-    def start_next_cycle(self, time_ms: int):
+    def start_next_cycle(self, time_ms: int, is_minute: bool = False):
         """Start the next animation cycle after the specified time"""
         self.timeout = start_timeout(time_ms)
         
         def on_timeout():
+            self.is_minute_cycle = is_minute
             self.start_cycle()
             
         self.timeout.then(on_timeout)
         
-    def animate_timer(self, timer: List[List[List[Dict[str, Any]]]]) -> None:
-        """Animate the timer with the new data"""
+    @profiling.profiled
+    def show_timer(self, timer: List[List[List[Dict[str, Any]]]]):
+        """Show needle angles sampled from the timeline of a cycle"""
         self.timer = timer
         self.update_numbers()
         
-        # Get the maximum animation time
-        animation_time = get_max_animation_time(timer)
+    def trigger_cycle(self):
+        """Start a cycle from the keyboard, retargeting the running one"""
+        if self.core is not None:
+            self.core.start_cycle(interrupt=True)
+        else:
+            self.start_cycle(interrupt=True)
+        
+    def interrupt_cycle(self):
+        """Cancel the running cycle and leave the needles where they are at this moment"""
+        events.log.record("interrupt", cycle=self.cycle_count)
+        if self.sequence_timeout:
+            self.sequence_timeout.cancel()
+            self.sequence_timeout = None
+        if self.timeline:
+            # The renderer keeps sampling, from these angles once the next cycle starts
+            self.timer = self.timeline.state_at(get_time_ms() - self.cycle_start)
+        self.is_running = False
         
-        # Return a timeout promise
-        return start_timeout(animation_time)
+    @profiling.profiled
+    def start_cycle(self, interrupt: bool = False):
+        """
+        Start the animation cycle
         
-    def start_cycle(self):
-        """Start the animation cycle"""
+        Args:
+            interrupt: Retarget a running cycle from the current needle angles
+                instead of skipping the new one
+        """
         if self.is_running:
-            return
+            if not interrupt:
+                events.log.record("skip", cycle=self.cycle_count, reason="running")
+                return
+            self.interrupt_cycle()
             
         if self.timeout:
+            if not self.timeout.is_completed:
+                events.log.record("cancel", cycle=self.cycle_count, reason="next cycle")
             self.timeout.cancel()
             self.timeout = None
             
+        # Plan the cycle, the clock only counts as running once it is planned
+        cycle = self.cycle_count + 1
+        options = dict(self.plan_options, animation_time=self.animation_time)
+        sequences = plan_cycle(self.timer, cycle, options, self.is_minute_cycle)
         self.is_running = True
+        self.cycle_count = cycle
+        self.is_minute_cycle = False
         
-        # Run the animation sequence
-        sequences = run(self.timer, {"animation_time": self.animation_time})
-        
-        # Create a list of functions to animate each sequence
-        sequence_functions = []
-        for timer in sequences:
-            def create_animation_function(t):
-                return lambda: self.animate_timer(t)
-            sequence_functions.append(create_animation_function(timer))
-        
-        # Run the sequences
-        timeout = run_sequences(sequence_functions)
+        # Sample the timeline of the cycle until it completes
+        events.log.record("animation_start", cycle=cycle)
+        self.timeline = get_timeline(self.timer, sequences)
+        self.cycle_start = get_time_ms()
+        self.renderer.start_cycle(self.timeline, self.cycle_start)
+        timeout = start_timeout(self.timeline.duration)
+        self.sequence_timeout = timeout
         
         def on_complete():
             # Reset the timer
             if sequences:
-                clear_timer = reset_timer(sequences[-1])
-                self.timer = clear_timer
-                self.update_numbers()
+                self.timer = reset_timer(sequences[-1])
+                self.renderer.end_cycle(self.timer)
+                
+            registry = metrics.registry
+            if registry is not None:
+                registry.canvas_items.set(len(self.canvas.find_all()))
+            events.log.record("animation_end", cycle=cycle)
                 
             # Start the next cycle
-            self.start_next_cycle(self.get_remaining_time())
+            self.sequence_timeout = None
+            self.start_next_cycle(self.get_remaining_time(), True)
             self.is_running = False
             
         timeout.then(on_complete) 
\ No newline at end of file
@@ -1,10 +1,12 @@
-import tkinter as tk
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tkinter as tk
 
 class Needle:
     """A needle component for the clock"""
     
-    def __init__(self, canvas: tk.Canvas, height: float, width: float, x: float, y: float):
+    def __init__(self, canvas: "tk.Canvas", height: float, width: float, x: float, y: float):
         """
         Initialize a needle
         
@@ -21,6 +23,7 @@ class Needle:
         self.x = x
         self.y = y
         self.needle = None
+        self.is_line = False
         self.draw()
         
     def draw(self):
@@ -32,6 +35,7 @@ class Needle:
         y2 = self.y + self.height
         
         # Create the needle as a rectangle with rounded top
+        self.is_line = False
         self.needle = self.canvas.create_rectangle(
             x1, y1, x2, y2,
             fill="#c9c9c9",  # Needle color
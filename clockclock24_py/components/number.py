@@ -1,13 +1,18 @@
-import tkinter as tk
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
 from clockclock24_py.components.clock import Clock
-from clockclock24_py.constants.config import CLOCK_PADDING
+from clockclock24_py.utils import instrumentation
+from clockclock24_py.utils.canvas_batch import CanvasBatch
+from clockclock24_py.utils.layout import get_clock_center
+
+if TYPE_CHECKING:
+    import tkinter as tk
 
 class Number:
     """A number component composed of 6 clocks arranged in a 3x2 grid"""
     
-    def __init__(self, canvas: tk.Canvas, x: float, y: float, 
+    def __init__(self, canvas: "tk.Canvas", x: float, y: float, 
                 number_data: List[List[Dict[str, Any]]], clock_size: float):
         """
         Initialize a number
@@ -32,9 +37,6 @@ class Number:
         # Clear any existing clocks
         self.clocks = []
         
-        # Use the constant padding between clocks
-        padding = CLOCK_PADDING
-        
         # Ensure we have the correct data structure (3 rows, 2 columns)
         if not self.number_data or len(self.number_data) != 3:
             # Default to empty data if invalid
@@ -45,8 +47,9 @@ class Number:
             for col_idx, clock_data in enumerate(row):
                 if col_idx < 2:  # Ensure we only have 2 columns
                     # Calculate position for this clock (center of the clock)
-                    clock_x = self.x + col_idx * (self.clock_size + padding) + self.clock_size / 2
-                    clock_y = self.y + row_idx * (self.clock_size + padding) + self.clock_size / 2
+                    clock_x, clock_y = get_clock_center(
+                        self.x, self.y, row_idx, col_idx, self.clock_size
+                    )
                     
                     # Create the clock
                     clock = Clock(
@@ -59,8 +62,13 @@ class Number:
                     
                     self.clocks.append(clock)
                 
-    def update(self, number_data: List[List[Dict[str, Any]]]):
+    def update(self, number_data: List[List[Dict[str, Any]]], 
+              batch: Optional[CanvasBatch] = None):
         """Update the number with new data"""
+        recorder = instrumentation.recorder
+        if recorder is not None:
+            start = time.perf_counter()
+            
         self.number_data = number_data
         
         # Ensure we have the correct number of clocks
@@ -74,5 +82,17 @@ class Number:
         for row_idx, row in enumerate(self.number_data):
             for col_idx, clock_data in enumerate(row):
                 if col_idx < 2 and clock_index < len(self.clocks):  # Safety check
-                    self.clocks[clock_index].update(clock_data)
-                    clock_index += 1 
\ No newline at end of file
+                    self.clocks[clock_index].update(clock_data, batch)
+                    clock_index += 1
+                    
+        if recorder is not None:
+            recorder.add("number_update", start)
+                    
+    def rescale(self, origin_x: float, origin_y: float, factor: float, 
+                dx: float, dy: float):
+        """Scale the number geometry around an origin, then move it"""
+        self.x = origin_x + (self.x - origin_x) * factor + dx
+        self.y = origin_y + (self.y - origin_y) * factor + dy
+        self.clock_size *= factor
+        for clock in self.clocks:
+            clock.rescale(origin_x, origin_y, factor, dx, dy)
@@ -7,6 +7,7 @@ GLOBAL_PADDING_MOBILE_CLOCK = 50
 
 # Colors
 CLOCK_BACKGROUND_COLOR = "#141414"
+CLOCK_OUTLINE_COLOR = "#1a1a1a"
 NEEDLE_BACKGROUND_COLOR = "#c9c9c9"
 BACKGROUND_COLOR = "#e8e8e8"
 
@@ -20,4 +21,49 @@ ANIMATION_TIMING_CONFIG = {
 }
 
 # Animation delay
-ANIMATION_DELAY = 300  # milliseconds 
\ No newline at end of file
+ANIMATION_DELAY = 300  # milliseconds 
+DELAY_PATTERNS = []  # Patterns picked for staggered cycles, e.g. ["radial", "random-wave:1"], empty for left to right
+ROTATION_MODE = None  # "travel" or "peak" to turn the needles the shortest way, None for full turns
+CHOREOGRAPHY_ENV = "CLOCKCLOCK24_CHOREOGRAPHY"  # Path of a JSON choreography played instead of random cycles
+GENERATED_SHAPES = False  # Add the procedural shapes of utils.generators to the random cycles
+SPLINE_TRAJECTORIES = False  # Draw and stream the needles along splines through the shapes instead of stopping at each one
+
+# Motor limits, animation times too short for them are stretched
+MOTION_MAX_VELOCITY = 0  # degrees per second, 0 to disable the motion planner
+MOTION_MAX_ACCELERATION = 720  # degrees per second squared
+MOTION_MAX_JERK = 0  # degrees per second cubed for S-curve profiles, 0 for trapezoidal
+
+# Rendering
+BATCH_CANVAS_UPDATES = True  # Send each frame's canvas updates in one Tcl call
+RESIZE_DEBOUNCE = 150  # milliseconds without resize events before a full rebuild
+DISPLAY_BACKEND = "auto"  # "canvas", "blit" or "auto" to choose from the clock count
+SAMPLE_INTERVAL = 40  # milliseconds between two frames of the displays fed by a DisplayCore
+BLIT_MIN_CLOCKS = 600  # Clocks from which "auto" renders whole frames into one image
+
+# Frame timing instrumentation
+FRAME_DEADLINE = 50  # milliseconds a frame may take before it counts as missed
+FRAME_STATS_INTERVAL = 60000  # milliseconds between two writes of the stats file
+FRAME_STATS_ENV = "CLOCKCLOCK24_FRAME_STATS"  # Path of the stats file, enables recording
+
+# Profiling
+PROFILE_DURATION = 30000  # milliseconds profiled after each trigger
+PROFILE_MODE = "cprofile"  # "cprofile" or "sample"
+PROFILE_ENV = "CLOCKCLOCK24_PROFILE"  # "seconds[:mode]", profiles right after startup
+
+# Metrics
+METRICS_HOST = "127.0.0.1"  # Address of the metrics listener, local only
+METRICS_PORT_ENV = "CLOCKCLOCK24_METRICS_PORT"  # Port of the metrics listener, enables metrics
+METRICS_TEXTFILE_ENV = "CLOCKCLOCK24_METRICS_TEXTFILE"  # Path for a textfile collector
+METRICS_TEXTFILE_INTERVAL = 15000  # milliseconds between two writes of the metrics file
+
+# Streaming to browser displays
+STREAM_HOST = "127.0.0.1"  # Address of the stream listener, local only
+STREAM_PORT_ENV = "CLOCKCLOCK24_STREAM_PORT"  # Port of the stream listener, enables streaming
+STREAM_FRAME_INTERVAL = 50  # milliseconds between two streamed frames
+STREAM_MAX_QUEUE = 64  # cycle messages a client may fall behind before it is disconnected
+STREAM_SEND_TIMEOUT = 5000  # milliseconds a client may take to accept a write before it is disconnected
+STREAM_MAX_MESSAGE = 4096  # bytes of a client message, larger ones close the connection
+
+# Main loop watchdog
+WATCHDOG_THRESHOLD = 1000  # milliseconds without heartbeat reported as a stall, 0 to disable
+WATCHDOG_INTERVAL = 100  # milliseconds between two heartbeats
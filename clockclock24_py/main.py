@@ -1,5 +1,10 @@
+import sys
 import tkinter as tk
 from clockclock24_py.components.clockclock24 import ClockClock24
+from clockclock24_py.constants.config import STREAM_HOST, STREAM_PORT_ENV
+from clockclock24_py.utils.fanout import DisplayCore
+from clockclock24_py.utils.planning import get_plan_options
+from clockclock24_py.utils.utils import get_env_port
 
 def main():
     """Main function to run the ClockClock24 application"""
@@ -19,8 +24,21 @@ def main():
     # Set window background color
     root.configure(bg="#e8e8e8")
     
+    # Stream the cycles to browser displays when a port is configured
+    core = None
+    stream_port = get_env_port(STREAM_PORT_ENV)
+    if stream_port is not None:
+        from clockclock24_py.utils.stream_server import StreamServer
+        try:
+            server = StreamServer(STREAM_HOST, stream_port).start()
+        except OSError as error:
+            print(f"Cycles not streamed on port {stream_port}: {error}", file=sys.stderr)
+        else:
+            core = DisplayCore(options=get_plan_options()).start()
+            core.add_renderer(server)
+    
     # Create the ClockClock24 component
-    clock_clock_24 = ClockClock24(root)
+    clock_clock_24 = ClockClock24(root, core=core)
     
     # Start the main loop
     root.mainloop()
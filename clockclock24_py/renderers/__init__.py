@@ -0,0 +1 @@
+# Renderers package initialization
\ No newline at end of file
@@ -0,0 +1,208 @@
+import math
+from typing import List, Dict, Any, Optional, Tuple
+
+from clockclock24_py.constants.config import (
+    CLOCK_BACKGROUND_COLOR,
+    CLOCK_OUTLINE_COLOR,
+    NEEDLE_BACKGROUND_COLOR,
+    BACKGROUND_COLOR
+)
+from clockclock24_py.utils.layout import (
+    NB_NUMBERS,
+    NB_LINES,
+    NB_CLOCKS_PER_LINE,
+    get_clock_size,
+    get_clock_center,
+    get_number_positions,
+    get_colon_dots,
+    get_needle_sizes,
+    get_center_dot_size,
+    iter_clocks
+)
+
+def get_grey(color: str) -> int:
+    """Convert a #rrggbb color to a grey level"""
+    red = int(color[1:3], 16)
+    green = int(color[3:5], 16)
+    blue = int(color[5:7], 16)
+    return round(0.299 * red + 0.587 * green + 0.114 * blue)
+
+def encode_pgm(width: int, height: int, pixels: bytearray) -> bytes:
+    """Encode a grey frame buffer as a binary PGM image"""
+    return b"P5\n%d %d\n255\n" % (width, height) + bytes(pixels)
+
+def get_span(center: float, half: float, width: int) -> Tuple[int, int]:
+    """Get the pixel columns covered by a span, clipped to the frame"""
+    start = max(0, math.ceil(center - half - 0.5))
+    end = min(width, math.floor(center + half - 0.5) + 1)
+    return start, end
+
+class FrameBuffer:
+    """A grey frame buffer that is drawn one row span at a time"""
+
+    def __init__(self, width: int, height: int, value: int = 0):
+        """
+        Initialize a frame buffer
+
+        Args:
+            width: The width of the frame in pixels
+            height: The height of the frame in pixels
+            value: The grey level the frame is filled with
+        """
+        self.width = width
+        self.height = height
+        self.pixels = bytearray([value]) * (width * height)
+        self.rows = {}
+
+    def get_row(self, value: int) -> bytes:
+        """Get a full row of the given grey level"""
+        row = self.rows.get(value)
+        if row is None:
+            row = self.rows[value] = bytes([value]) * self.width
+        return row
+
+    def fill_span(self, y: int, start: int, end: int, value: int):
+        """Fill the pixels of a row between two columns"""
+        if end > start:
+            offset = y * self.width
+            self.pixels[offset + start:offset + end] = self.get_row(value)[start:end]
+
+    def fill_disc(self, cx: float, cy: float, radius: float, value: int):
+        """Fill a disc"""
+        first = max(0, math.floor(cy - radius))
+        last = min(self.height - 1, math.ceil(cy + radius))
+        for y in range(first, last + 1):
+            dy = y + 0.5 - cy
+            if abs(dy) <= radius:
+                start, end = get_span(cx, math.sqrt(radius * radius - dy * dy), self.width)
+                self.fill_span(y, start, end, value)
+
+    def fill_capsule(self, x0: float, y0: float, x1: float, y1: float,
+                     radius: float, value: int):
+        """Fill a line segment with round caps"""
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length == 0:
+            self.fill_disc(x0, y0, radius, value)
+            return
+
+        # Corners of the band between the two caps
+        nx = -(y1 - y0) / length * radius
+        ny = (x1 - x0) / length * radius
+        corners = [
+            (x0 + nx, y0 + ny),
+            (x1 + nx, y1 + ny),
+            (x1 - nx, y1 - ny),
+            (x0 - nx, y0 - ny),
+        ]
+        edges = list(zip(corners, corners[1:] + corners[:1]))
+
+        first = max(0, math.floor(min(y0, y1) - radius))
+        last = min(self.height - 1, math.ceil(max(y0, y1) + radius))
+        for y in range(first, last + 1):
+            yc = y + 0.5
+            low = math.inf
+            high = -math.inf
+
+            # The caps
+            for cx, cy in ((x0, y0), (x1, y1)):
+                dy = yc - cy
+                if abs(dy) <= radius:
+                    half = math.sqrt(radius * radius - dy * dy)
+                    low = min(low, cx - half)
+                    high = max(high, cx + half)
+
+            # The band
+            for (ax, ay), (bx, by) in edges:
+                if (ay - yc) * (by - yc) <= 0 and ay != by:
+                    x = ax + (yc - ay) * (bx - ax) / (by - ay)
+                    low = min(low, x)
+                    high = max(high, x)
+
+            if low <= high:
+                start, end = get_span((low + high) / 2, (high - low) / 2, self.width)
+                self.fill_span(y, start, end, value)
+
+class Rasterizer:
+    """Render timers to a grey frame buffer without any display"""
+
+    def __init__(self, width: int, height: int, nb_numbers: int = NB_NUMBERS,
+                 nb_lines: int = NB_LINES, clock_size: Optional[float] = None):
+        """
+        Initialize a rasterizer
+
+        Args:
+            width: The width of the frames in pixels
+            height: The height of the frames in pixels
+            nb_numbers: The number of numbers in the rendered timers
+            nb_lines: The number of lines of clocks in each number
+            clock_size: The size of each clock, fitted to the frame if not given
+        """
+        self.width = width
+        self.height = height
+        self.nb_numbers = nb_numbers
+        self.nb_lines = nb_lines
+        self.clock_size = clock_size or get_clock_size(
+            width, height, nb_numbers, nb_lines, label_space=0, min_size=1
+        )
+        self.positions = get_number_positions(
+            width, height, self.clock_size, nb_numbers, nb_lines
+        )
+        self.background_value = get_grey(CLOCK_BACKGROUND_COLOR)
+        self.outline_value = get_grey(CLOCK_OUTLINE_COLOR)
+        self.needle_value = get_grey(NEEDLE_BACKGROUND_COLOR)
+        self.colon_value = get_grey(BACKGROUND_COLOR)
+        self.frame = FrameBuffer(width, height, self.background_value)
+        self.background = self.draw_background()
+
+    def draw_background(self) -> bytes:
+        """Draw the parts of the frame that never move"""
+        frame = FrameBuffer(self.width, self.height, self.background_value)
+        radius = self.clock_size / 2
+
+        # Clock faces with their outline
+        for number_x, number_y in self.positions:
+            for line_idx in range(self.nb_lines):
+                for clock_idx in range(NB_CLOCKS_PER_LINE):
+                    x, y = get_clock_center(number_x, number_y, line_idx, clock_idx,
+                                            self.clock_size)
+                    frame.fill_disc(x, y, radius, self.outline_value)
+                    frame.fill_disc(x, y, radius - 1, self.background_value)
+
+        # Colon dots
+        for x, y, dot_radius in get_colon_dots(self.width, self.height, self.clock_size,
+                                               self.nb_numbers, self.nb_lines):
+            frame.fill_disc(x, y, dot_radius, self.colon_value)
+
+        return bytes(frame.pixels)
+
+    def render(self, timer: List[List[List[Dict[str, Any]]]]) -> bytearray:
+        """Render a timer and return the frame buffer pixels"""
+        frame = self.frame
+        frame.pixels[:] = self.background
+
+        needle_width, hours_length, minutes_length = get_needle_sizes(self.clock_size)
+        needle_radius = needle_width / 2
+        dot_radius = get_center_dot_size(self.clock_size) / 2
+
+        for x, y, clock in iter_clocks(timer, self.positions, self.clock_size):
+            for key, length in (("hours", hours_length), ("minutes", minutes_length)):
+                radians = math.radians(clock.get(key, 0) - 90)
+                frame.fill_capsule(
+                    x, y,
+                    x + length * math.cos(radians),
+                    y + length * math.sin(radians),
+                    needle_radius,
+                    self.needle_value
+                )
+            frame.fill_disc(x, y, dot_radius, self.needle_value)
+
+        return frame.pixels
+
+    def to_pgm(self) -> bytes:
+        """Encode the last rendered frame as a binary PGM image"""
+        return encode_pgm(self.width, self.height, self.frame.pixels)
+
+    def save(self, path: str):
+        """Write the last rendered frame to a PGM file"""
+        with open(path, "wb") as file:
+            file.write(self.to_pgm())
@@ -0,0 +1,136 @@
+import argparse
+import os
+from typing import List, Dict, Any, Optional
+
+from clockclock24_py.constants.config import (
+    ANIMATION_TIME,
+    CLOCK_BACKGROUND_COLOR,
+    CLOCK_OUTLINE_COLOR,
+    NEEDLE_BACKGROUND_COLOR,
+    BACKGROUND_COLOR
+)
+from clockclock24_py.utils.layout import (
+    get_clock_size,
+    get_number_positions,
+    get_colon_dots,
+    get_needle_sizes,
+    get_center_dot_size,
+    get_grid_size,
+    iter_clocks
+)
+from clockclock24_py.utils.engine import reset_timer
+from clockclock24_py.utils.planning import get_plan_options, get_timeline, plan_cycle
+from clockclock24_py.utils.timers import get_time_timer
+from clockclock24_py.utils.splines import SplineTimeline
+
+def format_number(value: float, precision: int = 1) -> str:
+    """Format a number with as few characters as possible"""
+    text = f"{value:.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+def get_symbols(clock_size: float, precision: int = 1) -> str:
+    """Define the clock face and the needles once as symbols"""
+    needle_width, hours_length, minutes_length = get_needle_sizes(clock_size)
+    radius = format_number(clock_size / 2 - 0.5, precision)
+    dot = format_number(get_center_dot_size(clock_size) / 2, precision)
+    width = format_number(needle_width, precision)
+    needle = (
+        '<symbol id="{id}" overflow="visible">'
+        '<line y2="-{length}" stroke="{color}" stroke-width="{width}" stroke-linecap="round"/>'
+        '<circle r="{dot}" fill="{color}"/>'
+        '</symbol>'
+    )
+    return "".join([
+        f'<symbol id="f" overflow="visible">'
+        f'<circle r="{radius}" fill="{CLOCK_BACKGROUND_COLOR}" stroke="{CLOCK_OUTLINE_COLOR}"/>'
+        f'</symbol>',
+        needle.format(id="h", length=format_number(hours_length, precision),
+                      color=NEEDLE_BACKGROUND_COLOR, width=width, dot=dot),
+        needle.format(id="m", length=format_number(minutes_length, precision),
+                      color=NEEDLE_BACKGROUND_COLOR, width=width, dot=dot),
+    ])
+
+def render_svg(timer: List[List[List[Dict[str, Any]]]], width: int, height: int,
+               clock_size: Optional[float] = None, precision: int = 1) -> str:
+    """Render a timer as an SVG document"""
+    nb_numbers, nb_lines = get_grid_size(timer)
+    clock_size = clock_size or get_clock_size(
+        width, height, nb_numbers, nb_lines, label_space=0, min_size=1
+    )
+    positions = get_number_positions(width, height, clock_size, nb_numbers, nb_lines)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        f'<defs>{get_symbols(clock_size, precision)}</defs>',
+        f'<rect width="100%" height="100%" fill="{CLOCK_BACKGROUND_COLOR}"/>',
+    ]
+
+    for x, y, radius in get_colon_dots(width, height, clock_size, nb_numbers, nb_lines):
+        parts.append(
+            f'<circle cx="{format_number(x, precision)}" cy="{format_number(y, precision)}" '
+            f'r="{format_number(radius, precision)}" fill="{BACKGROUND_COLOR}"/>'
+        )
+
+    for x, y, clock in iter_clocks(timer, positions, clock_size):
+        position = f"{format_number(x, precision)} {format_number(y, precision)}"
+        hours = format_number(clock.get("hours", 0) % 360, precision)
+        minutes = format_number(clock.get("minutes", 0) % 360, precision)
+        parts.append(
+            f'<g transform="translate({position})"><use xlink:href="#f"/>'
+            f'<use xlink:href="#h" transform="rotate({hours})"/>'
+            f'<use xlink:href="#m" transform="rotate({minutes})"/></g>'
+        )
+
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+def export_frames(timers: List[List[List[List[Dict[str, Any]]]]], directory: str,
+                  width: int, height: int, prefix: str = "frame",
+                  precision: int = 1) -> List[str]:
+    """Write each timer to its own SVG file and return the file paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, timer in enumerate(timers):
+        path = os.path.join(directory, f"{prefix}_{index:04d}.svg")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(render_svg(timer, width, height, precision=precision))
+        paths.append(path)
+    return paths
+
+def main(args: Optional[List[str]] = None):
+    """Export the timer states of an animation cycle as SVG files"""
+    parser = argparse.ArgumentParser(description="Export ClockClock24 frames as SVG")
+    parser.add_argument("output", help="directory the SVG files are written to")
+    parser.add_argument("--width", type=int, default=800, help="width of the frames")
+    parser.add_argument("--height", type=int, default=300, help="height of the frames")
+    parser.add_argument("--precision", type=int, default=1,
+                        help="number of decimals of the coordinates and angles")
+    parser.add_argument("--fps", type=float, default=0,
+                        help="frames per second sampled along the animation, "
+                             "0 for one frame per timer state")
+    parser.add_argument("--animation-time", type=int, default=ANIMATION_TIME,
+                        help="animation time of each sequence in milliseconds")
+    parser.add_argument("--spline", action="store_true",
+                        help="sample the needles along splines through the shapes, with --fps")
+    options = parser.parse_args(args)
+
+    timer = get_time_timer()
+    sequences = plan_cycle(timer, 1, get_plan_options(options.animation_time))
+    if options.fps > 0:
+        if options.spline:
+            timeline = SplineTimeline(timer, sequences)
+        else:
+            timeline = get_timeline(timer, sequences)
+        nb_frames = int(timeline.duration * options.fps / 1000) + 1
+        timers = [timeline.state_at(index * 1000 / options.fps) for index in range(nb_frames)]
+    else:
+        timers = [timer] + sequences + ([reset_timer(sequences[-1])] if sequences else [])
+    for path in export_frames(timers, options.output, options.width, options.height,
+                              precision=options.precision):
+        print(path)
+
+if __name__ == "__main__":
+    main()
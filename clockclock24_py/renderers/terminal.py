@@ -0,0 +1,241 @@
+import argparse
+import math
+import sys
+import threading
+import time
+from typing import List, Dict, Any, Optional, TextIO
+
+from clockclock24_py.constants.config import ANIMATION_TIME, SAMPLE_INTERVAL
+from clockclock24_py.utils.fanout import DisplayCore, SamplingRenderer
+from clockclock24_py.utils.layout import NB_NUMBERS, NB_LINES, NB_CLOCKS_PER_LINE
+from clockclock24_py.utils.planning import get_plan_options
+
+# Braille dot bits, indexed by [y][x] inside a 2x4 character cell
+BRAILLE_BASE = 0x2800
+BRAILLE_DOTS = [
+    [0x01, 0x08],
+    [0x02, 0x10],
+    [0x04, 0x20],
+    [0x40, 0x80],
+]
+
+# Arrows for the 8 directions, starting north and going clockwise
+ARROWS = "↑↗→↘↓↙←↖"
+
+COLON_CHAR = "•"
+MAX_GAP = 6  # Unchanged characters rewritten rather than moving the cursor
+HOURS_LENGTH = 0.35
+MINUTES_LENGTH = 0.45
+
+def get_arrow(angle: float) -> str:
+    """Get the arrow closest to an angle"""
+    return ARROWS[round((angle % 360) / 45) % 8]
+
+def draw_braille_clock(hours: float, minutes: float, cols: int, rows: int) -> List[str]:
+    """Draw the needles of a clock as rows of braille characters"""
+    width = cols * 2
+    height = rows * 4
+    size = min(width, height)
+    cells = [[0] * cols for _ in range(rows)]
+    center_x = (width - 1) / 2
+    center_y = (height - 1) / 2
+
+    for angle, ratio in ((hours, HOURS_LENGTH), (minutes, MINUTES_LENGTH)):
+        length = size * ratio
+        radians = math.radians(angle - 90)
+        steps = max(1, int(length * 2))
+        for step in range(steps + 1):
+            distance = length * step / steps
+            x = round(center_x + distance * math.cos(radians))
+            y = round(center_y + distance * math.sin(radians))
+            if 0 <= x < width and 0 <= y < height:
+                cells[y // 4][x // 2] |= BRAILLE_DOTS[y % 4][x % 2]
+
+    return ["".join(chr(BRAILLE_BASE + bits) for bits in row) for row in cells]
+
+def draw_glyph_clock(hours: float, minutes: float, cols: int, rows: int) -> List[str]:
+    """Draw a clock as an arrow for each needle"""
+    lines = [" " * cols for _ in range(rows)]
+    text = (get_arrow(hours) + get_arrow(minutes)).center(cols)[:cols]
+    lines[rows // 2] = text
+    return lines
+
+def diff_frames(previous: Optional[List[str]], current: List[str]) -> str:
+    """Get the ANSI output that turns the previous frame into the current one"""
+    output = []
+    for y, row in enumerate(current):
+        old_row = previous[y] if previous and y < len(previous) else ""
+        changes = [x for x, char in enumerate(row)
+                   if x >= len(old_row) or old_row[x] != char]
+        if not changes:
+            continue
+
+        # Group the changes, rewriting short unchanged gaps instead of jumping
+        start = end = changes[0]
+        for x in changes[1:]:
+            if x - end > MAX_GAP:
+                output.append(f"\x1b[{y + 1};{start + 1}H{row[start:end + 1]}")
+                start = x
+            end = x
+        output.append(f"\x1b[{y + 1};{start + 1}H{row[start:end + 1]}")
+    return "".join(output)
+
+class TerminalRenderer:
+    """Render timers as rows of text for a terminal"""
+
+    def __init__(self, nb_numbers: int = NB_NUMBERS, nb_lines: int = NB_LINES,
+                 mode: str = "braille", clock_cols: int = 6, clock_rows: int = 3):
+        """
+        Initialize a terminal renderer
+
+        Args:
+            nb_numbers: The number of numbers in the rendered timers
+            nb_lines: The number of lines of clocks in each number
+            mode: "braille" to draw the needles, "glyph" for one arrow per needle
+            clock_cols: The number of characters of a clock horizontally
+            clock_rows: The number of characters of a clock vertically
+        """
+        self.nb_numbers = nb_numbers
+        self.nb_lines = nb_lines
+        self.mode = mode
+        self.clock_cols = clock_cols if mode == "braille" else max(2, clock_cols // 2)
+        self.clock_rows = clock_rows if mode == "braille" else 1
+        self.draw_clock = draw_braille_clock if mode == "braille" else draw_glyph_clock
+        self.cache = {}
+        self.number_width = NB_CLOCKS_PER_LINE * (self.clock_cols + 1)
+        self.width = nb_numbers * self.number_width + ((nb_numbers + 1) // 2 - 1) * 2
+        self.height = nb_lines * (self.clock_rows + 1) - 1
+
+    def get_clock(self, hours: float, minutes: float) -> List[str]:
+        """Get the drawing of a clock, reusing the drawings of known angles"""
+        key = (round(hours) % 360, round(minutes) % 360)
+        lines = self.cache.get(key)
+        if lines is None:
+            lines = self.cache[key] = self.draw_clock(
+                key[0], key[1], self.clock_cols, self.clock_rows
+            )
+        return lines
+
+    def get_number_column(self, number_idx: int) -> int:
+        """Get the first column of a number"""
+        return number_idx * self.number_width + (number_idx // 2) * 2
+
+    def render(self, timer: List[List[List[Dict[str, Any]]]]) -> List[str]:
+        """Render a timer as a list of rows"""
+        frame = [[" "] * self.width for _ in range(self.height)]
+
+        for number_idx, number in enumerate(timer):
+            number_x = self.get_number_column(number_idx)
+            for line_idx, line in enumerate(number):
+                for clock_idx, clock in enumerate(line):
+                    x = number_x + clock_idx * (self.clock_cols + 1)
+                    y = line_idx * (self.clock_rows + 1)
+                    lines = self.get_clock(clock.get("hours", 0), clock.get("minutes", 0))
+                    for row_idx, text in enumerate(lines):
+                        frame[y + row_idx][x:x + len(text)] = text
+
+        # Colons between each pair of numbers
+        for colon in range(1, (len(timer) + 1) // 2):
+            x = self.get_number_column(colon * 2) - 2
+            for y in (self.height // 3, self.height - 1 - self.height // 3):
+                frame[y][x] = COLON_CHAR
+
+        return ["".join(row) for row in frame]
+
+class TerminalDisplay:
+    """Write rendered frames to a terminal, only rewriting the changed cells"""
+
+    def __init__(self, renderer: TerminalRenderer, stream: Optional[TextIO] = None):
+        """
+        Initialize a terminal display
+
+        Args:
+            renderer: The renderer drawing the frames
+            stream: The stream the frames are written to, stdout by default
+        """
+        self.renderer = renderer
+        self.stream = stream or sys.stdout
+        self.frame = None
+        self.lock = threading.Lock()
+        self.frames = 0
+        self.bytes_written = 0
+        self.last_frame_bytes = 0
+
+    def update(self, timer: List[List[List[Dict[str, Any]]]]):
+        """Render a timer and write the difference with the previous frame"""
+        frame = self.renderer.render(timer)
+        with self.lock:
+            output = diff_frames(self.frame, frame)
+            if self.frame is None:
+                output = "\x1b[?25l\x1b[2J" + output
+            self.frame = frame
+            self.write(output)
+            self.frames += 1
+
+    def write(self, output: str):
+        """Write to the stream and keep track of the bandwidth"""
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+        size = len(output.encode("utf-8"))
+        self.bytes_written += size
+        self.last_frame_bytes = size
+
+    def close(self):
+        """Move the cursor below the frame and show it again"""
+        with self.lock:
+            height = len(self.frame) if self.frame else 0
+            self.write(f"\x1b[{height + 1};1H\x1b[?25h")
+
+class TerminalClock:
+    """Run the animation cycles of the clock on a terminal display"""
+
+    def __init__(self, display: TerminalDisplay, animation_time: int = ANIMATION_TIME,
+                 options: Optional[Dict[str, Any]] = None, frame_ms: int = SAMPLE_INTERVAL):
+        """
+        Initialize a terminal clock
+
+        Args:
+            display: The display the timers are written to
+            animation_time: The animation time of each sequence in milliseconds
+            options: The planning options, from planning.get_plan_options by default
+            frame_ms: The time between two frames sampled along the cycles
+        """
+        self.display = display
+        self.core = DisplayCore(animation_time, get_plan_options() if options is None else options)
+        self.renderer = self.core.add_renderer(SamplingRenderer(display.update, frame_ms=frame_ms))
+
+    def start_next_cycle(self, time_ms: int):
+        """Start the next animation cycle after the specified time"""
+        self.core.start_next_cycle(time_ms)
+
+    def stop(self):
+        """Cancel the cycles and stop drawing the frames"""
+        self.core.stop()
+        self.renderer.stop()
+
+def main(args: Optional[List[str]] = None):
+    """Run the clock on the terminal"""
+    parser = argparse.ArgumentParser(description="ClockClock24 on a terminal")
+    parser.add_argument("--mode", choices=["braille", "glyph"], default="braille",
+                        help="draw the needles with braille dots or arrows")
+    parser.add_argument("--animation-time", type=int, default=ANIMATION_TIME,
+                        help="animation time of each sequence in milliseconds")
+    parser.add_argument("--frame-ms", type=int, default=SAMPLE_INTERVAL,
+                        help="time between two frames in milliseconds")
+    options = parser.parse_args(args)
+
+    display = TerminalDisplay(TerminalRenderer(mode=options.mode))
+    clock = TerminalClock(display, options.animation_time, frame_ms=options.frame_ms)
+    clock.start_next_cycle(1000)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        clock.stop()
+        display.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import unittest
+
+from clockclock24_py.utils.angles import (
+    TURN,
+    to_fixed,
+    to_degrees,
+    split_turns,
+    wrap_angle,
+    rotate_fixed,
+    rotate_reverse_fixed,
+    rotate_shortest_fixed
+)
+from clockclock24_py.utils.engine import Sequence, compute_sequences, rotate, rotate_reverse
+
+class TestAngles(unittest.TestCase):
+    """Test cases for the angles module"""
+
+    def test_conversions(self):
+        """Test the conversions between degrees and tenths"""
+        self.assertEqual(to_fixed(22.5), 225)
+        self.assertEqual(to_fixed(-0.1), -1)
+        self.assertEqual(to_degrees(900), 90)
+        self.assertIsInstance(to_degrees(900), int)
+        self.assertEqual(to_degrees(225), 22.5)
+
+    def test_turns(self):
+        """Test splitting angles into turns and positions"""
+        self.assertEqual(split_turns(7250), (2, 50))
+        self.assertEqual(split_turns(-50), (-1, 3550))
+        self.assertEqual(wrap_angle(-90), 270)
+        self.assertEqual(wrap_angle(360 * 10 ** 6 + 22.5), 22.5)
+
+    def test_rotate_fixed(self):
+        """Test the rotations in tenths"""
+        self.assertEqual(rotate_fixed(0, 900, 1800), 4500)
+        self.assertEqual(rotate_fixed(900, 2700, 1800), 2700)
+        self.assertEqual(rotate_reverse_fixed(900, 0, 1800), -3600)
+        self.assertEqual(rotate_fixed(0, 0, 1800) % TURN, 0)
+        self.assertEqual(rotate_shortest_fixed(3500, 100), 3700)
+        self.assertEqual(rotate_shortest_fixed(3500, 100, False), 100)
+
+    def test_exact_rotations(self):
+        """Test that long chains of rotations do not drift"""
+        hours = 0
+        minutes = 0
+        for step in range(1, 2001):
+            hours = rotate(hours, (step * 0.1) % 360)
+            minutes = rotate_reverse(minutes, (step * 0.7) % 360)
+        self.assertEqual(wrap_angle(hours), 200)
+        self.assertEqual(wrap_angle(minutes), 320)
+
+    def test_bounded_sequences(self):
+        """Test that the angles of a cycle do not depend on the turns of the start"""
+        shape = [[[{"hours": 90, "minutes": 270}] * 2 for _ in range(3)] for _ in range(4)]
+        start = [[[{"hours": 360 * 1000 + 45, "minutes": -360 * 1000}] * 2 for _ in range(3)]
+                 for _ in range(4)]
+        wrapped = [[[{"hours": 45, "minutes": 0}] * 2 for _ in range(3)] for _ in range(4)]
+        sequences = [Sequence(shape, animation_time=1000, is_reverse=True)]
+        result = compute_sequences(sequences, start)
+        self.assertEqual(result, compute_sequences(sequences, wrapped))
+        self.assertLess(abs(result[0][0][0][0]["hours"]), 720)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from clockclock24_py.utils.canvas_batch import CanvasBatch
+
+class FakeTk:
+    """A Tcl interpreter stand-in that records evaluated scripts"""
+
+    def __init__(self):
+        self.scripts = []
+
+    def eval(self, script):
+        self.scripts.append(script)
+
+class FakeCanvas:
+    """A canvas stand-in that records direct coords calls"""
+
+    def __init__(self):
+        self.tk = FakeTk()
+        self.coords_calls = []
+
+    def __str__(self):
+        return ".!frame.!canvas"
+
+    def coords(self, item, *coords):
+        self.coords_calls.append((item, coords))
+
+class TestCanvasBatch(unittest.TestCase):
+    """Test cases for the canvas_batch module"""
+
+    def test_flush_sends_one_script(self):
+        """Test that a frame is sent to Tcl in a single call"""
+        canvas = FakeCanvas()
+        batch = CanvasBatch(canvas)
+
+        batch.begin_frame()
+        for item in range(48):
+            batch.coords(item, 10, 20, 30.5, 40.25)
+        batch.flush()
+
+        self.assertEqual(len(canvas.tk.scripts), 1)
+        self.assertEqual(canvas.coords_calls, [])
+
+        lines = canvas.tk.scripts[0].split("\n")
+        self.assertEqual(len(lines), 48)
+        self.assertEqual(lines[0], ".!frame.!canvas coords 0 10.00 20.00 30.50 40.25")
+
+        stats = batch.get_stats()
+        self.assertEqual(stats["frames"], 1)
+        self.assertEqual(stats["round_trips"], 1)
+        self.assertEqual(stats["last_frame_commands"], 48)
+        self.assertGreaterEqual(stats["last_frame_ms"], 0)
+
+    def test_empty_frame(self):
+        """Test that an empty frame does not call Tcl"""
+        canvas = FakeCanvas()
+        batch = CanvasBatch(canvas)
+
+        batch.begin_frame()
+        batch.flush()
+
+        self.assertEqual(canvas.tk.scripts, [])
+        self.assertEqual(batch.get_stats()["round_trips"], 0)
+
+    def test_disabled_batch(self):
+        """Test that a disabled batch calls the canvas for every command"""
+        canvas = FakeCanvas()
+        batch = CanvasBatch(canvas, enabled=False)
+
+        batch.begin_frame()
+        batch.coords(1, 0, 0, 1, 1)
+        batch.coords(2, 0, 0, 2, 2)
+        batch.flush()
+
+        self.assertEqual(canvas.tk.scripts, [])
+        self.assertEqual(canvas.coords_calls, [(1, (0, 0, 1, 1)), (2, (0, 0, 2, 2))])
+        self.assertEqual(batch.get_stats()["last_frame_round_trips"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+from clockclock24_py.constants import numbers, shapes
+from clockclock24_py.utils import timers
+from clockclock24_py.utils.generators import GENERATORS, register_generators
+from clockclock24_py.utils.catalogue import (
+    Catalogue,
+    CatalogueShapes,
+    compile_catalogue,
+    encode_angle,
+    decode_angle,
+    get_builtin_entries,
+    load_json_entries,
+    main,
+    register_catalogue,
+    write_catalogue
+)
+
+class TestCatalogue(unittest.TestCase):
+    """Test cases for the catalogue module"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "shapes.cc24")
+        self.shape_types = dict(shapes.SHAPE_TYPES)
+        
+    def tearDown(self):
+        shapes.SHAPE_TYPES.clear()
+        shapes.SHAPE_TYPES.update(self.shape_types)
+        self.directory.cleanup()
+    
+    def test_angles(self):
+        """Test the conversion of angles to tenths of a degree"""
+        self.assertEqual(encode_angle(360), 3600)
+        self.assertEqual(encode_angle(22.5), 225)
+        self.assertEqual(decode_angle(3600), 360)
+        self.assertIsInstance(decode_angle(3600), int)
+        self.assertEqual(decode_angle(225), 22.5)
+        with self.assertRaises(ValueError):
+            encode_angle(-90)
+    
+    def test_builtin_catalogue(self):
+        """Test that the built-in shapes are read back unchanged"""
+        write_catalogue(self.path, get_builtin_entries())
+        
+        with Catalogue(self.path) as catalogue:
+            self.assertEqual(len(catalogue), 16)
+            self.assertEqual(catalogue.get_shape_types(), ["LINEAR", "SYMMETRICAL", "NUMBERS"])
+            self.assertEqual(catalogue.get_names("SYMMETRICAL"),
+                             ["SQUARES", "SYMMETRICAL_1", "SYMMETRICAL_2"])
+            self.assertIn("WIND", catalogue)
+            self.assertEqual(catalogue.get_size("WIND"), (4, 3, 2))
+            self.assertEqual(catalogue.get_timer("WIND"), shapes.WIND)
+            self.assertEqual(catalogue.get_timer("NUMBER_7"), [numbers.NUMBERS[7]])
+    
+    def test_angle_views(self):
+        """Test that the angles are a view on the file"""
+        write_catalogue(self.path, [("LINE", "CUSTOM", [[[{"hours": 90, "minutes": 270.5}]]])])
+        
+        catalogue = Catalogue(self.path)
+        angles = catalogue.get_angles("LINE")
+        self.assertIsInstance(angles, memoryview)
+        self.assertEqual(angles.format, "H")
+        self.assertEqual(angles.tolist(), [900, 2705])
+        angles.release()
+        catalogue.close()
+    
+    def test_invalid_catalogue(self):
+        """Test the errors of the catalogue format"""
+        with self.assertRaises(ValueError):
+            compile_catalogue([("A", "T", shapes.WIND), ("A", "T", shapes.WIND)])
+        with self.assertRaises(ValueError):
+            compile_catalogue([("A", "T", [[[{"hours": 0, "minutes": 0}], []]])])
+        
+        with open(self.path, "wb") as file:
+            file.write(b"not a catalogue at all")
+        with self.assertRaises(ValueError):
+            Catalogue(self.path)
+    
+    def test_register_catalogue(self):
+        """Test that the shapes of a catalogue are used by get_timers"""
+        custom = [[[{"hours": 10, "minutes": 20}, {"hours": 30, "minutes": 40}]] * 3] * 4
+        write_catalogue(self.path, [("CUSTOM_1", "LINEAR", custom)])
+        catalogue = Catalogue(self.path)
+        
+        self.assertEqual(register_catalogue(catalogue), ["LINEAR"])
+        self.assertIsInstance(shapes.SHAPE_TYPES["LINEAR"], CatalogueShapes)
+        self.assertEqual(timers.get_timers(False), [custom, custom])
+        self.assertEqual(list(shapes.SHAPE_TYPES["LINEAR"]), [custom])
+    
+    def test_generators(self):
+        """Test that registered generators are compiled and keep a catalogue lazy"""
+        register_generators()
+        entries = get_builtin_entries(with_numbers=False)
+        self.assertIn(("WAVE", "LINEAR"), [(name, shape_type) for name, shape_type, _ in entries])
+        write_catalogue(self.path, entries)
+        
+        with Catalogue(self.path) as catalogue:
+            register_catalogue(catalogue, ["LINEAR"])
+            with patch.object(catalogue, "get_timer", wraps=catalogue.get_timer) as get_timer:
+                register_generators()
+                shape_list = shapes.SHAPE_TYPES["LINEAR"]
+                self.assertIsInstance(shape_list, CatalogueShapes)
+                self.assertEqual(shape_list.generators, GENERATORS["LINEAR"])
+                self.assertEqual(len(shape_list), len(catalogue.get_names("LINEAR")) + 2)
+                for timer in timers.get_timers(False, nb_numbers=8, nb_lines=5):
+                    self.assertIn(timers.get_shape_name(timer), ["WAVE", "ROTATION"])
+                self.assertEqual(get_timer.call_count, 0)
+            # The generated shapes of the default grid are stored by name
+            self.assertEqual(catalogue.get_timer("WAVE"), GENERATORS["LINEAR"][0](4, 3))
+
+    def test_main(self):
+        """Test building a catalogue from a JSON file"""
+        json_path = os.path.join(self.directory.name, "shapes.json")
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump({"LINEAR": {"WIND_COPY": shapes.WIND}}, file)
+        
+        self.assertEqual(main(["build", self.path, "--json", json_path]), 0)
+        with Catalogue(self.path) as catalogue:
+            self.assertEqual(catalogue.get_names(), ["WIND_COPY"])
+            self.assertEqual(catalogue.get_timer("WIND_COPY"), shapes.WIND)
+
+    def test_load_json_entries(self):
+        """Test that the shapes of a JSON file must fit the default grid"""
+        json_path = os.path.join(self.directory.name, "shapes.json")
+        for timer in [shapes.WIND[:3], [number[:2] for number in shapes.WIND],
+                      [[line[:1] for line in number] for number in shapes.WIND],
+                      [[[{"hours": 0}] * 2] * 3] * 4, "WIND"]:
+            with self.subTest(timer=timer):
+                with open(json_path, "w", encoding="utf-8") as file:
+                    json.dump({"LINEAR": {"BROKEN": timer}}, file)
+                with self.assertRaises(ValueError):
+                    load_json_entries(json_path)
+                output = io.StringIO()
+                with redirect_stderr(output):
+                    self.assertEqual(main(["build", self.path, "--json", json_path]), 1)
+                self.assertIn("BROKEN", output.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
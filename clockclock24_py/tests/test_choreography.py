@@ -0,0 +1,152 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from clockclock24_py.utils import choreography
+from clockclock24_py.utils.choreography import (
+    get_hash,
+    compile_choreography,
+    get_compiled,
+    get_sequences,
+    get_timeline,
+    run,
+    main
+)
+from clockclock24_py.utils.timers import get_shape, get_time_timer
+from clockclock24_py.utils.utils import get_max_animation_time
+
+CHOREOGRAPHY = {
+    "animation_time": 2000,
+    "steps": [
+        {"shape": "SQUARES", "direction": "reverse", "stagger": "radial", "easing": "start"},
+        {"wait": 500},
+        {"repeat": 2, "steps": [{"shape": "WIND", "stagger": "rtl", "delay": 100},
+                                {"shape": "OBLIQUES", "animation_time": 1000}]},
+        {"time": True, "easing": "end"}
+    ]
+}
+
+class TestChoreography(unittest.TestCase):
+    """Test cases for the choreography module"""
+
+    def test_hash(self):
+        """Test that the hash only depends on the content"""
+        reordered = json.loads(json.dumps(CHOREOGRAPHY, sort_keys=True))
+        self.assertEqual(get_hash(CHOREOGRAPHY), get_hash(reordered))
+        self.assertNotEqual(get_hash(CHOREOGRAPHY), get_hash(CHOREOGRAPHY["steps"]))
+        self.assertEqual(len(get_hash([])), 64)
+
+    def test_compile(self):
+        """Test compiling the steps into sequences"""
+        sequences = compile_choreography(CHOREOGRAPHY)
+        self.assertEqual([seq.type for seq in sequences],
+                         ["shape", "wait", "shape", "shape", "shape", "shape", "time"])
+        first = sequences[0]
+        self.assertIs(first.timer, get_shape("SQUARES"))
+        self.assertTrue(first.is_reverse)
+        self.assertEqual((first.pattern, first.delay, first.animation_time), ("radial", 300, 2000))
+        self.assertEqual(first.animation_type, "start")
+        self.assertTrue(sequences[2].ltr)  # Sequence.ltr is the right to left flag
+        self.assertEqual(sequences[2].delay, 100)
+        self.assertEqual(sequences[3].animation_time, 1000)
+        self.assertEqual(sequences[3].delay, 0)
+        self.assertIsNone(sequences[-1].timer)
+
+    def test_invalid(self):
+        """Test the errors of invalid choreographies"""
+        for steps in [
+            [{"shape": "NOPE"}],
+            [{"shape": "SQUARES", "wait": 10}],
+            [{"shape": "SQUARES", "speed": 2}],
+            [{"shape": "SQUARES", "direction": "up"}],
+            [{"shape": "SQUARES", "stagger": "zigzag"}],
+            [{"shape": "SQUARES", "stagger": 5}],
+            [{"shape": "WIND", "animation_time": "x"}],
+            [{"shape": "WIND", "animation_time": -1}],
+            [{"shape": "WIND", "delay": "a", "stagger": "radial"}],
+            [{"shape": "WIND", "delay": 1.5}],
+            [{"time": True, "delay": False}],
+            [{"wait": "abc"}, {"time": True}],
+            [{"wait": -500}, {"time": True}],
+            [{"wait": True}],
+            {"animation_time": "x", "steps": [{"shape": "WIND"}]},
+            {"delay": -1, "steps": [{"shape": "WIND"}]},
+            [{"shape": "WIND"}],
+            [{"shape": "WIND"}, {"time": False}],
+            [{"time": 1}],
+            [],
+            [{"repeat": -1, "steps": []}],
+            [{"repeat": 0, "steps": []}],
+            [{"repeat": True, "steps": []}],
+            ["SQUARES"],
+        ]:
+            with self.subTest(steps=steps):
+                with self.assertRaises(ValueError):
+                    compile_choreography(steps)
+
+    def test_cache(self):
+        """Test that a choreography is compiled once per content"""
+        steps = [{"shape": "WIND"}, {"time": True}]
+        compiled = get_compiled(steps)
+        self.assertIs(get_compiled(json.loads(json.dumps(steps))), compiled)
+        self.assertIn(get_hash(steps), choreography.cache)
+
+        # The time is set on a copy of the shared sequence
+        sequences = get_sequences(steps)
+        self.assertIs(sequences[0], compiled[0])
+        self.assertEqual(len(sequences[1].timer), 4)
+        self.assertIsNone(compiled[1].timer)
+
+    def test_run_cache(self):
+        """Test that the timer states before the time are computed once per start timer"""
+        start = get_time_timer()
+        timers = run(start, CHOREOGRAPHY)
+        with patch("clockclock24_py.utils.choreography.compute_sequences") as compute:
+            cached = run(json.loads(json.dumps(start)), CHOREOGRAPHY)
+        compute.assert_not_called()
+        self.assertEqual(cached, timers)
+        self.assertIs(cached[0], timers[0])
+        # The time step is computed for every cycle
+        self.assertIsNot(cached[-1], timers[-1])
+
+    def test_run(self):
+        """Test computing the timer states and the timeline of a choreography"""
+        start = get_time_timer()
+        timers = run(start, CHOREOGRAPHY)
+        self.assertEqual(len(timers), 7)
+        self.assertEqual(get_max_animation_time(timers[1]), 500)
+        timeline = get_timeline(start, CHOREOGRAPHY)
+        self.assertEqual(timeline.duration, sum(get_max_animation_time(timer) for timer in timers))
+
+    def test_main(self):
+        """Test describing a choreography file"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cycle.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(CHOREOGRAPHY, file)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                self.assertEqual(main(["show", path]), 0)
+        description = json.loads(output.getvalue())
+        self.assertEqual(description["hash"], get_hash(CHOREOGRAPHY))
+        self.assertEqual(description["shapes"][:2], ["SQUARES", "wait"])
+        self.assertGreater(description["duration_ms"], 0)
+
+    def test_main_invalid(self):
+        """Test that invalid and missing files are reported without a traceback"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cycle.json")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("{\"steps\": [")
+            for name in [path, os.path.join(directory, "missing.json")]:
+                output = io.StringIO()
+                with redirect_stderr(output):
+                    self.assertEqual(main(["show", name]), 1)
+                self.assertIn(name, output.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
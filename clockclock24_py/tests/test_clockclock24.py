@@ -0,0 +1,48 @@
+import unittest
+from types import SimpleNamespace
+
+from benchmarks.soak import StubCanvas, StubRoot
+from clockclock24_py.components.clockclock24 import ClockClock24
+from clockclock24_py.constants.config import RESIZE_DEBOUNCE
+from clockclock24_py.utils.utils import VirtualScheduler, set_scheduler
+
+class TestClockClock24(unittest.TestCase):
+    """Test cases for the ClockClock24 component"""
+
+    def setUp(self):
+        self.scheduler = VirtualScheduler()
+        self.previous = set_scheduler(self.scheduler)
+        self.root = StubRoot()
+        self.clock = ClockClock24(self.root, StubCanvas())
+
+    def tearDown(self):
+        if self.clock.watchdog:
+            self.clock.watchdog.stop()
+        set_scheduler(self.previous)
+
+    def test_debounced_resize(self):
+        """Test that a burst of resize events rescales in place and rebuilds once"""
+        clock = self.clock
+        items = len(clock.canvas.find_all())
+
+        for width, height in [(900, 650), (1000, 700), (1100, 750)]:
+            self.root.width, self.root.height = width, height
+            clock.on_resize(SimpleNamespace(widget=self.root, width=width, height=height))
+            self.scheduler.advance(RESIZE_DEBOUNCE // 2)
+        stats = clock.get_resize_stats()
+        self.assertEqual((stats["scale_count"], stats["rebuild_count"]), (3, 0))
+        self.assertEqual((clock.layout_width, clock.layout_height), (1100, 750))
+
+        # A repeated size is not a resize
+        clock.on_resize(SimpleNamespace(widget=self.root, width=1100, height=750))
+        self.assertEqual(clock.get_resize_stats()["scale_count"], 3)
+
+        self.scheduler.advance(RESIZE_DEBOUNCE)
+        stats = clock.get_resize_stats()
+        self.assertEqual((stats["scale_count"], stats["rebuild_count"]), (3, 1))
+        self.assertEqual(clock.clock_size, clock.get_clock_size())
+        self.assertEqual(len(clock.canvas.find_all()), items)
+        self.assertIsNone(clock.resize_job)
+
+if __name__ == "__main__":
+    unittest.main()
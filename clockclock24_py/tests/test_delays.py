@@ -0,0 +1,94 @@
+import unittest
+
+from clockclock24_py.utils.delays import (
+    PATTERNS,
+    check_patterns,
+    get_delay_field,
+    parse_pattern,
+    register_pattern
+)
+from clockclock24_py.utils.engine import compute_delays
+
+class TestDelays(unittest.TestCase):
+    """Test cases for the delays module"""
+    
+    def get_timer(self, nb_numbers, nb_lines):
+        return [
+            [[{"hours": 0, "minutes": 0}, {"hours": 90, "minutes": 90}] for _ in range(nb_lines)]
+            for _ in range(nb_numbers)
+        ]
+    
+    def test_legacy_patterns(self):
+        """Test that ltr and rtl match the legacy stagger on the default grid"""
+        timer = self.get_timer(4, 3)
+        for pattern, rtl in [("ltr", False), ("rtl", True)]:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(
+                    compute_delays(timer, 11000, 300, rtl, pattern),
+                    compute_delays(timer, 11000, 300, rtl)
+                )
+    
+    def test_patterns(self):
+        """Test that every pattern ends all the clocks together"""
+        for pattern in PATTERNS:
+            with self.subTest(pattern=pattern):
+                field = get_delay_field(pattern, 8, 5, 1000, 100)
+                self.assertEqual(len(field), 8 * 5 * 2)
+                self.assertEqual({delay + time for delay, time in field}, {1800})
+                self.assertTrue(all(0 <= delay <= 1600 for delay, _ in field))
+    
+    def test_parse_pattern(self):
+        """Test the pattern settings and their errors"""
+        self.assertEqual(parse_pattern("radial"), ("radial", 0))
+        self.assertEqual(parse_pattern("random-wave:7"), ("random-wave", 7))
+        self.assertEqual(check_patterns(("ltr", "radial:2")), ["ltr", "radial:2"])
+        for pattern in ["nope", "radial:x", "zigzag:1"]:
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(ValueError):
+                    check_patterns(["ltr", pattern])
+    
+    def test_directions(self):
+        """Test the order of the directional patterns"""
+        # Clocks in the order of the timer: number, line, clock
+        ttb = [delay for delay, _ in get_delay_field("ttb", 1, 3, 1000, 100)]
+        self.assertEqual(ttb, [0, 0, 50, 50, 100, 100])
+        
+        radial = [delay for delay, _ in get_delay_field("radial", 1, 3, 1000, 100)]
+        self.assertEqual(radial, [100, 100, 45, 45, 100, 100])
+        inward = [delay for delay, _ in get_delay_field("inward", 1, 3, 1000, 100)]
+        self.assertEqual(inward, [0, 0, 55, 55, 0, 0])
+    
+    def test_random_wave(self):
+        """Test that the random wave only depends on its seed"""
+        first = get_delay_field("random-wave", 4, 3, 1000, 100, 1)
+        
+        get_delay_field.cache_clear()
+        self.assertEqual(get_delay_field("random-wave", 4, 3, 1000, 100, 1), first)
+        self.assertNotEqual(get_delay_field("random-wave", 4, 3, 1000, 100, 2), first)
+        
+        timer = compute_delays(self.get_timer(4, 3), 1000, 100, pattern="random-wave:1")
+        self.assertEqual(timer[0][0][1]["animation_delay"], first[1][0])
+    
+    def test_cache(self):
+        """Test that a field is computed once per grid size"""
+        get_delay_field.cache_clear()
+        get_delay_field("diagonal", 4, 3, 1000, 100)
+        get_delay_field("diagonal", 4, 3, 1000, 100)
+        get_delay_field("diagonal", 16, 3, 1000, 100)
+        
+        info = get_delay_field.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+    
+    def test_register_pattern(self):
+        """Test adding a pattern"""
+        @register_pattern("columns")
+        def columns(x, y, width, height, seed):
+            return x % 2
+        try:
+            field = get_delay_field("columns", 1, 1, 1000, 100)
+            self.assertEqual(field, ((0, 1100), (100, 1000)))
+        finally:
+            del PATTERNS["columns"]
+
+if __name__ == "__main__":
+    unittest.main()
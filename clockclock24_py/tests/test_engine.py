@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from clockclock24_py.utils.engine import (
     is_neg,
     round_rest,
@@ -17,7 +18,14 @@ from clockclock24_py.utils.engine import (
     Sequence,
     compute_timer,
     compute_sequences,
-    get_wait_sequence
+    get_wait_sequence,
+    get_sequences,
+    describe_sequences,
+    rotate_shortest,
+    rotate_minimal,
+    get_travel,
+    get_cycle_travel,
+    compute_minimal_rotation
 )
 
 class TestEngine(unittest.TestCase):
@@ -417,6 +425,102 @@ class TestEngine(unittest.TestCase):
         self.assertEqual(sequence.timer, timer)
         self.assertEqual(sequence.type, "wait")
         self.assertEqual(sequence.animation_time, 3000)
+    
+    @patch('clockclock24_py.utils.engine.get_random_boolean', return_value=True)
+    def test_get_sequences(self, _):
+        """Test the get_sequences and describe_sequences functions"""
+        sequences = get_sequences({"animation_time": 1000})
+        
+        # Two shapes with a wait after the first one, then the time
+        self.assertEqual([seq.type for seq in sequences], ["shape", "wait", "shape", "time"])
+        self.assertEqual([seq.animation_type for seq in sequences], ["start", None, "start", "end"])
+        self.assertTrue(all(seq.is_reverse for seq in sequences if seq.type != "wait"))
+        
+        description = describe_sequences(sequences)
+        self.assertEqual(len(description["shapes"]), 4)
+        self.assertIn(description["shapes"][0], ["SQUARES", "SYMMETRICAL_1", "SYMMETRICAL_2"])
+        self.assertEqual(description["shapes"][1:], ["wait", description["shapes"][0], "time"])
+        self.assertTrue(description["is_reverse"])
+        self.assertEqual(description["delays"], [300, 0, 0, 0])
+        self.assertEqual(description["patterns"], [None, None, None, None])
+    
+    @patch('clockclock24_py.utils.engine.get_random_boolean', return_value=True)
+    def test_get_sequences_patterns(self, _):
+        """Test picking a delay pattern for the staggered sequence"""
+        sequences = get_sequences({"animation_time": 1000, "delay_patterns": ["radial"]})
+        
+        self.assertEqual([seq.pattern for seq in sequences], ["radial", None, None, None])
+        timers = compute_sequences(sequences, sequences[-1].timer)
+        delays = {clock["animation_delay"] for number in timers[0] for line in number for clock in line}
+        self.assertGreater(len(delays), 2)
+
+    def test_rotate_shortest(self):
+        """Test the rotation without full turns in each direction"""
+        self.assertEqual(rotate_shortest(350, 10), 370)
+        self.assertEqual(rotate_shortest(10, 350, False), -10)
+        self.assertEqual(rotate_shortest(720, 90, False), 450)
+        self.assertEqual(rotate_shortest(90, 90), 90)
+        self.assertEqual(rotate_shortest(90, 90, False), 90)
+    
+    def test_rotate_minimal(self):
+        """Test the rotation of a needle the shortest way"""
+        self.assertEqual(rotate_minimal(0, 90), 90)
+        self.assertEqual(rotate_minimal(0, 270), -90)
+        self.assertEqual(rotate_minimal(0, 180), 180)
+        self.assertEqual(rotate_minimal(0, 270, True), 270)
+        self.assertEqual(rotate_minimal(350, 10), 370)
+    
+    def test_compute_minimal_rotation(self):
+        """Test that the minimal rotation keeps the direction rules and travels less"""
+        current = [[[{"hours": 0, "minutes": 0}, {"hours": 90, "minutes": 180}]]]
+        target = [[[{"hours": 270, "minutes": 270}, {"hours": 45, "minutes": 90}]]]
+        
+        # Each needle turns the shortest way on its own
+        result = compute_minimal_rotation(target, current)
+        self.assertEqual(get_travel(result, current), [90, 90, 45, 90])
+        self.assertEqual(result[0][0][0]["hours"], -90)
+        
+        # Reversed minutes: the hours turn clockwise and the minutes counter-clockwise
+        result = compute_minimal_rotation(target, current, True)
+        self.assertEqual(get_travel(result, current), [270, 90, 315, 90])
+        
+        legacy = compute_rotation(target, current, True)
+        self.assertLess(sum(get_travel(result, current)), sum(get_travel(legacy, current)))
+        for clock, expected in zip(result[0][0], target[0][0]):
+            self.assertEqual(clock["hours"] % 360, expected["hours"])
+            self.assertEqual(clock["minutes"] % 360, expected["minutes"])
+        
+        with self.assertRaises(ValueError):
+            compute_minimal_rotation(target, current, objective="fast")
+    
+    def test_compute_minimal_rotation_directions(self):
+        """Test that the needles of one shape turn in opposite directions"""
+        current = [[[{"hours": 0, "minutes": 0}, {"hours": 0, "minutes": 0}]]]
+        target = [[[{"hours": 90, "minutes": 100}, {"hours": 270, "minutes": 300}]]]
+        
+        for objective in ["travel", "peak"]:
+            result = compute_minimal_rotation(target, current, objective=objective)
+            self.assertEqual(result[0][0][0]["hours"], 90)
+            self.assertEqual(result[0][0][1]["hours"], -90)
+            self.assertEqual(result[0][0][0]["minutes"], 100)
+            self.assertEqual(result[0][0][1]["minutes"], -60)
+            self.assertEqual(get_travel(result, current), [90, 100, 90, 60])
+    
+    @patch('clockclock24_py.utils.engine.get_random_boolean', return_value=True)
+    def test_get_sequences_rotation(self, _):
+        """Test that the rotation mode reduces the travel of a cycle"""
+        start = get_sequences({})[-1].timer
+        sequences = get_sequences({"animation_time": 1000})
+        for seq in sequences:
+            seq.rotation = "travel"
+        minimal = get_cycle_travel(compute_sequences(sequences, start), start)
+        for seq in sequences:
+            seq.rotation = None
+        legacy = get_cycle_travel(compute_sequences(sequences, start), start)
+        self.assertLess(minimal, legacy)
+        
+        sequences = get_sequences({"animation_time": 1000, "rotation": "peak"})
+        self.assertEqual({seq.rotation for seq in sequences if seq.type != "wait"}, {"peak"})
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from clockclock24_py.utils.events import EventLog
+
+class TestEvents(unittest.TestCase):
+    """Test cases for the events module"""
+    
+    def test_record(self):
+        """Test recording events in the ring buffer"""
+        log = EventLog(size=3)
+        for cycle in range(5):
+            log.record("plan", cycle=cycle)
+        log.record("cancel", cycle=5, reason="next cycle")
+        
+        events = log.get_events()
+        self.assertEqual(len(events), 3)
+        self.assertEqual([event["cycle"] for event in events], [3, 4, 5])
+        self.assertEqual(log.get_dropped(), 3)
+        self.assertEqual(log.get_events("cancel")[0]["reason"], "next cycle")
+        self.assertIn("time", events[0])
+    
+    def test_write(self):
+        """Test writing the events as JSON Lines"""
+        log = EventLog()
+        log.record("plan", cycle=1, shapes=["WIND", "time"], is_reverse=False)
+        log.record("animation_end", cycle=1)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.jsonl")
+            log.write(path)
+            with open(path, encoding="utf-8") as file:
+                lines = [json.loads(line) for line in file]
+        
+        self.assertEqual([line["type"] for line in lines], ["plan", "animation_end"])
+        self.assertEqual(lines[0]["shapes"], ["WIND", "time"])
+    
+    def test_dump(self):
+        """Test dumping the events in the background"""
+        log = EventLog()
+        log.record("plan", cycle=1)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = log.dump(os.path.join(directory, "events.jsonl"))
+            log.record("plan", cycle=2)
+            
+            # Only the events recorded before the dump are written
+            for _ in range(100):
+                if os.path.exists(path) and os.path.getsize(path):
+                    break
+                time.sleep(0.01)
+            time.sleep(0.05)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(len(file.readlines()), 1)
+
+if __name__ == "__main__":
+    unittest.main()
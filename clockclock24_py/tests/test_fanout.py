@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import patch
+
+from clockclock24_py.utils import planning
+from clockclock24_py.utils.fanout import DisplayCore, SamplingRenderer
+from clockclock24_py.utils.utils import VirtualScheduler, set_scheduler
+
+class TestFanout(unittest.TestCase):
+    """Test cases for the fanout module"""
+
+    def setUp(self):
+        self.scheduler = VirtualScheduler()
+        self.previous = set_scheduler(self.scheduler)
+
+    def tearDown(self):
+        set_scheduler(self.previous)
+
+    def test_shared_plan(self):
+        """Test that a cycle is planned once for all the renderers"""
+        core = DisplayCore(animation_time=1000)
+        frames = [[], [], []]
+        renderers = [
+            core.add_renderer(SamplingRenderer(frames[index].append, frame_ms=frame_ms))
+            for index, frame_ms in enumerate([40, 40, 100])
+        ]
+        # Each renderer shows the rest timer when added, on its own schedule
+        self.assertEqual(frames, [[], [], []])
+        self.scheduler.advance(0)
+        self.assertEqual([len(renderer_frames) for renderer_frames in frames], [1, 1, 1])
+
+        with patch.object(planning, "compute_sequences", wraps=planning.compute_sequences) as compute:
+            core.start(0)
+            self.scheduler.run_next()
+            self.assertTrue(core.is_running)
+            self.assertEqual(compute.call_count, 1)
+            self.scheduler.advance(core.timeline.duration)
+            self.assertEqual(compute.call_count, 1)
+
+        self.assertFalse(core.is_running)
+        self.assertEqual(core.cycle_count, 1)
+        self.assertEqual(renderers[0].frame_count, renderers[1].frame_count)
+        self.assertGreater(renderers[0].frame_count, renderers[2].frame_count * 2)
+
+        # Every renderer ends on the same rest timer
+        self.assertEqual(frames[0][-1], core.timer)
+        self.assertEqual(frames[1][-1], frames[0][-1])
+        self.assertEqual(frames[2][-1], frames[0][-1])
+        core.stop()
+        self.assertEqual(self.scheduler.get_pending(), 0)
+
+    def test_join_mid_cycle(self):
+        """Test that a renderer added during a cycle starts from the current angles"""
+        core = DisplayCore(animation_time=1000)
+        core.start(0)
+        self.scheduler.run_next()
+        self.scheduler.advance(700)
+
+        frames = []
+        renderer = core.add_renderer(SamplingRenderer(frames.append))
+        self.assertTrue(renderer.is_sampling)
+        self.scheduler.advance(0)
+        self.assertEqual(frames[0], core.timeline.state_at(700))
+
+        core.remove_renderer(renderer)
+        self.assertEqual(core.renderers, [])
+        self.scheduler.advance(100)
+        self.assertFalse(renderer.is_sampling)
+        core.stop()
+
+    def test_interrupt(self):
+        """Test retargeting the cycle of a core from the current needle angles"""
+        core = DisplayCore(animation_time=1000)
+        frames = []
+        renderer = core.add_renderer(
+            SamplingRenderer(lambda timer: frames.append((self.scheduler.now, timer)))
+        )
+        core.start(0)
+        self.scheduler.run_next()
+        self.scheduler.advance(700)
+        first_timeout = core.cycle_timeout
+        expected = core.timeline.state_at(700)
+
+        # Without interrupt, a trigger during a cycle is skipped
+        core.start_cycle()
+        self.assertEqual(core.cycle_count, 1)
+
+        core.start_cycle(interrupt=True)
+        self.assertTrue(first_timeout.is_cancelled)
+        self.assertTrue(core.is_running)
+        self.assertEqual(core.cycle_count, 2)
+        for number, expected_number in zip(core.timeline.start_timer, expected):
+            for line, expected_line in zip(number, expected_number):
+                for clock, expected_clock in zip(line, expected_line):
+                    for needle in ("hours", "minutes"):
+                        # Angles are planned in tenths of a degree, without whole turns
+                        difference = (clock[needle] - expected_clock[needle]) % 360
+                        self.assertLessEqual(min(difference, 360 - difference), 0.05)
+
+        # The renderer samples the new timeline from its next frame
+        self.scheduler.advance(renderer.frame_ms)
+        frame_time, timer = frames[-1]
+        self.assertGreaterEqual(frame_time, core.cycle_start)
+        self.assertEqual(timer, core.timeline.state_at(frame_time - core.cycle_start))
+        core.stop()
+
+if __name__ == "__main__":
+    unittest.main()
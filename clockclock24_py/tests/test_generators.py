@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch
+
+from clockclock24_py.constants import shapes
+from clockclock24_py.utils import timers
+from clockclock24_py.utils.generators import (
+    GENERATORS,
+    ShapeGenerator,
+    burst,
+    get_direction,
+    get_grid,
+    normalize_angle,
+    register_generators,
+    rotation,
+    spiral,
+    wave
+)
+from clockclock24_py.utils.layout import get_grid_size
+
+class TestGenerators(unittest.TestCase):
+    """Test cases for the generators module"""
+    
+    def setUp(self):
+        self.shape_types = dict(shapes.SHAPE_TYPES)
+        
+    def tearDown(self):
+        shapes.SHAPE_TYPES.clear()
+        shapes.SHAPE_TYPES.update(self.shape_types)
+    
+    def test_angles(self):
+        """Test the angle helpers"""
+        self.assertEqual(normalize_angle(0), 360)
+        self.assertEqual(normalize_angle(-90), 270)
+        self.assertEqual(normalize_angle(450.4), 90)
+        self.assertEqual(normalize_angle(get_direction(1, 0)), 90)
+        self.assertEqual(normalize_angle(get_direction(0, 1)), 180)
+        self.assertEqual(normalize_angle(get_direction(0, -1)), 360)
+    
+    def test_get_grid(self):
+        """Test the coordinates of the clocks, in the order of the timer"""
+        xs, ys = get_grid(2, 3)
+        
+        self.assertEqual(xs, (0, 1, 0, 1, 0, 1, 2, 3, 2, 3, 2, 3))
+        self.assertEqual(ys, (0, 0, 1, 1, 2, 2, 0, 0, 1, 1, 2, 2))
+    
+    def test_generator(self):
+        """Test generating shapes at several grid sizes"""
+        generator = ShapeGenerator("BURST", burst)
+        
+        timer = generator()
+        self.assertEqual(get_grid_size(timer), (4, 3))
+        self.assertIs(generator(), timer)
+        self.assertTrue(generator.is_generated(timer))
+        
+        # The needles of the corners point away from the center
+        self.assertEqual(timer[0][0][0]["hours"], 286)
+        self.assertEqual(timer[0][1][0], {"hours": 270, "minutes": 270})
+        self.assertEqual(timer[3][1][1], {"hours": 90, "minutes": 90})
+        
+        large = generator(16, 9)
+        self.assertEqual(get_grid_size(large), (16, 9))
+        self.assertEqual(len(large[0][0]), 2)
+        self.assertFalse(generator.is_generated(shapes.WIND))
+    
+    def test_functions(self):
+        """Test that each function gives an angle per clock"""
+        xs, ys = get_grid(8, 5)
+        for function in [wave, spiral, burst, rotation]:
+            with self.subTest(function=function.__name__):
+                hours, minutes = function(xs, ys, 16, 5)
+                self.assertEqual(len(hours), len(xs))
+                self.assertEqual(len(minutes), len(xs))
+        
+        hours, minutes = rotation(xs, ys, 16, 5, step=10)
+        self.assertEqual(hours[:3], [0, 10, 10])
+        self.assertEqual(minutes[:3], [180, 190, 190])
+    
+    def test_register_generators(self):
+        """Test that get_timers uses the generators at any grid size"""
+        with self.assertRaises(ValueError):
+            timers.get_timers(False, nb_numbers=8, nb_lines=5)
+        
+        register_generators()
+        register_generators()
+        self.assertEqual(len(shapes.SHAPE_TYPES["LINEAR"]), len(shapes.LINEAR) + 2)
+        self.assertEqual(len(shapes.LINEAR), 3)
+        
+        for is_same, shape_type in [(False, "LINEAR"), (True, "SYMMETRICAL")]:
+            names = [generator.name for generator in GENERATORS[shape_type]]
+            for timer in timers.get_timers(is_same, nb_numbers=8, nb_lines=5):
+                self.assertEqual(get_grid_size(timer), (8, 5))
+                self.assertIn(timers.get_shape_name(timer), names)
+        
+        # Generators also fit the default grid
+        with patch("clockclock24_py.utils.timers.random.randint", return_value=3):
+            timer = timers.get_random_shaped_timer("LINEAR")
+        self.assertEqual(timers.get_shape_name(timer), "WAVE")
+
+if __name__ == "__main__":
+    unittest.main()
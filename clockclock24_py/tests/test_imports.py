@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+# Cold import time allowed for the entry points of headless consumers, in milliseconds
+IMPORT_BUDGET_MS = 150
+
+HEADLESS_MODULES = [
+    "clockclock24_py.utils.engine",
+    "clockclock24_py.renderers.raster",
+    "clockclock24_py.renderers.svg",
+    "clockclock24_py.renderers.terminal",
+    "clockclock24_py.components.clockclock24",
+]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def get_import_times(module: str) -> Dict[str, int]:
+    """Import a module in a new interpreter and get the cumulative time of each import in µs"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, cwd=ROOT,
+        universal_newlines=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+@unittest.skipIf(sys.version_info < (3, 7), "-X importtime needs Python 3.7")
+class TestImports(unittest.TestCase):
+    """Test cases for the import cost of the headless entry points"""
+    
+    def test_no_tkinter(self):
+        """Test that headless consumers never import tkinter nor the shape tables"""
+        for module in HEADLESS_MODULES:
+            with self.subTest(module=module):
+                times = get_import_times(module)
+                self.assertIn(module, times)
+                self.assertNotIn("tkinter", times)
+                self.assertNotIn("_tkinter", times)
+                self.assertNotIn("clockclock24_py.constants.shapes", times)
+    
+    def test_import_budget(self):
+        """Test the cold import time of the command line and export entry points"""
+        for module in ["clockclock24_py.renderers.terminal", "clockclock24_py.renderers.svg"]:
+            with self.subTest(module=module):
+                # Keep the best of a few runs to ignore a busy machine
+                best = min(get_import_times(module)[module] for _ in range(3))
+                self.assertLess(best / 1000, IMPORT_BUDGET_MS)
+
+if __name__ == "__main__":
+    unittest.main()
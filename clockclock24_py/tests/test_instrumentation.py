@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from clockclock24_py.utils import instrumentation
+from clockclock24_py.utils.instrumentation import Histogram, FrameRecorder
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for the instrumentation module"""
+    
+    def tearDown(self):
+        instrumentation.disable()
+    
+    def test_histogram(self):
+        """Test the Histogram class"""
+        histogram = Histogram([1, 10, float("inf")])
+        for value in [0.5, 0.5, 5, 20]:
+            histogram.add(value)
+        
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.max, 20)
+        self.assertEqual(histogram.quantile(0.5), 1)
+        self.assertEqual(histogram.quantile(0.75), 10)
+        self.assertEqual(histogram.quantile(1), 20)
+        
+        summary = histogram.get_summary()
+        self.assertEqual(summary["mean_ms"], 6.5)
+        self.assertEqual(summary["buckets"], {"1": 2, "10": 1, "+Inf": 1})
+    
+    def test_empty_histogram(self):
+        """Test the summary of an empty histogram"""
+        summary = Histogram().get_summary()
+        
+        self.assertEqual(summary["count"], 0)
+        self.assertEqual(summary["mean_ms"], 0.0)
+        self.assertEqual(summary["p99_ms"], 0.0)
+    
+    def test_frame_recorder(self):
+        """Test the FrameRecorder class"""
+        recorder = FrameRecorder(deadline_ms=5)
+        
+        start = recorder.begin_frame()
+        recorder.end_frame(start)
+        start = recorder.begin_frame()
+        time.sleep(0.01)
+        recorder.end_frame(start)
+        recorder.add("clock_update", time.perf_counter())
+        
+        summary = recorder.get_summary()
+        self.assertEqual(summary["frame"]["count"], 2)
+        self.assertEqual(summary["gap"]["count"], 1)
+        self.assertEqual(summary["clock_update"]["count"], 1)
+        self.assertEqual(summary["deadline_misses"], 1)
+        self.assertIn("deadline misses: 1", recorder.format_summary())
+    
+    def test_write_summary(self):
+        """Test writing the summary to a file"""
+        recorder = FrameRecorder()
+        recorder.end_frame(recorder.begin_frame())
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.json")
+            recorder.write_summary(path, {"canvas": {"frames": 1}})
+            with open(path, encoding="utf-8") as file:
+                summary = json.load(file)
+        
+        self.assertEqual(summary["frame"]["count"], 1)
+        self.assertEqual(summary["canvas"], {"frames": 1})
+    
+    def test_enable_disable(self):
+        """Test enabling and disabling the active recorder"""
+        self.assertIsNone(instrumentation.recorder)
+        
+        recorder = instrumentation.enable(20)
+        self.assertIs(instrumentation.recorder, recorder)
+        self.assertEqual(recorder.deadline_ms, 20)
+        
+        instrumentation.disable()
+        self.assertIsNone(instrumentation.recorder)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from clockclock24_py.constants.config import CLOCK_MAX_SIZE, CLOCK_PADDING
+from clockclock24_py.utils.layout import (
+    get_nb_colons,
+    get_clock_size,
+    get_number_positions,
+    get_colon_dots,
+    get_clock_center,
+    iter_clocks,
+    get_grid_size,
+    get_nb_clocks
+)
+from clockclock24_py.constants.numbers import NUMBERS
+
+class TestLayout(unittest.TestCase):
+    """Test cases for the layout module"""
+    
+    def test_get_nb_colons(self):
+        """Test the get_nb_colons function"""
+        self.assertEqual(get_nb_colons(1), 0)
+        self.assertEqual(get_nb_colons(2), 0)
+        self.assertEqual(get_nb_colons(4), 1)
+        self.assertEqual(get_nb_colons(8), 3)
+    
+    def test_get_clock_size(self):
+        """Test the get_clock_size function"""
+        # Large windows are capped by the maximum size
+        self.assertEqual(get_clock_size(5000, 5000), CLOCK_MAX_SIZE)
+        
+        # Small windows are limited by the minimum size
+        self.assertEqual(get_clock_size(100, 100), 30)
+        self.assertEqual(get_clock_size(100, 100, min_size=1), 1)
+        
+        # 800 - 60 padding - 21 spacing - 12 colon = 707 / 8 clocks
+        self.assertAlmostEqual(get_clock_size(800, 2000), 707 / 8)
+    
+    def test_get_number_positions(self):
+        """Test the get_number_positions function"""
+        positions = get_number_positions(1000, 500, 100)
+        number_width = 2 * (100 + CLOCK_PADDING)
+        
+        self.assertEqual(len(positions), 4)
+        
+        # The display is centered horizontally and vertically
+        total_width = 4 * number_width + 100
+        self.assertAlmostEqual(positions[0][0], (1000 - total_width) / 2)
+        self.assertAlmostEqual(positions[0][1], (500 - 3 * (100 + CLOCK_PADDING)) / 2)
+        
+        # The colon space separates hours and minutes
+        self.assertAlmostEqual(positions[1][0] - positions[0][0], number_width)
+        self.assertAlmostEqual(positions[2][0] - positions[1][0], number_width + 100)
+    
+    def test_get_colon_dots(self):
+        """Test the get_colon_dots function"""
+        dots = get_colon_dots(1000, 500, 100)
+        
+        self.assertEqual(len(dots), 2)
+        self.assertEqual(dots[0][0], dots[1][0])
+        self.assertLess(dots[0][1], dots[1][1])
+        self.assertEqual(dots[0][2], 100 / 8)
+        self.assertEqual(get_colon_dots(1000, 500, 100, nb_numbers=2), [])
+    
+    def test_iter_clocks(self):
+        """Test the iter_clocks function"""
+        timer = [NUMBERS[0], NUMBERS[1]]
+        positions = [(0, 0), (300, 0)]
+        clocks = list(iter_clocks(timer, positions, 100))
+        
+        self.assertEqual(len(clocks), 12)
+        self.assertEqual(clocks[0][:2], get_clock_center(0, 0, 0, 0, 100))
+        self.assertEqual(clocks[0][:2], (50, 50))
+        self.assertEqual(clocks[1][:2], (150 + CLOCK_PADDING, 50))
+        self.assertIs(clocks[6][2], NUMBERS[1][0][0])
+    
+    def test_grid_size(self):
+        """Test the get_grid_size and get_nb_clocks functions"""
+        timer = [NUMBERS[0]] * 4
+        
+        self.assertEqual(get_grid_size(timer), (4, 3))
+        self.assertEqual(get_grid_size([]), (0, 0))
+        self.assertEqual(get_nb_clocks(timer), 24)
+
+if __name__ == "__main__":
+    unittest.main()
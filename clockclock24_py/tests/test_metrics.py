@@ -0,0 +1,108 @@
+import math
+import os
+import tempfile
+import unittest
+import urllib.request
+
+from clockclock24_py.utils import metrics
+from clockclock24_py.utils.metrics import (
+    Registry,
+    ClockMetrics,
+    format_value
+)
+from clockclock24_py.utils.metrics_server import MetricsServer
+from clockclock24_py.utils.utils import Timeout, get_pending_timeouts
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the metrics module"""
+    
+    def tearDown(self):
+        metrics.disable()
+    
+    def test_format_value(self):
+        """Test the format of the sample values"""
+        self.assertEqual(format_value(3), "3")
+        self.assertEqual(format_value(2.0), "2")
+        self.assertEqual(format_value(0.25), "0.25")
+        self.assertEqual(format_value(float("inf")), "+Inf")
+        self.assertEqual(format_value(float("nan")), "NaN")
+    
+    def test_collect(self):
+        """Test the Prometheus text format"""
+        registry = Registry()
+        counter = registry.counter("test_total", "A counter")
+        gauge = registry.gauge("test_gauge", "A gauge")
+        summary = registry.summary("test_seconds", "A summary")
+        registry.gauge("test_function", "A gauge read when collected", lambda: 7)
+        
+        counter.inc()
+        counter.inc(2)
+        gauge.set(5)
+        for value in range(1, 101):
+            summary.observe(value / 100)
+        
+        lines = registry.collect().splitlines()
+        self.assertIn("# HELP test_total A counter", lines)
+        self.assertIn("# TYPE test_total counter", lines)
+        self.assertIn("test_total 3", lines)
+        self.assertIn("test_gauge 5", lines)
+        self.assertIn("test_function 7", lines)
+        self.assertIn("# TYPE test_seconds summary", lines)
+        self.assertIn('test_seconds{quantile="0.5"} 0.51', lines)
+        self.assertIn('test_seconds{quantile="0.99"} 1', lines)
+        self.assertIn("test_seconds_sum 50.5", lines)
+        self.assertIn("test_seconds_count 100", lines)
+        
+        with self.assertRaises(ValueError):
+            registry.counter("test_total", "A duplicate")
+    
+    def test_summary_window(self):
+        """Test that the quantiles only use the latest values"""
+        summary = metrics.Summary("test", "A summary", window_size=2)
+        self.assertTrue(math.isnan(summary.get_quantiles([0.5])[0]))
+        
+        for value in [100, 1, 2]:
+            summary.observe(value)
+        self.assertEqual(summary.get_quantiles([0, 1]), [1, 2])
+        self.assertEqual(summary.count, 3)
+        self.assertEqual(summary.total, 103)
+    
+    def test_pending_timeouts(self):
+        """Test counting the pending timeouts"""
+        registry = ClockMetrics()
+        pending = get_pending_timeouts()
+        
+        timeout = Timeout(60000).start()
+        self.assertEqual(registry.pending_timeouts.get_samples()[0][2], pending + 1)
+        timeout.cancel()
+        timeout.cancel()
+        self.assertEqual(get_pending_timeouts(), pending)
+    
+    def test_write_textfile(self):
+        """Test writing the metrics for a textfile collector"""
+        registry = metrics.enable()
+        registry.cycles.inc()
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "clockclock24.prom")
+            registry.write_textfile(path)
+            
+            self.assertEqual(os.listdir(directory), ["clockclock24.prom"])
+            with open(path, encoding="utf-8") as file:
+                self.assertIn("clockclock24_cycles_total 1\n", file.read())
+    
+    def test_server(self):
+        """Test scraping the local HTTP listener"""
+        registry = metrics.enable()
+        registry.frames.inc()
+        server = MetricsServer(registry).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], metrics.CONTENT_TYPE)
+                self.assertIn("clockclock24_frames_total 1", response.read().decode("utf-8"))
+        finally:
+            server.stop()
+
+if __name__ == "__main__":
+    unittest.main()
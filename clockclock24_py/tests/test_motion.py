@@ -0,0 +1,75 @@
+import math
+import unittest
+
+from clockclock24_py.utils.motion import (
+    MotionLimits,
+    get_min_duration,
+    fit_profile,
+    apply_motion_limits
+)
+from clockclock24_py.utils.engine import run
+
+class TestMotion(unittest.TestCase):
+    """Test cases for the motion planner"""
+
+    def get_timer(self, angle, animation_time=1000):
+        return [
+            [[{"hours": angle, "minutes": angle, "animation_time": animation_time,
+               "animation_delay": 0}] * 2 for _ in range(3)]
+            for _ in range(4)
+        ]
+
+    def test_trapezoid(self):
+        """Test the durations of trapezoidal and triangular profiles"""
+        limits = MotionLimits(360, 720)
+        self.assertAlmostEqual(get_min_duration(360, limits), 1500)
+        self.assertAlmostEqual(get_min_duration(-90, limits), 2000 * math.sqrt(90 / 720))
+        self.assertEqual(get_min_duration(0, limits), 0)
+
+    def test_s_curve(self):
+        """Test that an S-curve is slower than a trapezoid and close with a high jerk"""
+        trapezoid = get_min_duration(360, MotionLimits(360, 720))
+        self.assertGreater(get_min_duration(360, MotionLimits(360, 720, 1440)), trapezoid)
+        self.assertAlmostEqual(get_min_duration(360, MotionLimits(360, 720, 1e9)), trapezoid, 1)
+
+    def test_fit_profile(self):
+        """Test that a profile covers its distance at rest in the requested duration"""
+        for limits in [MotionLimits(360, 720), MotionLimits(360, 720, 2000)]:
+            with self.subTest(jerk=limits.max_jerk):
+                profile = fit_profile(270, 3000, limits)
+                self.assertAlmostEqual(profile.duration, 3, 3)
+                self.assertLessEqual(profile.peak_velocity, limits.max_velocity)
+                position, velocity = profile.get_state(profile.duration)
+                self.assertAlmostEqual(position, 270, 3)
+                self.assertAlmostEqual(velocity, 0, 3)
+                self.assertAlmostEqual(profile.position(0), 0)
+
+    def test_apply_motion_limits(self):
+        """Test that only the infeasible timer states are stretched"""
+        start = self.get_timer(360)
+        timers = [self.get_timer(720, 1000), self.get_timer(730, 1000)]
+        result, report = apply_motion_limits(timers, start, MotionLimits(360, 720))
+        self.assertEqual(report[0], {"min_duration_ms": 1500, "extension_ms": 500})
+        self.assertEqual(result[0][0][0][0]["animation_time"], 1500)
+        self.assertEqual(report[1]["extension_ms"], 0)
+        self.assertEqual(result[1][0][0][0]["animation_time"], 1000)
+        self.assertEqual(timers[0][0][0][0]["animation_time"], 1000)
+
+    def test_run_with_limits(self):
+        """Test that every needle of a cycle can follow its motion"""
+        limits = MotionLimits(90, 180)
+        start = self.get_timer(90)
+        previous = start
+        for timer in run(start, {"animation_time": 1000, "motion_limits": limits}):
+            for number, previous_number in zip(timer, previous):
+                for line, previous_line in zip(number, previous_number):
+                    for clock, previous_clock in zip(line, previous_line):
+                        for needle in ("hours", "minutes"):
+                            distance = abs(clock[needle] - previous_clock[needle])
+                            self.assertLessEqual(
+                                get_min_duration(distance, limits), clock["animation_time"] + 1e-6
+                            )
+            previous = timer
+
+if __name__ == "__main__":
+    unittest.main()
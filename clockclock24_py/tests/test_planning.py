@@ -0,0 +1,126 @@
+import copy
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from clockclock24_py.constants import shapes
+from clockclock24_py.constants.config import CHOREOGRAPHY_ENV
+from clockclock24_py.utils import events
+from clockclock24_py.utils.engine import get_sequences
+from clockclock24_py.utils.fanout import DisplayCore
+from clockclock24_py.utils.generators import GENERATORS
+from clockclock24_py.utils.motion import MotionLimits
+from clockclock24_py.utils.planning import get_plan_options, get_timeline, plan_cycle
+from clockclock24_py.utils.splines import SplineTimeline
+from clockclock24_py.utils.timeline import Timeline
+from clockclock24_py.utils.timers import get_time_timer
+from clockclock24_py.utils.utils import VirtualScheduler, get_max_animation_time, set_scheduler
+
+class TestPlanning(unittest.TestCase):
+    """Test cases for the planning module"""
+
+    def test_get_plan_options(self):
+        """Test reading the options and failing on invalid ones"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cycle.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump([{"shape": "WIND"}, {"time": True}], file)
+            with patch.dict(os.environ, {CHOREOGRAPHY_ENV: path}):
+                options = get_plan_options(1000)
+            self.assertEqual(options["choreography"], [{"shape": "WIND"}, {"time": True}])
+            self.assertEqual(options["animation_time"], 1000)
+
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump([{"shape": "NOPE"}, {"time": True}], file)
+            with patch.dict(os.environ, {CHOREOGRAPHY_ENV: path}):
+                with self.assertRaises(ValueError):
+                    get_plan_options()
+
+            # Without a time step the clock would never show the time again
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump([{"shape": "WIND"}], file)
+            with patch.dict(os.environ, {CHOREOGRAPHY_ENV: path}):
+                with self.assertRaises(ValueError):
+                    get_plan_options()
+
+        with patch("clockclock24_py.utils.planning.DELAY_PATTERNS", ["zigzag"]):
+            with self.assertRaises(ValueError):
+                get_plan_options()
+
+    def test_generated_shapes(self):
+        """Test that GENERATED_SHAPES adds the procedural shapes to the random cycles"""
+        shape_types = dict(shapes.SHAPE_TYPES)
+        try:
+            get_plan_options()
+            self.assertNotIn(GENERATORS["LINEAR"][0], shapes.SHAPE_TYPES["LINEAR"])
+            with patch("clockclock24_py.utils.planning.GENERATED_SHAPES", True):
+                get_plan_options()
+            for shape_type, generators in GENERATORS.items():
+                for generator in generators:
+                    self.assertIn(generator, shapes.SHAPE_TYPES[shape_type])
+        finally:
+            shapes.SHAPE_TYPES.clear()
+            shapes.SHAPE_TYPES.update(shape_types)
+
+    def test_plan_cycle(self):
+        """Test planning a cycle with the motion limits and recording it"""
+        start = get_time_timer()
+        options = {
+            "animation_time": 100,
+            "choreography": [{"shape": "WIND"}, {"time": True}],
+            "motion_limits": MotionLimits(90, 720),
+        }
+        sequences = plan_cycle(start, 7, options)
+        self.assertEqual(len(sequences), 2)
+        # Too fast for the motors, the animation time is stretched
+        self.assertGreater(get_max_animation_time(sequences[0]), 100)
+
+        plan = events.log.get_events("plan")[-1]
+        self.assertEqual(plan["cycle"], 7)
+        self.assertEqual(plan["shapes"][0], "WIND")
+        self.assertEqual(len(plan["extensions_ms"]), 2)
+
+    def test_plan_turned_timer(self):
+        """Test that whole turns of the start timer are not counted as travel"""
+        start = get_time_timer()
+        turned = copy.deepcopy(start)
+        for number in turned:
+            for line in number:
+                for clock in line:
+                    clock["hours"] += 360 * 3
+                    clock["minutes"] += 360
+        options = {"animation_time": 100, "motion_limits": MotionLimits(90, 720)}
+        with patch("clockclock24_py.utils.planning.get_sequences", return_value=get_sequences({})):
+            sequences = plan_cycle(start, 1, options)
+            plan = events.log.get_events("plan")[-1]
+            self.assertEqual(plan_cycle(turned, 2, options), sequences)
+        turned_plan = events.log.get_events("plan")[-1]
+        self.assertEqual(turned_plan["travel_degrees"], plan["travel_degrees"])
+        self.assertEqual(turned_plan["extensions_ms"], plan["extensions_ms"])
+
+    def test_get_timeline(self):
+        """Test choosing the timeline from SPLINE_TRAJECTORIES"""
+        start = get_time_timer()
+        sequences = plan_cycle(start, 1, {"animation_time": 1000})
+        self.assertIs(type(get_timeline(start, sequences)), Timeline)
+        with patch("clockclock24_py.utils.planning.SPLINE_TRAJECTORIES", True):
+            self.assertIsInstance(get_timeline(start, sequences), SplineTimeline)
+
+    def test_core_options(self):
+        """Test that a display core plans with the options it is given"""
+        scheduler = VirtualScheduler()
+        previous = set_scheduler(scheduler)
+        try:
+            core = DisplayCore(1000, {"choreography": [{"shape": "WIND"}, {"time": True}]})
+            core.start(0)
+            scheduler.run_next()
+            self.assertEqual(len(core.timeline.segments), 2)
+            self.assertEqual(events.log.get_events("plan")[-1]["shapes"][0], "WIND")
+            core.stop()
+        finally:
+            set_scheduler(previous)
+
+if __name__ == "__main__":
+    unittest.main()
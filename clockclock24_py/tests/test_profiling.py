@@ -0,0 +1,87 @@
+import os
+import pstats
+import tempfile
+import time
+import unittest
+
+from clockclock24_py.utils import profiling
+from clockclock24_py.utils.profiling import ProfileSession, start_profiling, profiled
+
+@profiled
+def profiled_work():
+    """A profiled function that calls another function"""
+    return sum(busy_loop() for _ in range(3))
+
+def busy_loop():
+    """Spend a little time in Python code"""
+    end = time.perf_counter() + 0.02
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for the profiling module"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cycle.pstats")
+    
+    def tearDown(self):
+        if profiling.session:
+            profiling.session.stop()
+        self.directory.cleanup()
+    
+    def get_function_names(self):
+        """Get the names of the functions in the written profile"""
+        stats = pstats.Stats(self.path)
+        return {name for _, _, name in stats.stats}
+    
+    def test_profiled_without_session(self):
+        """Test that profiled functions run normally without a session"""
+        self.assertIsNone(profiling.session)
+        self.assertGreater(profiled_work(), 0)
+    
+    def test_cprofile_session(self):
+        """Test tracing the profiled calls"""
+        session = start_profiling(60000, self.path)
+        self.assertIs(profiling.session, session)
+        
+        # Only one session runs at a time
+        self.assertIsNone(start_profiling(60000, self.path))
+        
+        profiled_work()
+        session.stop()
+        
+        self.assertIsNone(profiling.session)
+        self.assertIn("busy_loop", self.get_function_names())
+        self.assertIn("profiled_work", self.get_function_names())
+    
+    def test_session_ends_after_duration(self):
+        """Test that the session stops by itself"""
+        session = start_profiling(50, self.path)
+        profiled_work()
+        time.sleep(0.3)
+        
+        self.assertTrue(session.is_stopped)
+        self.assertIsNone(profiling.session)
+        self.assertTrue(os.path.exists(self.path))
+    
+    def test_sample_session(self):
+        """Test sampling every thread"""
+        session = ProfileSession(60000, self.path, mode="sample", interval_ms=1).start()
+        busy_loop()
+        session.stop()
+        
+        self.assertGreater(session.sampler.samples, 0)
+        self.assertIn("busy_loop", self.get_function_names())
+        stats = pstats.Stats(self.path)
+        stats.sort_stats("cumulative")
+    
+    def test_unknown_mode(self):
+        """Test that unknown modes are rejected"""
+        with self.assertRaises(ValueError):
+            ProfileSession(1000, self.path, mode="unknown")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from clockclock24_py.constants.numbers import NUMBERS
+from clockclock24_py.renderers.raster import (
+    get_grey,
+    encode_pgm,
+    FrameBuffer,
+    Rasterizer
+)
+
+class TestRaster(unittest.TestCase):
+    """Test cases for the raster module"""
+    
+    def test_get_grey(self):
+        """Test the get_grey function"""
+        self.assertEqual(get_grey("#000000"), 0)
+        self.assertEqual(get_grey("#ffffff"), 255)
+        self.assertEqual(get_grey("#c9c9c9"), 0xc9)
+    
+    def test_encode_pgm(self):
+        """Test the encode_pgm function"""
+        data = encode_pgm(2, 1, bytearray([1, 2]))
+        self.assertEqual(data, b"P5\n2 1\n255\n\x01\x02")
+    
+    def test_fill_disc(self):
+        """Test filling a disc in a frame buffer"""
+        frame = FrameBuffer(10, 10)
+        frame.fill_disc(5, 5, 2, 255)
+        
+        self.assertEqual(frame.pixels[5 * 10 + 5], 255)
+        self.assertEqual(frame.pixels[5 * 10 + 3], 255)
+        self.assertEqual(frame.pixels[5 * 10 + 1], 0)
+        self.assertEqual(frame.pixels[0], 0)
+        
+        # Discs are clipped to the frame
+        frame.fill_disc(0, 0, 4, 128)
+        self.assertEqual(len(frame.pixels), 100)
+        self.assertEqual(frame.pixels[0], 128)
+    
+    def test_fill_capsule(self):
+        """Test filling a line segment in a frame buffer"""
+        frame = FrameBuffer(20, 20)
+        frame.fill_capsule(2, 10, 18, 10, 1, 255)
+        
+        row = frame.pixels[10 * 20:11 * 20]
+        self.assertEqual(row[1:18], bytearray([255]) * 17)
+        self.assertEqual(frame.pixels[5 * 20 + 10], 0)
+        
+        # Vertical segment
+        frame = FrameBuffer(20, 20)
+        frame.fill_capsule(10, 2, 10, 18, 1, 255)
+        self.assertEqual(frame.pixels[5 * 20 + 10], 255)
+        self.assertEqual(frame.pixels[5 * 20 + 15], 0)
+    
+    def test_render(self):
+        """Test rendering timers"""
+        rasterizer = Rasterizer(260, 100)
+        horizontal = rasterizer.render([NUMBERS[1]] * 4)
+        first = bytes(horizontal)
+        
+        self.assertEqual(len(first), 260 * 100)
+        self.assertIn(rasterizer.needle_value, first)
+        
+        # A different timer gives a different frame on the same buffer
+        second = bytes(rasterizer.render([NUMBERS[8]] * 4))
+        self.assertNotEqual(first, second)
+        
+        # The same timer always gives the same frame
+        self.assertEqual(bytes(rasterizer.render([NUMBERS[1]] * 4)), first)
+        self.assertTrue(rasterizer.to_pgm().startswith(b"P5\n260 100\n255\n"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+from clockclock24_py.utils.splines import NeedleSpline, SplineTimeline, get_tangents
+from clockclock24_py.utils.engine import Sequence, compute_sequences
+
+class TestSplines(unittest.TestCase):
+    """Test cases for the splines module"""
+
+    def get_timer(self, hours, minutes):
+        return [[[{"hours": hours, "minutes": minutes}] * 2 for _ in range(3)] for _ in range(4)]
+
+    def test_tangents(self):
+        """Test that the needles rest at the ends and where they stop or turn back"""
+        self.assertEqual(get_tangents([0, 1, 2, 3], [0, 10, 10, 0]), [0, 0, 0, 0])
+        tangents = get_tangents([0, 1, 3], [0, 10, 30])
+        self.assertEqual((tangents[0], tangents[-1]), (0, 0))
+        self.assertAlmostEqual(tangents[1], 2 / (1 / 10 + 1 / 10))
+
+    def test_needle_spline(self):
+        """Test that a spline goes through its targets with a continuous velocity"""
+        times = [0, 1000, 1500, 3000]
+        values = [0, 450, 720, 900]
+        spline = NeedleSpline(times, values)
+        self.assertEqual(len(spline), 3)
+        for time_ms, value in zip(times, values):
+            self.assertAlmostEqual(spline.get_angle(time_ms), value)
+        self.assertEqual(spline.get_angle(-10), 0)
+        self.assertEqual(spline.get_angle(5000), 900)
+
+        step = 1e-3
+        for time_ms in times[1:-1]:
+            before = (spline.get_angle(time_ms) - spline.get_angle(time_ms - step)) / step
+            after = (spline.get_angle(time_ms + step) - spline.get_angle(time_ms)) / step
+            self.assertAlmostEqual(before, after, 2)
+            self.assertGreater(before, 0)
+
+        # Monotone targets give a monotone motion
+        samples = [spline.get_angle(time_ms) for time_ms in range(0, 3001, 10)]
+        self.assertEqual(samples, sorted(samples))
+        self.assertEqual(len(spline.to_dict()["coefficients"]), 12)
+
+    def test_spline_timeline(self):
+        """Test that the needles reach each shape when the separate animations do"""
+        start = self.get_timer(0, 0)
+        sequences = [
+            Sequence(self.get_timer(90, 180), animation_time=1000),
+            Sequence(self.get_timer(180, 90), animation_time=1000, is_reverse=True),
+            Sequence(self.get_timer(180, 90), seq_type="wait", animation_time=500),
+            Sequence(self.get_timer(270, 0), animation_time=1000, delay=100),
+        ]
+        timers = compute_sequences(sequences, start)
+        timeline = SplineTimeline(start, timers)
+        self.assertEqual(timeline.duration, 1000 + 1000 + 500 + 1400)
+
+        self.assertEqual(timeline.state_at(0), start)
+        for time_ms, timer in [(1000, timers[0]), (2000, timers[1])]:
+            self.assertAlmostEqual(timeline.state_at(time_ms)[1][2][0]["hours"],
+                                   timer[1][2][0]["hours"])
+            self.assertAlmostEqual(timeline.state_at(time_ms)[1][2][0]["minutes"],
+                                   timer[1][2][0]["minutes"])
+        self.assertEqual(timeline.state_at(timeline.duration)[3][0][1]["hours"],
+                         timers[-1][3][0][1]["hours"])
+
+        # Per needle: two motions, the wait as a single rest interval, then the last motion
+        self.assertEqual(len(timeline.splines[0]), 4)
+        self.assertEqual(timeline.get_keyframe_count(), 4 * 4 * 3 * 2 * 2)
+        self.assertEqual(len(timeline.to_dict()["needles"]), 48)
+
+if __name__ == "__main__":
+    unittest.main()
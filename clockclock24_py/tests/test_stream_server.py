@@ -0,0 +1,214 @@
+import asyncio
+import base64
+import json
+import os
+import socket
+import struct
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+from clockclock24_py.utils.engine import Sequence, compute_sequences
+from clockclock24_py.utils.stream_server import (
+    StreamClient,
+    StreamServer,
+    encode_frame,
+    get_accept_key,
+    unmask
+)
+from clockclock24_py.utils.timeline import Timeline
+from clockclock24_py.utils.timers import get_shape, get_time_timer
+from clockclock24_py.utils.utils import get_time_ms
+
+class WebSocketClient:
+    """A minimal WebSocket client reading the text messages of the server"""
+
+    def __init__(self, port: int):
+        self.socket = socket.create_connection(("127.0.0.1", port), timeout=5)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        self.socket.sendall((
+            "GET /stream HTTP/1.1\r\nHost: 127.0.0.1\r\nUpgrade: websocket\r\n"
+            "Connection: Upgrade\r\nSec-WebSocket-Key: %s\r\nSec-WebSocket-Version: 13\r\n\r\n" % key
+        ).encode("ascii"))
+        self.file = self.socket.makefile("rb")
+        response = b""
+        while not response.endswith(b"\r\n\r\n"):
+            response += self.file.readline()
+        self.response = response.decode("latin-1")
+        self.key = key
+
+    def read_frame(self):
+        first, second = self.file.read(2)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self.file.read(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self.file.read(8))[0]
+        return first & 0x0F, self.file.read(length)
+
+    def read_message(self):
+        return json.loads(self.read_frame()[1].decode("utf-8"))
+
+    def close(self):
+        # Client frames are masked
+        mask = os.urandom(4)
+        payload = struct.pack("!H", 1000)
+        self.socket.sendall(bytes([0x88, 0x80 | len(payload)]) + mask +
+                            bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload)))
+        # Skip the frames sent before the server got the close frame
+        opcode, _ = self.read_frame()
+        while opcode == 0x1:
+            opcode, _ = self.read_frame()
+        self.file.close()
+        self.socket.close()
+        return opcode
+
+class TestStreamServer(unittest.TestCase):
+    """Test cases for the stream_server module"""
+
+    def setUp(self):
+        self.server = StreamServer(port=0, frame_ms=20).start()
+
+    def tearDown(self):
+        self.server.close()
+
+    def flush(self):
+        """Wait until the loop of the server ran the pending callbacks"""
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), self.server.loop).result(5)
+
+    def test_encode_frame(self):
+        """Test the headers of the server frames and the handshake key"""
+        self.assertEqual(encode_frame(b"hello"), b"\x81\x05hello")
+        self.assertEqual(encode_frame(b"x" * 200)[:4], b"\x81\x7e\x00\xc8")
+        self.assertEqual(encode_frame(b"x" * 70000)[:2], b"\x81\x7f")
+        self.assertEqual(len(encode_frame(b"x" * 70000)), 70000 + 10)
+        self.assertEqual(get_accept_key("dGhlIHNhbXBsZSBub25jZQ=="), "s3pPLMBiTxaQ9kYGzzhZRbK+xOo=")
+
+    def test_backpressure(self):
+        """Test that a slow client only gets the latest frame and is dropped when far behind"""
+        client = StreamClient(None, max_queue=2)
+        client.send_frame(b"1")
+        client.send_frame(b"2")
+        self.assertEqual(client.dropped_frames, 1)
+        self.assertEqual(client.take(), b"2")
+
+        # A cycle replaces the frame of the previous one
+        client.send_frame(b"3")
+        client.send(b"cycle")
+        client.send_frame(b"4")
+        self.assertEqual(client.take(), b"cycle4")
+
+        for data in (b"a", b"b", b"c"):
+            client.send(data)
+        self.assertTrue(client.is_closed)
+        self.assertEqual(client.take(), b"")
+
+    def test_stream(self):
+        """Test streaming a cycle to clients that join before and during it"""
+        timer = get_time_timer()
+        self.server.end_cycle(timer)
+        self.flush()
+
+        first = WebSocketClient(self.server.port)
+        self.assertIn("101 Switching Protocols", first.response)
+        self.assertIn(get_accept_key(first.key), first.response)
+        hello = first.read_message()
+        self.assertEqual((hello["type"], hello["numbers"], hello["lines"]), ("hello", 4, 3))
+        rest = first.read_message()
+        self.assertEqual(rest["type"], "rest")
+        self.assertEqual(len(rest["angles"]), 4 * 3 * 2 * 2)
+
+        sequences = [Sequence(get_shape("SQUARES"), animation_time=2000)]
+        timeline = Timeline(timer, compute_sequences(sequences, timer))
+        self.server.start_cycle(timeline, get_time_ms())
+        cycle = first.read_message()
+        self.assertEqual((cycle["type"], cycle["duration"]), ("cycle", timeline.duration))
+        frame = first.read_message()
+        self.assertEqual((frame["type"], frame["cycle"]), ("frame", cycle["cycle"]))
+        self.assertEqual(len(frame["angles"]), len(rest["angles"]))
+
+        # A client joining mid-cycle gets the snapshot of the cycle
+        second = WebSocketClient(self.server.port)
+        self.assertEqual([second.read_message()["type"] for _ in range(3)],
+                         ["hello", "cycle", "frame"])
+        self.assertEqual(second.read_message()["type"], "frame")
+
+        with urllib.request.urlopen("http://127.0.0.1:%d/snapshot" % self.server.port) as response:
+            snapshot = json.loads(response.read().decode("utf-8"))
+        self.assertEqual(snapshot["cycle"]["cycle"], cycle["cycle"])
+        self.assertEqual(snapshot["state"]["type"], "frame")
+
+        self.assertEqual(first.close(), 0x8)
+        self.assertEqual(second.close(), 0x8)
+        for _ in range(100):
+            self.flush()
+            if not self.server.clients:
+                break
+            time.sleep(0.01)
+        self.assertEqual(len(self.server.clients), 0)
+
+    def test_unmask(self):
+        """Test unmasking client payloads of any length"""
+        mask = b"\x01\x02\x03\x04"
+        payload = bytes(range(11))
+        masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        self.assertEqual(unmask(masked, mask), payload)
+        self.assertEqual(unmask(b"", mask), b"")
+
+    def test_oversized_frames(self):
+        """Test that oversized client frames close the connection without being read"""
+        for header, code in [
+            # A ping with a payload longer than a control frame allows
+            (bytes([0x89, 0x80 | 126]) + struct.pack("!H", 200), 1002),
+            # A text frame claiming far more than a client may send
+            (bytes([0x81, 0x80 | 127]) + struct.pack("!Q", 1 << 40), 1009),
+        ]:
+            with self.subTest(code=code):
+                client = WebSocketClient(self.server.port)
+                client.socket.sendall(header)
+                opcode, payload = client.read_frame()
+                while opcode == 0x1:
+                    opcode, payload = client.read_frame()
+                self.assertEqual((opcode, struct.unpack("!H", payload)[0]), (0x8, code))
+                # The server closed the connection
+                self.assertEqual(client.file.read(), b"")
+                client.socket.close()
+
+    def test_send_timeout(self):
+        """Test giving up on a client that does not accept the writes"""
+        server = StreamServer(port=0, send_timeout=50).start()
+        try:
+            class StuckWriter:
+                async def drain(self):
+                    await asyncio.sleep(10)
+
+            drained = asyncio.run_coroutine_threadsafe(server.drain(StuckWriter()), server.loop)
+            self.assertFalse(drained.result(5))
+        finally:
+            server.close()
+
+    def test_no_clients(self):
+        """Test that frames are only encoded for clients"""
+        timer = get_time_timer()
+        sequences = [Sequence(get_shape("SQUARES"), animation_time=2000)]
+        timeline = Timeline(timer, compute_sequences(sequences, timer))
+        self.server.start_cycle(timeline, get_time_ms())
+        time.sleep(0.1)
+        self.flush()
+        self.assertEqual(self.server.frame_count, 0)
+
+        # A joining client still gets the current frame
+        client = WebSocketClient(self.server.port)
+        self.assertEqual([client.read_message()["type"] for _ in range(3)], ["hello", "cycle", "frame"])
+        self.assertEqual(client.close(), 0x8)
+
+    def test_page(self):
+        """Test serving the browser display and unknown paths"""
+        with urllib.request.urlopen("http://127.0.0.1:%d/" % self.server.port) as response:
+            self.assertIn(b"new WebSocket", response.read())
+        with self.assertRaises(urllib.error.HTTPError):
+            urllib.request.urlopen("http://127.0.0.1:%d/nope" % self.server.port)
+
+if __name__ == "__main__":
+    unittest.main()
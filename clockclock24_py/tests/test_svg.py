@@ -0,0 +1,92 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from clockclock24_py.constants.config import CHOREOGRAPHY_ENV
+from clockclock24_py.constants.numbers import NUMBERS
+from clockclock24_py.renderers.svg import (
+    format_number,
+    render_svg,
+    export_frames,
+    main
+)
+
+SVG = "{http://www.w3.org/2000/svg}"
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+class TestSvg(unittest.TestCase):
+    """Test cases for the svg module"""
+    
+    def test_format_number(self):
+        """Test the format_number function"""
+        self.assertEqual(format_number(12.0), "12")
+        self.assertEqual(format_number(12.25), "12.2")
+        self.assertEqual(format_number(12.25, 2), "12.25")
+        self.assertEqual(format_number(-0.01), "0")
+        self.assertEqual(format_number(100), "100")
+    
+    def test_render_svg(self):
+        """Test the render_svg function"""
+        timer = [NUMBERS[1], NUMBERS[2], NUMBERS[3], NUMBERS[4]]
+        root = ElementTree.fromstring(render_svg(timer, 800, 300))
+        
+        # The face and needles are defined once
+        symbols = root.findall(f"{SVG}defs/{SVG}symbol")
+        self.assertEqual([symbol.get("id") for symbol in symbols], ["f", "h", "m"])
+        
+        # Every clock references them
+        clocks = root.findall(f"{SVG}g")
+        self.assertEqual(len(clocks), 24)
+        uses = clocks[0].findall(f"{SVG}use")
+        self.assertEqual([use.get(XLINK_HREF) for use in uses], ["#f", "#h", "#m"])
+        self.assertEqual(uses[1].get("transform"), "rotate(225)")
+        
+        # Colon dots
+        self.assertEqual(len(root.findall(f"{SVG}circle")), 2)
+    
+    def test_render_svg_angles(self):
+        """Test that angles are written between 0 and 360"""
+        timer = [[[{"hours": 450, "minutes": -90}] * 2] * 3] * 4
+        svg = render_svg(timer, 800, 300)
+        
+        self.assertIn('rotate(90)', svg)
+        self.assertIn('rotate(270)', svg)
+        self.assertNotIn('rotate(450)', svg)
+    
+    def test_export_frames(self):
+        """Test the export_frames function"""
+        timers = [[NUMBERS[0]] * 4, [NUMBERS[8]] * 4]
+        with tempfile.TemporaryDirectory() as directory:
+            paths = export_frames(timers, directory, 400, 200)
+            
+            self.assertEqual([os.path.basename(path) for path in paths],
+                             ["frame_0000.svg", "frame_0001.svg"])
+            for path in paths:
+                with open(path, encoding="utf-8") as file:
+                    ElementTree.fromstring(file.read())
+
+    def test_main(self):
+        """Test that the exported cycle is planned with the options of the configuration"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cycle.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"animation_time": 1000, "steps": [{"shape": "WIND"}, {"time": True}]}, file)
+            output = io.StringIO()
+            with patch.dict(os.environ, {CHOREOGRAPHY_ENV: path}), redirect_stdout(output):
+                main([os.path.join(directory, "frames")])
+            # The start timer, the two steps and the rest timer
+            self.assertEqual(len(output.getvalue().split()), 4)
+
+            output = io.StringIO()
+            with patch.dict(os.environ, {CHOREOGRAPHY_ENV: path}), redirect_stdout(output):
+                main([os.path.join(directory, "sampled"), "--fps", "10"])
+            # 2 seconds sampled at 10 frames per second
+            self.assertEqual(len(output.getvalue().split()), 21)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import io
+import unittest
+
+from clockclock24_py.constants.numbers import NUMBERS
+from clockclock24_py.utils import events
+from clockclock24_py.utils.utils import VirtualScheduler, set_scheduler
+from clockclock24_py.renderers.terminal import (
+    BRAILLE_BASE,
+    get_arrow,
+    draw_braille_clock,
+    draw_glyph_clock,
+    diff_frames,
+    TerminalRenderer,
+    TerminalDisplay,
+    TerminalClock
+)
+
+class TestTerminal(unittest.TestCase):
+    """Test cases for the terminal module"""
+    
+    def test_get_arrow(self):
+        """Test the get_arrow function"""
+        self.assertEqual(get_arrow(0), "↑")
+        self.assertEqual(get_arrow(90), "→")
+        self.assertEqual(get_arrow(180), "↓")
+        self.assertEqual(get_arrow(270), "←")
+        self.assertEqual(get_arrow(360 + 44), "↗")
+        self.assertEqual(get_arrow(-90), "←")
+    
+    def test_draw_braille_clock(self):
+        """Test the draw_braille_clock function"""
+        lines = draw_braille_clock(0, 180, 6, 3)
+        
+        self.assertEqual(len(lines), 3)
+        for line in lines:
+            self.assertEqual(len(line), 6)
+            for char in line:
+                self.assertTrue(BRAILLE_BASE <= ord(char) <= BRAILLE_BASE + 0xff)
+        
+        # A vertical line only uses the middle columns
+        self.assertEqual(lines[0][0], chr(BRAILLE_BASE))
+        self.assertNotEqual(lines[0][2] + lines[0][3], chr(BRAILLE_BASE) * 2)
+    
+    def test_draw_glyph_clock(self):
+        """Test the draw_glyph_clock function"""
+        self.assertEqual(draw_glyph_clock(90, 270, 4, 1), [" →← "])
+    
+    def test_diff_frames(self):
+        """Test the diff_frames function"""
+        # The first frame is written completely
+        self.assertEqual(diff_frames(None, ["ab", "cd"]), "\x1b[1;1Hab\x1b[2;1Hcd")
+        
+        # Unchanged frames write nothing
+        self.assertEqual(diff_frames(["ab", "cd"], ["ab", "cd"]), "")
+        
+        # Only the changed cells are written
+        self.assertEqual(diff_frames(["abcd"], ["abXd"]), "\x1b[1;3HX")
+        
+        # Close changes are merged, distant ones get their own cursor move
+        self.assertEqual(diff_frames(["abcdef"], ["XbcdeY"]), "\x1b[1;1HXbcdeY")
+        previous = ["a" * 20]
+        current = ["X" + "a" * 18 + "Y"]
+        self.assertEqual(diff_frames(previous, current), "\x1b[1;1HX\x1b[1;20HY")
+    
+    def test_render(self):
+        """Test the TerminalRenderer class"""
+        renderer = TerminalRenderer()
+        frame = renderer.render([NUMBERS[1], NUMBERS[2], NUMBERS[3], NUMBERS[4]])
+        
+        self.assertEqual(len(frame), renderer.height)
+        for row in frame:
+            self.assertEqual(len(row), renderer.width)
+        self.assertIn("•", "".join(frame))
+        
+        glyphs = TerminalRenderer(mode="glyph").render([NUMBERS[0]] * 4)
+        self.assertEqual(len(glyphs), 5)
+        self.assertIn("↓", glyphs[0])
+    
+    def test_display(self):
+        """Test that the display only writes the changes"""
+        stream = io.StringIO()
+        display = TerminalDisplay(TerminalRenderer(mode="glyph"), stream)
+        
+        display.update([NUMBERS[1], NUMBERS[2], NUMBERS[3], NUMBERS[4]])
+        first = display.last_frame_bytes
+        self.assertTrue(stream.getvalue().startswith("\x1b[?25l\x1b[2J"))
+        
+        display.update([NUMBERS[1], NUMBERS[2], NUMBERS[3], NUMBERS[4]])
+        self.assertEqual(display.last_frame_bytes, 0)
+        
+        display.update([NUMBERS[1], NUMBERS[2], NUMBERS[3], NUMBERS[5]])
+        self.assertGreater(display.last_frame_bytes, 0)
+        self.assertLess(display.last_frame_bytes, first)
+        self.assertEqual(display.frames, 3)
+        
+        display.close()
+        self.assertTrue(stream.getvalue().endswith("\x1b[?25h"))
+
+    def test_clock(self):
+        """Test that the clock samples the cycles planned with its options"""
+        scheduler = VirtualScheduler()
+        previous = set_scheduler(scheduler)
+        try:
+            display = TerminalDisplay(TerminalRenderer(mode="glyph"), io.StringIO())
+            options = {"choreography": [{"shape": "WIND"}, {"time": True}]}
+            clock = TerminalClock(display, 1000, options, frame_ms=100)
+            clock.start_next_cycle(0)
+            scheduler.advance(0)
+            self.assertEqual(events.log.get_events("plan")[-1]["shapes"][0], "WIND")
+            scheduler.advance(clock.core.timeline.duration)
+            # The frames are sampled along the animation, not only at the timer states
+            self.assertGreater(display.frames, 10)
+            clock.stop()
+        finally:
+            set_scheduler(previous)
+
+if __name__ == "__main__":
+    unittest.main()
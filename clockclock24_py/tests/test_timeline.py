@@ -0,0 +1,69 @@
+import unittest
+
+from clockclock24_py.utils.timeline import Timeline, get_easing, state_at
+from clockclock24_py.utils.engine import Sequence, compute_sequences
+
+class TestTimeline(unittest.TestCase):
+    """Test cases for the timeline module"""
+
+    def get_timer(self, hours, minutes):
+        return [[[{"hours": hours, "minutes": minutes}] * 2 for _ in range(3)] for _ in range(4)]
+
+    def get_timers(self):
+        start = self.get_timer(0, 0)
+        sequences = [
+            Sequence(self.get_timer(90, 180), animation_time=1000),
+            Sequence(self.get_timer(90, 180), seq_type="wait", animation_time=500),
+            Sequence(self.get_timer(0, 90), animation_time=1000, delay=100, animation_type="start"),
+        ]
+        return start, compute_sequences(sequences, start)
+
+    def test_easing(self):
+        """Test the linear and cubic-bezier easings"""
+        self.assertEqual(get_easing("linear")(0.3), 0.3)
+        ease = get_easing("cubic-bezier(.27,0,.31,.41)")
+        self.assertAlmostEqual(ease(0), 0)
+        self.assertAlmostEqual(ease(1), 1)
+        self.assertAlmostEqual(get_easing("cubic-bezier(0, 0, 1, 1)")(0.42), 0.42, 5)
+        values = [ease(step / 20) for step in range(21)]
+        self.assertEqual(values, sorted(values))
+        with self.assertRaises(ValueError):
+            get_easing("steps(4)")
+
+    def test_segments(self):
+        """Test finding the timer state running at a time"""
+        start, timers = self.get_timers()
+        timeline = Timeline(start, timers)
+        self.assertEqual(timeline.starts, [0, 1000, 1500])
+        self.assertEqual(timeline.duration, 1500 + 1400)
+        self.assertIsNone(timeline.get_segment(-1))
+        self.assertIs(timeline.get_segment(1000), timeline.segments[1])
+        self.assertIs(timeline.get_segment(10 ** 6), timeline.segments[-1])
+
+    def test_state_at(self):
+        """Test the needle angles along the timeline"""
+        start, timers = self.get_timers()
+        timeline = Timeline(start, timers)
+
+        self.assertEqual(timeline.state_at(-10), start)
+        self.assertEqual(timeline.state_at(0)[0][0][0], {"hours": 0, "minutes": 0})
+        clock = timeline.state_at(700)[0][0][0]
+        self.assertGreater(clock["hours"], 0)
+        self.assertLess(clock["hours"], timers[0][0][0][0]["hours"])
+
+        # The wait keeps the needles in place
+        self.assertEqual(timeline.state_at(1200)[2][1][1]["hours"], timers[0][2][1][1]["hours"])
+
+        # The last clocks to move wait for their delay
+        self.assertEqual(timeline.state_at(1500 + 700)[3][0][1], timeline.state_at(1500)[3][0][1])
+        self.assertNotEqual(timeline.state_at(1500 + 800)[3][0][1], timeline.state_at(1500)[3][0][1])
+
+        end = state_at(start, timers, timeline.duration)
+        for number, expected_number in zip(end, timers[-1]):
+            for line, expected_line in zip(number, expected_number):
+                for clock, expected in zip(line, expected_line):
+                    self.assertEqual(clock["hours"], expected["hours"])
+                    self.assertEqual(clock["minutes"], expected["minutes"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,10 @@ from clockclock24_py.utils.timers import (
     get_random_shaped_timer,
     get_same_shape,
     get_different_shape,
-    get_timers
+    get_timers,
+    get_shape_name
 )
+from clockclock24_py.constants import shapes
 
 class TestTimers(unittest.TestCase):
     """Test cases for the timers module"""
@@ -116,6 +118,12 @@ class TestTimers(unittest.TestCase):
         
         # Check that we got the right number of timers
         self.assertEqual(len(different_timers), 3)
+    
+    def test_get_shape_name(self):
+        """Test the get_shape_name function"""
+        self.assertEqual(get_shape_name(shapes.WIND), "WIND")
+        self.assertEqual(get_shape_name(shapes.SQUARES), "SQUARES")
+        self.assertIsNone(get_shape_name(get_time_timer()))
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -1,12 +1,21 @@
+import io
+import os
+import threading
 import unittest
 import time
+from contextlib import redirect_stderr
+from unittest.mock import patch
 from clockclock24_py.utils.utils import (
     get_random_number,
     get_random_boolean,
     get_max_animation_time,
     Timeout,
+    VirtualScheduler,
+    set_scheduler,
     start_timeout,
-    run_sequences
+    run_sequences,
+    get_env_port,
+    get_pending_timeouts
 )
 
 class TestUtils(unittest.TestCase):
@@ -124,5 +133,110 @@ class TestUtils(unittest.TestCase):
         # Check that the results are in order
         self.assertEqual(results, [1, 2, 3])
 
+    def test_virtual_scheduler(self):
+        """Test running timeouts on a virtual clock"""
+        scheduler = VirtualScheduler()
+        previous = set_scheduler(scheduler)
+        try:
+            results = []
+            start_timeout(300).then(lambda: results.append(300))
+            start_timeout(100).then(lambda: results.append(100))
+            cancelled = start_timeout(200).then(lambda: results.append(200))
+            cancelled.cancel()
+            
+            # Nothing runs before the virtual time moves
+            self.assertEqual(results, [])
+            self.assertEqual(scheduler.get_pending(), 2)
+            
+            scheduler.advance(150)
+            self.assertEqual(results, [100])
+            self.assertEqual(scheduler.now, 150)
+            
+            # Timeouts started by callbacks are scheduled from the virtual time
+            start_timeout(10).then(lambda: results.append(10))
+            self.assertTrue(scheduler.run_next())
+            self.assertEqual(scheduler.now, 160)
+            self.assertTrue(scheduler.run_next())
+            self.assertFalse(scheduler.run_next())
+            self.assertEqual(results, [100, 10, 300])
+        finally:
+            set_scheduler(previous)
+
+    def test_run_sequences_chain(self):
+        """Test that the sequences run one after another and cancel together"""
+        scheduler = VirtualScheduler()
+        previous = set_scheduler(scheduler)
+        try:
+            started = []
+            
+            def create_timeout_func(value):
+                def func():
+                    started.append((value, scheduler.now))
+                    return start_timeout(100)
+                return func
+            
+            completed = []
+            chain = run_sequences([create_timeout_func(value) for value in range(3)])
+            chain.then(lambda: completed.append(scheduler.now))
+            scheduler.advance(1000)
+            self.assertEqual(started, [(0, 0), (1, 100), (2, 200)])
+            self.assertEqual(completed, [300])
+            
+            # Cancelling the chain cancels the running timeout and the next ones
+            started.clear()
+            chain = run_sequences([create_timeout_func(value) for value in range(3)])
+            chain.then(lambda: completed.append(scheduler.now))
+            scheduler.advance(150)
+            chain.cancel()
+            self.assertEqual(scheduler.get_pending(), 0)
+            scheduler.advance(1000)
+            self.assertEqual([value for value, _ in started], [0, 1])
+            self.assertEqual(completed, [300])
+            self.assertTrue(run_sequences([]).is_completed)
+        finally:
+            set_scheduler(previous)
+
+    def test_concurrent_finish(self):
+        """Test that a timeout completed and cancelled from several threads finishes once"""
+        scheduler = VirtualScheduler()
+        previous = set_scheduler(scheduler)
+        try:
+            pending = get_pending_timeouts()
+            timeouts = [start_timeout(1000) for _ in range(500)]
+            finished = []
+            for timeout in timeouts:
+                timeout.then(lambda: finished.append(1)).catch(lambda: finished.append(1))
+            
+            def finish(method):
+                for timeout in timeouts:
+                    getattr(timeout, method)()
+            
+            threads = [threading.Thread(target=finish, args=(method,))
+                       for method in ["complete", "cancel"] * 4]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            set_scheduler(previous)
+        
+        self.assertEqual(get_pending_timeouts(), pending)
+        self.assertEqual(len(finished), len(timeouts))
+        for timeout in timeouts:
+            self.assertNotEqual(timeout.is_completed, timeout.is_cancelled)
+
+    def test_get_env_port(self):
+        """Test reading a port from the environment"""
+        name = "CLOCKCLOCK24_TEST_PORT"
+        with patch.dict(os.environ, {name: "9124"}):
+            self.assertEqual(get_env_port(name), 9124)
+        with patch.dict(os.environ, {name: ""}):
+            self.assertIsNone(get_env_port(name))
+        for value in ["abc", "70000", "-1"]:
+            output = io.StringIO()
+            with patch.dict(os.environ, {name: value}), redirect_stderr(output):
+                self.assertIsNone(get_env_port(name))
+            self.assertIn(name, output.getvalue())
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,79 @@
+import threading
+import time
+import unittest
+
+from clockclock24_py.utils import events, metrics
+from clockclock24_py.utils.events import EventLog
+from clockclock24_py.utils.watchdog import Watchdog
+
+class TestWatchdog(unittest.TestCase):
+    """Test cases for the watchdog module"""
+    
+    def setUp(self):
+        self.previous_log = events.log
+        events.log = EventLog()
+        self.scheduled = []
+        
+    def tearDown(self):
+        events.log = self.previous_log
+        metrics.disable()
+        
+    def schedule(self, time_ms, function):
+        self.scheduled.append((time_ms, function))
+    
+    def test_heartbeat(self):
+        """Test that each heartbeat schedules the next one"""
+        watchdog = Watchdog(self.schedule, threshold_ms=1000, interval_ms=100)
+        watchdog.beat()
+        watchdog.beat()
+        
+        self.assertEqual([time_ms for time_ms, _ in self.scheduled], [100, 100])
+        self.assertFalse(watchdog.check())
+        self.assertEqual(events.log.get_events(), [])
+    
+    def test_stall(self):
+        """Test reporting a stall with the stack of the blocked loop"""
+        registry = metrics.enable()
+        release = threading.Event()
+        
+        def blocked_loop():
+            release.wait(5)
+            
+        thread = threading.Thread(target=blocked_loop, daemon=True)
+        thread.start()
+        try:
+            watchdog = Watchdog(self.schedule, threshold_ms=50, interval_ms=10)
+            watchdog.loop_thread_id = thread.ident
+            watchdog.last_beat = time.monotonic() - 1
+            
+            self.assertTrue(watchdog.check())
+            self.assertTrue(watchdog.check())
+        finally:
+            release.set()
+            thread.join()
+        
+        # The stall is reported once, until the next heartbeat
+        stalls = events.log.get_events("stall")
+        self.assertEqual(len(stalls), 1)
+        self.assertGreaterEqual(stalls[0]["stall_ms"], 1000)
+        self.assertIn("blocked_loop", "".join(stalls[0]["stack"]))
+        self.assertEqual(watchdog.stall_count, 1)
+        self.assertEqual(registry.stalls.value, 1)
+        
+        watchdog.beat()
+        self.assertEqual(len(events.log.get_events("stall_end")), 1)
+        self.assertFalse(watchdog.check())
+    
+    def test_start_stop(self):
+        """Test the checking thread"""
+        watchdog = Watchdog(self.schedule, threshold_ms=20, interval_ms=5).start()
+        time.sleep(0.1)
+        watchdog.stop()
+        
+        # The heartbeats were never run, so the current thread looks stalled
+        self.assertEqual(len(self.scheduled), 1)
+        self.assertEqual(watchdog.stall_count, 1)
+        self.assertIn("test_start_stop", "".join(events.log.get_events("stall")[0]["stack"]))
+
+if __name__ == "__main__":
+    unittest.main()
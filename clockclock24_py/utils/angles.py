@@ -0,0 +1,47 @@
+from typing import Tuple, Union
+
+ANGLE_SCALE = 10  # Angles are computed in tenths of a degree
+TURN = 360 * ANGLE_SCALE
+
+def to_fixed(angle: float) -> int:
+    """Convert an angle in degrees to integer tenths of a degree"""
+    return round(angle * ANGLE_SCALE)
+
+def to_degrees(value: int) -> Union[int, float]:
+    """Convert tenths of a degree to degrees, as an integer when it is whole"""
+    return value // ANGLE_SCALE if value % ANGLE_SCALE == 0 else value / ANGLE_SCALE
+
+def split_turns(value: int) -> Tuple[int, int]:
+    """Split tenths of a degree into whole turns and a position in [0, TURN["""
+    return divmod(value, TURN)
+
+def wrap_angle(angle: float) -> Union[int, float]:
+    """Drop the whole turns of an angle in degrees"""
+    return to_degrees(split_turns(to_fixed(angle))[1])
+
+def get_start_position(start: int) -> int:
+    """Get the position of a start angle within its turn, in tenths"""
+    if start < 0:
+        return TURN + start % TURN
+    return start % TURN
+
+def round_rest(rest: int, min_rotation: int) -> int:
+    """Remove a whole turn from a rotation that has more than min_rotation left, in tenths"""
+    rest_round = abs(rest)
+    round_val = rest_round - TURN if rest_round >= TURN + min_rotation else rest_round
+    return -round_val if rest < 0 else round_val
+
+def rotate_fixed(start: int, end: int, min_rotation: int) -> int:
+    """Rotate clockwise from start to the position end, in tenths"""
+    return start + round_rest(TURN - (get_start_position(start) - end), min_rotation)
+
+def rotate_reverse_fixed(start: int, end: int, min_rotation: int) -> int:
+    """Rotate counter-clockwise from start to the position end, in tenths"""
+    position = get_start_position(start) or TURN
+    return start + round_rest(-position + (end - TURN), min_rotation)
+
+def rotate_shortest_fixed(start: int, end: int, clockwise: bool = True) -> int:
+    """Rotate from start to the position end in one direction without full turns, in tenths"""
+    if clockwise:
+        return start + (end - start) % TURN
+    return start - (start - end) % TURN
@@ -0,0 +1,80 @@
+import time
+from typing import List, Dict, Any
+
+class CanvasBatch:
+    """Collect canvas commands for a frame and send them to Tcl in a single call"""
+
+    def __init__(self, canvas: Any, enabled: bool = True):
+        """
+        Initialize a canvas batch
+
+        Args:
+            canvas: The canvas the commands are sent to
+            enabled: Queue the commands into one Tcl script when True, call
+                the canvas directly for every command when False
+        """
+        self.canvas = canvas
+        self.enabled = enabled
+        self.commands: List[str] = []
+        self.frame_start = None
+        self.frames = 0
+        self.round_trips = 0
+        self.frame_round_trips = 0
+        self.frame_commands = 0
+        self.last_frame_round_trips = 0
+        self.last_frame_commands = 0
+        self.last_frame_ms = 0.0
+        self.total_frame_ms = 0.0
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        self.frame_start = time.perf_counter()
+
+    def coords(self, item: int, *coords: float):
+        """Move a canvas item to the given coordinates"""
+        self.frame_commands += 1
+        if not self.enabled:
+            self.canvas.coords(item, *coords)
+            self.frame_round_trips += 1
+            return
+
+        points = " ".join(f"{value:.2f}" for value in coords)
+        self.commands.append(f"{self.canvas} coords {item} {points}")
+
+    def call(self, *args: Any) -> Any:
+        """Run a Tcl command right away"""
+        self.frame_commands += 1
+        self.frame_round_trips += 1
+        return self.canvas.tk.call(*args)
+
+    def flush(self):
+        """Send the queued commands to Tcl and close the current frame"""
+        if self.commands:
+            script = "\n".join(self.commands)
+            self.commands = []
+            self.canvas.tk.eval(script)
+            self.frame_round_trips += 1
+
+        if self.frame_start is not None:
+            self.last_frame_ms = (time.perf_counter() - self.frame_start) * 1000
+            self.total_frame_ms += self.last_frame_ms
+            self.frame_start = None
+
+        self.frames += 1
+        self.round_trips += self.frame_round_trips
+        self.last_frame_round_trips = self.frame_round_trips
+        self.last_frame_commands = self.frame_commands
+        self.frame_round_trips = 0
+        self.frame_commands = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the round trip and frame time statistics"""
+        return {
+            "frames": self.frames,
+            "round_trips": self.round_trips,
+            "last_frame_round_trips": self.last_frame_round_trips,
+            "last_frame_commands": self.last_frame_commands,
+            "last_frame_ms": self.last_frame_ms,
+            "avg_frame_ms": self.total_frame_ms / self.frames if self.frames else 0.0,
+            "avg_round_trips": self.round_trips / self.frames if self.frames else 0.0,
+        }
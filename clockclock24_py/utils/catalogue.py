@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+"""
+ClockClock24 Python - Shape catalogue
+
+Compile shapes into one binary file of fixed-width angle arrays, and read
+them back through a memory map without copying.
+
+    python -m clockclock24_py.utils.catalogue build shapes.cc24
+    python -m clockclock24_py.utils.catalogue build custom.cc24 --json custom.json
+    python -m clockclock24_py.utils.catalogue list custom.cc24
+
+File layout, little-endian:
+    header   magic, version, number of shapes
+    index    per shape: name and type lengths, grid size, data offset, name, type
+    data     per clock of each shape: hours and minutes as uint16 tenths of a degree
+"""
+
+import argparse
+import array
+import json
+import mmap
+import struct
+import sys
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from clockclock24_py.utils.angles import to_fixed, to_degrees
+from clockclock24_py.utils.layout import NB_NUMBERS, NB_LINES, NB_CLOCKS_PER_LINE
+
+MAGIC = b"CC24SHP\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHI")
+ENTRY = struct.Struct("<BBHHHI")
+MAX_ANGLE = 0xFFFF
+
+# A catalogue entry: name, shape type and timer
+Entry = Tuple[str, str, List[List[List[Dict[str, Any]]]]]
+
+def encode_angle(angle: float) -> int:
+    """Convert an angle in degrees to tenths of a degree"""
+    value = to_fixed(angle)
+    if not 0 <= value <= MAX_ANGLE:
+        raise ValueError(f"Angle out of the catalogue range: {angle}")
+    return value
+
+def decode_angle(value: int) -> float:
+    """Convert tenths of a degree to an angle in degrees"""
+    return to_degrees(value)
+
+def get_builtin_entries(with_numbers: bool = True) -> List[Entry]:
+    """
+    Get the shapes of the shapes module, and the ten digits
+
+    The registered generators are stored as the shape they give for the
+    default grid, under the name of the generator.
+    """
+    from clockclock24_py.utils.timers import get_numbers, get_shapes, get_shape_name
+
+    entries = []
+    for shape_type, shape_list in get_shapes().SHAPE_TYPES.items():
+        names = getattr(shape_list, "names", None)
+        if names is not None:
+            entries.extend((name, shape_type, shape_list[index]) for index, name in enumerate(names))
+            shape_list = shape_list.generators
+        for shape in shape_list:
+            if callable(shape):
+                entries.append((shape.name, shape_type, shape(NB_NUMBERS, NB_LINES)))
+            else:
+                entries.append((get_shape_name(shape), shape_type, shape))
+    if with_numbers:
+        for digit, number in enumerate(get_numbers().NUMBERS):
+            entries.append((f"NUMBER_{digit}", "NUMBERS", [number]))
+    return entries
+
+def compile_catalogue(entries: Iterable[Entry]) -> bytes:
+    """Compile shapes into the binary catalogue format"""
+    entries = list(entries)
+    names = set()
+    index = []
+    data = array.array("H")
+    for name, shape_type, timer in entries:
+        if name in names:
+            raise ValueError(f"Duplicate shape name: {name}")
+        names.add(name)
+        nb_numbers = len(timer)
+        nb_lines = len(timer[0]) if timer else 0
+        nb_clocks = len(timer[0][0]) if nb_lines else 0
+        index.append((name.encode("utf-8"), shape_type.encode("utf-8"),
+                      nb_numbers, nb_lines, nb_clocks, len(data) * data.itemsize))
+        for number in timer:
+            if len(number) != nb_lines or any(len(line) != nb_clocks for line in number):
+                raise ValueError(f"Shape {name} is not a regular grid")
+            for line in number:
+                for clock in line:
+                    data.append(encode_angle(clock["hours"]))
+                    data.append(encode_angle(clock["minutes"]))
+
+    if sys.byteorder != "little":
+        data.byteswap()
+
+    index_size = sum(ENTRY.size + len(name) + len(shape_type)
+                     for name, shape_type, *_ in index)
+    # Align the data so that it can be viewed as an array of uint16
+    data_start = HEADER.size + index_size
+    padding = data_start % 2
+    data_start += padding
+
+    parts = [HEADER.pack(MAGIC, VERSION, len(index))]
+    for name, shape_type, nb_numbers, nb_lines, nb_clocks, offset in index:
+        parts.append(ENTRY.pack(len(name), len(shape_type), nb_numbers, nb_lines,
+                                nb_clocks, data_start + offset))
+        parts.append(name)
+        parts.append(shape_type)
+    parts.append(b"\0" * padding)
+    parts.append(data.tobytes())
+    return b"".join(parts)
+
+def write_catalogue(path: str, entries: Iterable[Entry]):
+    """Compile shapes and write the catalogue file"""
+    with open(path, "wb") as file:
+        file.write(compile_catalogue(entries))
+
+class Catalogue:
+    """A memory-mapped shape catalogue"""
+
+    def __init__(self, path: str):
+        """
+        Open a catalogue
+
+        Args:
+            path: The catalogue file
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.entries: Dict[str, Tuple[str, Tuple[int, int, int], int]] = {}
+        self.read_index()
+        self.buffer = memoryview(self.map)
+        self.angles = self.buffer[:len(self.map) // 2 * 2].cast("H")
+
+    def read_index(self):
+        """Read the shape names, types, sizes and offsets"""
+        magic, version, count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a shape catalogue: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported catalogue version {version}: {self.path}")
+        position = HEADER.size
+        for _ in range(count):
+            name_size, type_size, nb_numbers, nb_lines, nb_clocks, offset = (
+                ENTRY.unpack_from(self.map, position)
+            )
+            position += ENTRY.size
+            name = self.map[position:position + name_size].decode("utf-8")
+            position += name_size
+            shape_type = self.map[position:position + type_size].decode("utf-8")
+            position += type_size
+            self.entries[name] = (shape_type, (nb_numbers, nb_lines, nb_clocks), offset)
+
+    def __enter__(self) -> "Catalogue":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def close(self):
+        """Close the memory map, the views returned by get_angles must be released first"""
+        self.angles.release()
+        self.buffer.release()
+        self.map.close()
+
+    def get_names(self, shape_type: Optional[str] = None) -> List[str]:
+        """Get the shape names, optionally of a single type"""
+        return [
+            name for name, (entry_type, _, _) in self.entries.items()
+            if shape_type is None or entry_type == shape_type
+        ]
+
+    def get_shape_types(self) -> List[str]:
+        """Get the shape types in the catalogue order"""
+        return list(dict.fromkeys(entry_type for entry_type, _, _ in self.entries.values()))
+
+    def get_size(self, name: str) -> Tuple[int, int, int]:
+        """Get the numbers, lines and clocks per line of a shape"""
+        return self.entries[name][1]
+
+    def get_angles(self, name: str) -> Any:
+        """
+        Get the hours and minutes of every clock of a shape, in tenths of a degree
+
+        The result is a view on the memory map, in the order numbers, lines,
+        clocks, then hours and minutes.
+        """
+        _, (nb_numbers, nb_lines, nb_clocks), offset = self.entries[name]
+        start = offset // 2
+        view = self.angles[start:start + nb_numbers * nb_lines * nb_clocks * 2]
+        if sys.byteorder != "little":
+            values = array.array("H", view.tobytes())
+            values.byteswap()
+            return values
+        return view
+
+    def get_timer(self, name: str) -> List[List[List[Dict[str, Any]]]]:
+        """Build the timer of a shape"""
+        nb_numbers, nb_lines, nb_clocks = self.get_size(name)
+        angles = self.get_angles(name)
+        values = iter(angles)
+        timer = [
+            [
+                [
+                    {"hours": decode_angle(next(values)), "minutes": decode_angle(next(values))}
+                    for _ in range(nb_clocks)
+                ]
+                for _ in range(nb_lines)
+            ]
+            for _ in range(nb_numbers)
+        ]
+        if isinstance(angles, memoryview):
+            angles.release()
+        return timer
+
+class CatalogueShapes:
+    """The shapes of a type as a list whose timers are built when accessed"""
+
+    def __init__(self, catalogue: Catalogue, names: List[str]):
+        self.catalogue = catalogue
+        self.names = names
+        # Shape generators registered with this type, after the catalogue shapes
+        self.generators = []
+
+    def __len__(self) -> int:
+        return len(self.names) + len(self.generators)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < len(self.names):
+            return self.catalogue.get_timer(self.names[index])
+        return self.generators[index - len(self.names)]
+
+    def __iter__(self) -> Iterator[Any]:
+        for name in self.names:
+            yield self.catalogue.get_timer(name)
+        yield from self.generators
+
+    def extend(self, generators: Iterable[Any]):
+        """Add shape generators without building the catalogue shapes"""
+        self.generators.extend(generators)
+
+def register_catalogue(catalogue: Catalogue,
+                       shape_types: Optional[List[str]] = None) -> List[str]:
+    """
+    Make the shapes of a catalogue available to get_timers
+
+    Each shape type of the catalogue replaces the type of the same name in
+    SHAPE_TYPES, so a catalogue with LINEAR or SYMMETRICAL shapes changes the
+    shapes of the animation cycles.
+    """
+    from clockclock24_py.utils.timers import get_shapes
+
+    shape_types = shape_types or catalogue.get_shape_types()
+    for shape_type in shape_types:
+        get_shapes().SHAPE_TYPES[shape_type] = CatalogueShapes(
+            catalogue, catalogue.get_names(shape_type)
+        )
+    return shape_types
+
+def check_shape(name: str, timer: Any) -> List[List[List[Dict[str, Any]]]]:
+    """Check that a shape has the hours and minutes of every clock of the default grid"""
+    size = f"{NB_NUMBERS}x{NB_LINES}x{NB_CLOCKS_PER_LINE}"
+    if not isinstance(timer, list) or len(timer) != NB_NUMBERS:
+        raise ValueError(f"Shape {name} must be a {size} grid")
+    for number in timer:
+        if not isinstance(number, list) or len(number) != NB_LINES:
+            raise ValueError(f"Shape {name} must be a {size} grid")
+        for line in number:
+            if not isinstance(line, list) or len(line) != NB_CLOCKS_PER_LINE:
+                raise ValueError(f"Shape {name} must be a {size} grid")
+            for clock in line:
+                if not isinstance(clock, dict) or not {"hours", "minutes"} <= set(clock):
+                    raise ValueError(f"Shape {name} needs the hours and minutes of every clock")
+    return timer
+
+def load_json_entries(path: str) -> List[Entry]:
+    """Load shapes from a JSON file of {shape type: {name: timer}}, on the default grid"""
+    with open(path, encoding="utf-8") as file:
+        shape_types = json.load(file)
+    return [
+        (name, shape_type, check_shape(name, timer))
+        for shape_type, shape_list in shape_types.items()
+        for name, timer in shape_list.items()
+    ]
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Build or list a shape catalogue from the command line"""
+    parser = argparse.ArgumentParser(description="ClockClock24 shape catalogue")
+    commands = parser.add_subparsers(dest="command")
+    build = commands.add_parser("build", help="compile shapes into a catalogue")
+    build.add_argument("output", help="catalogue file to write")
+    build.add_argument("--json", action="append", default=[],
+                       help="JSON file of {shape type: {name: timer}}, instead of the built-in shapes")
+    build.add_argument("--no-numbers", action="store_true", help="leave out the ten digits")
+    listing = commands.add_parser("list", help="list the shapes of a catalogue")
+    listing.add_argument("catalogue", help="catalogue file to read")
+    options = parser.parse_args(args)
+
+    if options.command == "build":
+        if options.json:
+            entries = []
+            for path in options.json:
+                try:
+                    entries.extend(load_json_entries(path))
+                except (OSError, ValueError) as error:
+                    print(f"{path}: {error}", file=sys.stderr)
+                    return 1
+        else:
+            entries = get_builtin_entries(not options.no_numbers)
+        write_catalogue(options.output, entries)
+        print(f"{len(entries)} shapes written to {options.output}", file=sys.stderr)
+        return 0
+
+    if options.command == "list":
+        with Catalogue(options.catalogue) as catalogue:
+            for name in catalogue.get_names():
+                nb_numbers, nb_lines, nb_clocks = catalogue.get_size(name)
+                print(f"{catalogue.entries[name][0]:<12} {name:<24} "
+                      f"{nb_numbers}x{nb_lines}x{nb_clocks}")
+        return 0
+
+    parser.print_help()
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
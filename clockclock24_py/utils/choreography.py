@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+"""
+ClockClock24 Python - Choreographies
+
+Describe animation cycles in JSON and compile them once into engine sequences,
+cached by the hash of their content.
+
+    python -m clockclock24_py.utils.choreography show cycle.json
+
+A choreography is a list of steps, or an object with "steps" and defaults for
+"animation_time" and "delay":
+
+    {
+        "animation_time": 11000,
+        "steps": [
+            {"shape": "SQUARES", "direction": "reverse", "stagger": "radial", "easing": "start"},
+            {"wait": 3000},
+            {"repeat": 2, "steps": [{"shape": "WIND"}, {"shape": "OBLIQUES"}]},
+            {"time": true, "easing": "end"}
+        ]
+    }
+
+A choreography needs at least one time step, so that the clock shows the time.
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+from collections import OrderedDict
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
+
+from clockclock24_py.constants.config import ANIMATION_TIME, ANIMATION_DELAY
+from clockclock24_py.utils.delays import PATTERNS
+from clockclock24_py.utils.engine import (
+    ROTATIONS,
+    Sequence,
+    compute_sequences,
+    compute_timer,
+    describe_sequences,
+    wrap_timer
+)
+from clockclock24_py.utils.timeline import Timeline
+from clockclock24_py.utils.timers import get_shape, get_time_timer
+from clockclock24_py.utils.utils import get_max_animation_time
+
+CACHE_SIZE = 128
+DIRECTIONS = ("clockwise", "reverse")
+EASINGS = ("start", "end")
+STEP_KEYS = {
+    "shape": {"shape", "direction", "stagger", "delay", "animation_time", "easing", "rotation"},
+    "time": {"time", "direction", "stagger", "delay", "animation_time", "easing", "rotation"},
+    "wait": {"wait"},
+    "repeat": {"repeat", "steps"},
+}
+
+# A choreography as loaded from JSON
+Choreography = Union[List[Dict[str, Any]], Dict[str, Any]]
+
+def get_hash(choreography: Choreography) -> str:
+    """Get the sha256 of the canonical JSON of a choreography"""
+    content = json.dumps(choreography, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def get_step_kind(step: Dict[str, Any]) -> str:
+    """Get the kind of a step from its keys"""
+    if not isinstance(step, dict):
+        raise ValueError(f"A step must be an object: {step!r}")
+    kinds = [kind for kind in STEP_KEYS if kind in step]
+    if len(kinds) != 1:
+        raise ValueError(f"A step needs one of {', '.join(STEP_KEYS)}: {step!r}")
+    unknown = set(step) - STEP_KEYS[kinds[0]]
+    if unknown:
+        raise ValueError(f"Unknown keys in a {kinds[0]} step: {', '.join(sorted(unknown))}")
+    return kinds[0]
+
+def check_duration(value: Any, name: str) -> int:
+    """Check that a duration in milliseconds is a non-negative integer"""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"A {name} must be a non-negative integer: {value!r}")
+    return value
+
+def compile_move(step: Dict[str, Any], timer: Optional[List[List[List[Dict[str, Any]]]]],
+                 seq_type: str, defaults: Dict[str, Any]) -> Sequence:
+    """Compile a shape or time step"""
+    direction = step.get("direction", "clockwise")
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown direction {direction!r}, expected one of {DIRECTIONS}")
+    easing = step.get("easing")
+    if easing is not None and easing not in EASINGS:
+        raise ValueError(f"Unknown easing {easing!r}, expected one of {EASINGS}")
+    rotation = step.get("rotation")
+    if rotation is not None and rotation not in ROTATIONS:
+        raise ValueError(f"Unknown rotation {rotation!r}, expected one of {ROTATIONS}")
+
+    stagger = step.get("stagger")
+    if stagger is not None and not isinstance(stagger, str):
+        raise ValueError(f"A stagger must be a string: {stagger!r}")
+    pattern = None
+    if stagger is not None and stagger not in ("ltr", "rtl"):
+        if stagger.partition(":")[0] not in PATTERNS:
+            raise ValueError(f"Unknown stagger pattern: {stagger}")
+        pattern = stagger
+    delay = check_duration(step.get("delay", defaults["delay"] if stagger is not None else 0), "delay")
+    animation_time = check_duration(step.get("animation_time", defaults["animation_time"]),
+                                    "animation time")
+
+    return Sequence(
+        timer=timer,
+        seq_type=seq_type,
+        animation_time=animation_time,
+        delay=delay,
+        ltr=stagger != "rtl",
+        is_reverse=direction == "reverse",
+        animation_type=easing,
+        pattern=pattern,
+        rotation=rotation
+    )
+
+def compile_steps(steps: List[Dict[str, Any]], defaults: Dict[str, Any]) -> List[Sequence]:
+    """Compile steps into sequences, unrolling the repeats"""
+    if not isinstance(steps, list):
+        raise ValueError("The steps of a choreography must be a list")
+    sequences = []
+    for step in steps:
+        kind = get_step_kind(step)
+        if kind == "shape":
+            sequences.append(compile_move(step, get_shape(step["shape"]), "shape", defaults))
+        elif kind == "time":
+            if step["time"] is not True:
+                raise ValueError(f"A time step must be true: {step['time']!r}")
+            # The time is only known when the cycle starts
+            sequences.append(compile_move(step, None, "time", defaults))
+        elif kind == "wait":
+            sequences.append(Sequence(timer=None, seq_type="wait", animation_time=check_duration(step["wait"], "wait")))
+        else:
+            count = step["repeat"]
+            if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+                raise ValueError(f"A repeat count must be a positive integer: {count!r}")
+            sequences.extend(compile_steps(step["steps"], defaults) * count)
+    return sequences
+
+def get_time_index(sequences: List[Sequence]) -> int:
+    """Get the index of the first time step, the number of sequences without one"""
+    for index, seq in enumerate(sequences):
+        if seq.type == "time":
+            return index
+    return len(sequences)
+
+def compile_choreography(choreography: Choreography) -> Tuple[Sequence, ...]:
+    """Compile a choreography into engine sequences, without the cache"""
+    if isinstance(choreography, dict):
+        defaults = {
+            "animation_time": check_duration(choreography.get("animation_time", ANIMATION_TIME),
+                                             "animation time"),
+            "delay": check_duration(choreography.get("delay", ANIMATION_DELAY), "delay"),
+        }
+        steps = choreography.get("steps", [])
+    else:
+        defaults = {"animation_time": ANIMATION_TIME, "delay": ANIMATION_DELAY}
+        steps = choreography
+    sequences = tuple(compile_steps(steps, defaults))
+    if get_time_index(sequences) == len(sequences):
+        # Without it the clock would never show the time again
+        raise ValueError("A choreography needs a time step")
+    return sequences
+
+# Compiled choreographies by content hash, the least recently used first
+cache: "OrderedDict[str, Tuple[Sequence, ...]]" = OrderedDict()
+# Timer states of the steps before the first time step, by content and start timer hash
+timer_cache: "OrderedDict[Tuple[str, str], Tuple[List[List[List[Dict[str, Any]]]], ...]]" = OrderedDict()
+
+def get_cached(store: "OrderedDict[Any, Any]", key: Any, compute: Callable[[], Any]) -> Any:
+    """Get a value of a cache, computing it on a miss and dropping the least recently used"""
+    value = store.get(key)
+    if value is None:
+        value = compute()
+        store[key] = value
+        if len(store) > CACHE_SIZE:
+            store.popitem(last=False)
+    else:
+        store.move_to_end(key)
+    return value
+
+def get_compiled(choreography: Choreography) -> Tuple[Sequence, ...]:
+    """Get the compiled sequences of a choreography, compiled once per content"""
+    return get_cached(cache, get_hash(choreography), lambda: compile_choreography(choreography))
+
+def get_sequences(choreography: Choreography) -> List[Sequence]:
+    """Get the sequences of a choreography for a cycle starting now"""
+    sequences = []
+    for seq in get_compiled(choreography):
+        if seq.type == "time":
+            # The compiled sequences are shared, the time is set on a copy
+            seq = copy.copy(seq)
+            seq.timer = get_time_timer()
+        sequences.append(seq)
+    return sequences
+
+def run(prev_timer: List[List[List[Dict[str, Any]]]], choreography: Choreography,
+        sequences: Optional[List[Sequence]] = None) -> List[List[List[List[Dict[str, Any]]]]]:
+    """
+    Compute the timer states of a choreography, like engine.run
+
+    The states before the first time step only depend on the choreography and the
+    start timer, they are computed once per pair. The sequences of get_sequences
+    can be given when the caller already has them.
+    """
+    if sequences is None:
+        sequences = get_sequences(choreography)
+    index = get_time_index(sequences)
+    key = (get_hash(choreography), get_hash(prev_timer))
+    timers = list(get_cached(
+        timer_cache, key, lambda: tuple(compute_sequences(sequences[:index], prev_timer))
+    ))
+    current_timer = timers[-1] if timers else wrap_timer(prev_timer)
+    for seq in sequences[index:]:
+        current_timer = compute_timer(seq, current_timer)
+        timers.append(current_timer)
+    return timers
+
+def get_timeline(prev_timer: List[List[List[Dict[str, Any]]]],
+                 choreography: Choreography) -> Timeline:
+    """Compute a choreography into a timeline to sample the needles at any time"""
+    # The time changes every minute, only the timer states before it are cached
+    return Timeline(prev_timer, run(prev_timer, choreography))
+
+def load_choreography(path: str) -> Choreography:
+    """Load a choreography from a JSON file"""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Check a choreography file from the command line"""
+    parser = argparse.ArgumentParser(description="ClockClock24 choreographies")
+    commands = parser.add_subparsers(dest="command")
+    show = commands.add_parser("show", help="compile a choreography and describe its sequences")
+    show.add_argument("choreography", help="JSON file of the choreography")
+    options = parser.parse_args(args)
+
+    if options.command == "show":
+        try:
+            choreography = load_choreography(options.choreography)
+            sequences = get_sequences(choreography)
+        except (OSError, ValueError) as error:
+            print(f"{options.choreography}: {error}", file=sys.stderr)
+            return 1
+        timers = compute_sequences(sequences, get_time_timer())
+        description = describe_sequences(sequences)
+        description["hash"] = get_hash(choreography)
+        description["duration_ms"] = sum(get_max_animation_time(timer) for timer in timers)
+        json.dump(description, sys.stdout, indent=2)
+        print()
+        return 0
+
+    parser.print_help()
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
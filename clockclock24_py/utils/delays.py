@@ -0,0 +1,108 @@
+import functools
+import math
+import random
+from typing import List, Dict, Callable, Tuple
+
+from clockclock24_py.utils.generators import get_grid
+from clockclock24_py.utils.layout import NB_CLOCKS_PER_LINE
+
+# A pattern gets the x and y of a clock, the grid width and height and a seed,
+# and returns how many delay steps the clock waits before moving
+Pattern = Callable[[int, int, int, int, int], float]
+
+# Delay patterns by name
+PATTERNS: Dict[str, Pattern] = {}
+
+def register_pattern(name: str) -> Callable[[Pattern], Pattern]:
+    """Decorate a function to register it as a delay pattern"""
+    def decorator(function: Pattern) -> Pattern:
+        PATTERNS[name] = function
+        get_delay_field.cache_clear()
+        return function
+    return decorator
+
+def parse_pattern(pattern: str) -> Tuple[str, int]:
+    """Split a pattern setting like "random-wave:1" into the pattern name and its seed"""
+    name, _, seed = pattern.partition(":")
+    if name not in PATTERNS:
+        raise ValueError(f"Unknown delay pattern: {name}")
+    try:
+        return name, int(seed or 0)
+    except ValueError:
+        raise ValueError(f"Invalid seed of the delay pattern {pattern}: {seed}") from None
+
+def check_patterns(patterns: List[str]) -> List[str]:
+    """Check pattern settings before they are picked during a cycle"""
+    for pattern in patterns:
+        parse_pattern(pattern)
+    return list(patterns)
+
+@functools.lru_cache(maxsize=256)
+def get_delay_field(pattern: str, nb_numbers: int, nb_lines: int, animation_time: int,
+                    delay: int, seed: int = 0) -> Tuple[Tuple[int, int], ...]:
+    """
+    Get the animation delay and time of every clock of a grid, in the order of the timer
+
+    Every clock ends at the same time, animation_time plus one delay step per number,
+    like the left to right stagger.
+    """
+    function = PATTERNS[pattern]
+    width = nb_numbers * NB_CLOCKS_PER_LINE
+    total = animation_time + nb_numbers * delay
+    field = []
+    for x, y in zip(*get_grid(nb_numbers, nb_lines)):
+        animation_delay = round(function(x, y, width, nb_lines, seed) * delay)
+        field.append((animation_delay, total - animation_delay))
+    return tuple(field)
+
+def spread(ratio: float, width: int) -> float:
+    """Spread a ratio between 0 and 1 over the steps of the left to right pattern"""
+    return ratio * (width - 1)
+
+def get_distance_ratio(x: int, y: int, width: int, height: int) -> float:
+    """Get the distance of a clock to the center, 1 for the farthest clocks"""
+    center_x = (width - 1) / 2
+    center_y = (height - 1) / 2
+    return math.hypot(x - center_x, y - center_y) / (math.hypot(center_x, center_y) or 1)
+
+@register_pattern("ltr")
+def left_to_right(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return x
+
+@register_pattern("rtl")
+def right_to_left(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return width - x
+
+@register_pattern("ttb")
+def top_to_bottom(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return spread(y / max(1, height - 1), width)
+
+@register_pattern("btt")
+def bottom_to_top(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return spread(1 - y / max(1, height - 1), width)
+
+@register_pattern("diagonal")
+def diagonal(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return spread((x + y) / max(1, width + height - 2), width)
+
+@register_pattern("anti-diagonal")
+def anti_diagonal(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return spread((x + height - 1 - y) / max(1, width + height - 2), width)
+
+@register_pattern("radial")
+def radial(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return spread(get_distance_ratio(x, y, width, height), width)
+
+@register_pattern("inward")
+def inward(x: int, y: int, width: int, height: int, seed: int) -> float:
+    return spread(1 - get_distance_ratio(x, y, width, height), width)
+
+@register_pattern("random-wave")
+def random_wave(x: int, y: int, width: int, height: int, seed: int) -> float:
+    # The same seed always gives the same wave, so that the fields can be cached
+    generator = random.Random(seed)
+    angle = generator.uniform(0, 2 * math.pi)
+    phase = generator.uniform(0, 2 * math.pi)
+    frequency = 2 * math.pi / max(2, width / 2)
+    position = x * math.cos(angle) + y * math.sin(angle)
+    return spread((math.sin(position * frequency + phase) + 1) / 2, width)
@@ -1,12 +1,27 @@
 from typing import List, Dict, Any, Optional, Tuple, Union
 import copy
+import random
 
 from clockclock24_py.constants.config import ANIMATION_DELAY
-from clockclock24_py.utils.timers import get_time_timer, get_timers
+from clockclock24_py.utils.timers import get_time_timer, get_timers, get_shape_name
 from clockclock24_py.utils.utils import get_random_boolean
+from clockclock24_py.utils.delays import get_delay_field, parse_pattern
+from clockclock24_py.utils.motion import apply_motion_limits
+from clockclock24_py.utils import angles
+from clockclock24_py.utils.angles import (
+    TURN,
+    to_fixed,
+    to_degrees,
+    wrap_angle,
+    rotate_fixed,
+    rotate_reverse_fixed,
+    rotate_shortest_fixed
+)
 
 NB_NUMBERS = 4
 MIN_ROTATION = 180
+MIN_ROTATION_FIXED = to_fixed(MIN_ROTATION)
+ROTATIONS = ("travel", "peak")
 
 def is_neg(num: float) -> bool:
     """Check if a number is negative"""
@@ -14,27 +29,23 @@ def is_neg(num: float) -> bool:
 
 def round_rest(rest_rotation: float) -> float:
     """Round the rotation value"""
-    rest_round = abs(rest_rotation)
-    round_val = rest_round - 360 if rest_round >= 360 + MIN_ROTATION else rest_round
-    return -round_val if is_neg(rest_rotation) else round_val
+    return to_degrees(angles.round_rest(to_fixed(rest_rotation), MIN_ROTATION_FIXED))
 
 def get_start_position(start: float) -> float:
     """Get the normalized start position"""
-    if is_neg(start):
-        return 360 + (start % 360)
-    return start % 360
+    return to_degrees(angles.get_start_position(to_fixed(start)))
 
 def get_min_value(rest: float) -> float:
     """Get the minimum rotation value"""
     return 360 if rest == 0 else rest
 
 def rotate(start: float, end: float) -> float:
-    """Calculate rotation in clockwise direction"""
-    return start + round_rest(360 - (get_start_position(start) - end))
+    """Calculate rotation in clockwise direction, exactly in tenths of a degree"""
+    return to_degrees(rotate_fixed(to_fixed(start), to_fixed(end), MIN_ROTATION_FIXED))
 
 def rotate_reverse(start: float, end: float) -> float:
-    """Calculate rotation in counter-clockwise direction"""
-    return start + round_rest(-get_min_value(get_start_position(start)) + (end - 360))
+    """Calculate rotation in counter-clockwise direction, exactly in tenths of a degree"""
+    return to_degrees(rotate_reverse_fixed(to_fixed(start), to_fixed(end), MIN_ROTATION_FIXED))
 
 def update_clocks_properties(numbers: List[List[List[Dict[str, Any]]]], 
                            callback: callable) -> List[List[List[Dict[str, Any]]]]:
@@ -58,14 +69,33 @@ def set_clock_delay(clock: Dict[str, Any], x_pos: int, animation_time: int,
     return result
 
 def compute_delays(timer: List[List[List[Dict[str, Any]]]], animation_time: int, 
-                  delay: Optional[int] = None, rtl: bool = False) -> List[List[List[Dict[str, Any]]]]:
+                  delay: Optional[int] = None, rtl: bool = False,
+                  pattern: Optional[str] = None) -> List[List[List[Dict[str, Any]]]]:
     """Compute animation delays for all clocks"""
+    if pattern is not None:
+        return apply_delay_pattern(timer, animation_time, delay or 0, pattern)
+        
     def callback(clock, x_pos, _):
         actual_x_pos = NB_NUMBERS * 2 - x_pos if rtl else x_pos
         return set_clock_delay(clock, actual_x_pos, animation_time, delay or 0)
     
     return update_clocks_properties(timer, callback)
 
+def apply_delay_pattern(timer: List[List[List[Dict[str, Any]]]], animation_time: int,
+                        delay: int, pattern: str) -> List[List[List[Dict[str, Any]]]]:
+    """Set the animation delays and times of a delay pattern, cached per grid size"""
+    name, seed = parse_pattern(pattern)
+    field = iter(get_delay_field(
+        name, len(timer), len(timer[0]) if timer else 0, animation_time, delay, seed
+    ))
+    
+    def callback(clock, _, __):
+        result = dict(clock)
+        result["animation_delay"], result["animation_time"] = next(field)
+        return result
+    
+    return update_clocks_properties(timer, callback)
+
 def compute_animation_type(timer: List[List[List[Dict[str, Any]]]], 
                          animation_type: str) -> List[List[List[Dict[str, Any]]]]:
     """Set animation type for all clocks"""
@@ -78,19 +108,18 @@ def compute_animation_type(timer: List[List[List[Dict[str, Any]]]],
 
 def rotate_clock(clock: Dict[str, Any], current_clock: Dict[str, Any], 
                 is_minutes_reversed: bool = False) -> Dict[str, Any]:
-    """Calculate rotation for a clock"""
+    """Calculate rotation for a clock, in tenths of a degree until the result"""
     result = copy.deepcopy(clock)
     
-    current_hours = current_clock["hours"]
-    current_minutes = current_clock["minutes"]
+    current_hours = to_fixed(current_clock["hours"])
+    current_minutes = to_fixed(current_clock["minutes"])
     
-    result["hours"] = rotate(current_hours, clock["hours"])
+    hours = rotate_fixed(current_hours, to_fixed(clock["hours"]), MIN_ROTATION_FIXED)
+    rotate_minutes = rotate_reverse_fixed if is_minutes_reversed else rotate_fixed
+    minutes = rotate_minutes(current_minutes, to_fixed(clock["minutes"]), MIN_ROTATION_FIXED)
     
-    if is_minutes_reversed:
-        result["minutes"] = rotate_reverse(current_minutes, clock["minutes"])
-    else:
-        result["minutes"] = rotate(current_minutes, clock["minutes"])
-        
+    result["hours"] = to_degrees(hours)
+    result["minutes"] = to_degrees(minutes)
     return result
 
 def compute_rotation(timer: List[List[List[Dict[str, Any]]]], 
@@ -105,11 +134,74 @@ def compute_rotation(timer: List[List[List[Dict[str, Any]]]],
     
     return update_clocks_properties(timer, callback)
 
+def rotate_shortest(start: float, end: float, clockwise: bool = True) -> float:
+    """Calculate the shortest rotation to an angle in one direction, without full turns"""
+    return to_degrees(rotate_shortest_fixed(to_fixed(start), to_fixed(end), clockwise))
+
+def get_travel(timer: List[List[List[Dict[str, Any]]]],
+               current_timer: List[List[List[Dict[str, Any]]]]) -> List[float]:
+    """Get the degrees traveled by every needle between two timer states"""
+    return [
+        abs(clock[needle] - current_clock[needle])
+        for number, current_number in zip(timer, current_timer)
+        for line, current_line in zip(number, current_number)
+        for clock, current_clock in zip(line, current_line)
+        for needle in ("hours", "minutes")
+    ]
+
+def get_cycle_travel(timers: List[List[List[List[Dict[str, Any]]]]],
+                     start_timer: List[List[List[Dict[str, Any]]]]) -> float:
+    """Get the total degrees traveled by the needles over the timer states of a cycle"""
+    total = 0
+    for timer in timers:
+        total += sum(get_travel(timer, start_timer))
+        start_timer = timer
+    return total
+
+def rotate_minimal(start: float, end: float, clockwise: Optional[bool] = None) -> float:
+    """
+    Calculate the rotation of a needle to an angle with the least travel
+
+    Without a direction, the needle turns the shortest way, clockwise for half a turn.
+    It never makes full turns, which would only add travel.
+    """
+    start = to_fixed(start)
+    end = to_fixed(end)
+    if clockwise is None:
+        clockwise = (end - start) % TURN <= TURN // 2
+    return to_degrees(rotate_shortest_fixed(start, end, clockwise))
+
+def compute_minimal_rotation(timer: List[List[List[Dict[str, Any]]]],
+                             current_timer: List[List[List[Dict[str, Any]]]],
+                             is_minutes_reversed: bool = False,
+                             objective: str = "travel") -> List[List[List[Dict[str, Any]]]]:
+    """
+    Compute the rotation that reaches a shape with the least motor travel
+
+    The direction and the turns are chosen for each needle on its own. Reversed
+    minutes keep the hours clockwise and the minutes counter-clockwise, otherwise
+    every needle turns the shortest way. This minimizes both the total travel and
+    the longest travel of a needle, so the "travel" and "peak" objectives agree.
+    """
+    if objective not in ROTATIONS:
+        raise ValueError(f"Unknown rotation objective: {objective!r}")
+    hours_clockwise = True if is_minutes_reversed else None
+    minutes_clockwise = False if is_minutes_reversed else None
+    
+    def callback(clock, x_pos, y_pos):
+        current_clock = current_timer[x_pos // 2][y_pos][x_pos % 2]
+        result = copy.deepcopy(clock)
+        result["hours"] = rotate_minimal(current_clock["hours"], clock["hours"], hours_clockwise)
+        result["minutes"] = rotate_minimal(current_clock["minutes"], clock["minutes"], minutes_clockwise)
+        return result
+    
+    return update_clocks_properties(timer, callback)
+
 def reset_clock(clock: Dict[str, Any]) -> Dict[str, Any]:
     """Reset a clock to its base state"""
     result = copy.deepcopy(clock)
-    result["hours"] = result["hours"] % 360
-    result["minutes"] = result["minutes"] % 360
+    result["hours"] = wrap_angle(result["hours"])
+    result["minutes"] = wrap_angle(result["minutes"])
     result["animation_time"] = 0
     result["animation_delay"] = 0
     return result
@@ -118,11 +210,22 @@ def reset_timer(timer: List[List[List[Dict[str, Any]]]]) -> List[List[List[Dict[
     """Reset all clocks in a timer"""
     return update_clocks_properties(timer, lambda c, _, __: reset_clock(c))
 
+def wrap_timer(timer: List[List[List[Dict[str, Any]]]]) -> List[List[List[Dict[str, Any]]]]:
+    """Drop the whole turns of the needles, keeping the animation settings"""
+    def callback(clock, _, __):
+        result = dict(clock)
+        result["hours"] = wrap_angle(clock["hours"])
+        result["minutes"] = wrap_angle(clock["minutes"])
+        return result
+    
+    return update_clocks_properties(timer, callback)
+
 class Sequence:
     """A sequence of timer animations"""
     
     def __init__(self, timer, seq_type="shape", animation_time=0, delay=0, 
-                ltr=True, is_reverse=False, animation_type=None):
+                ltr=True, is_reverse=False, animation_type=None, pattern=None,
+                rotation=None):
         self.timer = timer
         self.type = seq_type
         self.animation_time = animation_time
@@ -130,28 +233,40 @@ class Sequence:
         self.ltr = not ltr
         self.is_reverse = is_reverse
         self.animation_type = animation_type
+        self.pattern = pattern
+        self.rotation = rotation
 
 def compute_timer(seq: Sequence, current_timer: List[List[List[Dict[str, Any]]]]) -> List[List[List[Dict[str, Any]]]]:
     """Compute the next timer state based on a sequence"""
     if seq.type == "wait":
         return compute_delays(current_timer, seq.animation_time, 0)
     
-    next_timer_state = compute_rotation(
-        seq.timer, 
-        current_timer, 
-        seq.is_reverse
-    )
+    if seq.rotation:
+        next_timer_state = compute_minimal_rotation(
+            seq.timer, current_timer, seq.is_reverse, seq.rotation
+        )
+    else:
+        next_timer_state = compute_rotation(
+            seq.timer, 
+            current_timer, 
+            seq.is_reverse
+        )
     
     if seq.animation_type:
         next_timer_state = compute_animation_type(next_timer_state, seq.animation_type)
         
-    return compute_delays(next_timer_state, seq.animation_time, seq.delay, seq.ltr)
+    return compute_delays(next_timer_state, seq.animation_time, seq.delay, seq.ltr, seq.pattern)
 
 def compute_sequences(sequences: List[Sequence], 
                     last_timer: List[List[List[Dict[str, Any]]]]) -> List[List[List[Dict[str, Any]]]]:
-    """Compute a sequence of timer states"""
+    """
+    Compute a sequence of timer states
+    
+    The rotations start from the needle positions without their whole turns, so the
+    angles stay bounded even when the previous cycle was not reset.
+    """
     result = []
-    current_timer = last_timer
+    current_timer = wrap_timer(last_timer)
     
     for seq in sequences:
         next_timer = compute_timer(seq, current_timer)
@@ -164,10 +279,11 @@ def get_wait_sequence(timer: List[List[List[Dict[str, Any]]]]) -> Sequence:
     """Create a wait sequence"""
     return Sequence(timer=timer, seq_type="wait", animation_time=3000)
 
-def run(prev_timer: List[List[List[Dict[str, Any]]]], 
-       options: Dict[str, Any]) -> List[List[List[Dict[str, Any]]]]:
-    """Run the animation sequence"""
+def get_sequences(options: Dict[str, Any]) -> List[Sequence]:
+    """Choose the shapes, directions and delays of an animation cycle"""
     animation_time = options.get("animation_time", 0)
+    delay_patterns = options.get("delay_patterns")
+    rotation = options.get("rotation")
     is_reverse = get_random_boolean()
     
     timer_sequences = []
@@ -184,13 +300,16 @@ def run(prev_timer: List[List[List[Dict[str, Any]]]],
             animation_type = "end"
         
         # Create sequence
+        delay = ANIMATION_DELAY if index == 0 and get_random_boolean() else 0
         sequence = Sequence(
             timer=timer,
             seq_type="shape",
             animation_time=animation_time,
-            delay=ANIMATION_DELAY if index == 0 and get_random_boolean() else 0,
+            delay=delay,
             is_reverse=is_reverse,
-            animation_type=animation_type
+            animation_type=animation_type,
+            pattern=random.choice(delay_patterns) if delay and delay_patterns else None,
+            rotation=rotation
         )
         
         timer_sequences.append(sequence)
@@ -206,8 +325,29 @@ def run(prev_timer: List[List[List[Dict[str, Any]]]],
             seq_type="time",
             animation_time=animation_time,
             is_reverse=is_reverse,
-            animation_type="end"
+            animation_type="end",
+            rotation=rotation
         )
     )
     
-    return compute_sequences(timer_sequences, prev_timer) 
\ No newline at end of file
+    return timer_sequences
+
+def describe_sequences(sequences: List[Sequence]) -> Dict[str, Any]:
+    """Get the shapes, direction and delays of a cycle for the event log"""
+    return {
+        "shapes": [
+            seq.type if seq.type != "shape" else get_shape_name(seq.timer)
+            for seq in sequences
+        ],
+        "is_reverse": any(seq.is_reverse for seq in sequences),
+        "delays": [seq.delay for seq in sequences],
+        "patterns": [seq.pattern for seq in sequences],
+    }
+
+def run(prev_timer: List[List[List[Dict[str, Any]]]], 
+       options: Dict[str, Any]) -> List[List[List[Dict[str, Any]]]]:
+    """Run the animation sequence"""
+    timers = compute_sequences(get_sequences(options), prev_timer)
+    if options.get("motion_limits"):
+        timers, _ = apply_motion_limits(timers, wrap_timer(prev_timer), options["motion_limits"])
+    return timers
\ No newline at end of file
@@ -0,0 +1,70 @@
+import collections
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import List, Dict, Any, Optional
+
+# Events kept in memory, the oldest are dropped first
+EVENT_LOG_SIZE = 1000
+
+def get_default_path() -> str:
+    """Get a new path for an event dump in the temporary directory"""
+    name = time.strftime("clockclock24-%Y%m%d-%H%M%S.jsonl")
+    return os.path.join(tempfile.gettempdir(), name)
+
+class EventLog:
+    """A fixed-size ring buffer of structured events"""
+
+    def __init__(self, size: int = EVENT_LOG_SIZE):
+        """
+        Initialize an event log
+
+        Args:
+            size: The number of events kept, the oldest are dropped first
+        """
+        # Appending to a bounded deque never takes a lock nor grows the memory
+        self.events = collections.deque(maxlen=size)
+        self.count = 0
+
+    def record(self, event_type: str, **fields: Any):
+        """Record an event with the current time"""
+        self.count += 1
+        self.events.append({"time": time.time(), "type": event_type, **fields})
+
+    def get_events(self, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get a copy of the events, optionally of a single type"""
+        events = list(self.events)
+        if event_type is None:
+            return events
+        return [event for event in events if event["type"] == event_type]
+
+    def get_dropped(self) -> int:
+        """Get the number of events dropped to keep the buffer size"""
+        return self.count - len(self.events)
+
+    def write(self, path: str, events: Optional[List[Dict[str, Any]]] = None):
+        """Write the events as JSON Lines"""
+        if events is None:
+            events = self.get_events()
+        with open(path, "w", encoding="utf-8") as file:
+            for event in events:
+                file.write(json.dumps(event, default=str))
+                file.write("\n")
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """Write a copy of the events in a background thread and return the path"""
+        path = path or get_default_path()
+        events = self.get_events()
+
+        def write():
+            self.write(path, events)
+            print(f"Events written to {path}", file=sys.stderr)
+
+        threading.Thread(target=write, daemon=True).start()
+        return path
+
+# The log every cycle records its events to
+log = EventLog()
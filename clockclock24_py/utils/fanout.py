@@ -0,0 +1,181 @@
+from typing import List, Dict, Any, Callable, Optional
+
+from clockclock24_py.constants.config import ANIMATION_TIME, SAMPLE_INTERVAL
+from clockclock24_py.utils import events
+from clockclock24_py.utils.engine import reset_timer
+from clockclock24_py.utils.planning import get_remaining_time, get_timeline, plan_cycle
+from clockclock24_py.utils.timeline import Timeline
+from clockclock24_py.utils.timers import get_time_timer
+from clockclock24_py.utils.utils import Timeout, get_time_ms, start_timeout
+
+# Runs a function after a delay in milliseconds, like root.after
+Schedule = Callable[[int, Callable[[], Any]], Any]
+
+def schedule_timeout(time_ms: int, function: Callable[[], Any]) -> Timeout:
+    """Run a function after a delay with a Timeout, for renderers without a main loop"""
+    timeout = Timeout(time_ms)
+    timeout.then(function)
+    return timeout.start()
+
+class SamplingRenderer:
+    """A display that samples the shared timeline at its own frame rate"""
+
+    def __init__(self, draw: Callable[[List[List[List[Dict[str, Any]]]]], Any],
+                 schedule: Schedule = schedule_timeout, frame_ms: int = SAMPLE_INTERVAL):
+        """
+        Initialize a sampling renderer
+
+        Args:
+            draw: Shows the needle angles of a timer
+            schedule: Runs a function after a delay on the thread of the display
+            frame_ms: The time between two sampled frames
+        """
+        self.draw = draw
+        self.schedule = schedule
+        self.frame_ms = frame_ms
+        self.timeline = None
+        self.cycle_start = 0
+        self.is_sampling = False
+        self.frame_count = 0
+
+    def start_cycle(self, timeline: Timeline, start_ms: float):
+        """Follow the timeline of a cycle that started at a time of get_time_ms"""
+        self.timeline = timeline
+        self.cycle_start = start_ms
+        if not self.is_sampling:
+            # The core may call from its timeout thread, the frames are drawn by schedule
+            self.is_sampling = True
+            self.schedule(0, self.sample)
+
+    def sample(self):
+        """Draw the needles at the current time and schedule the next frame"""
+        timeline = self.timeline
+        if timeline is None:
+            self.is_sampling = False
+            return
+        elapsed = get_time_ms() - self.cycle_start
+        self.draw(timeline.state_at(elapsed))
+        self.frame_count += 1
+        if elapsed < timeline.duration:
+            self.schedule(self.frame_ms, self.sample)
+        else:
+            self.is_sampling = False
+
+    def stop(self):
+        """Stop sampling after the current frame"""
+        self.timeline = None
+
+    def end_cycle(self, timer: List[List[List[Dict[str, Any]]]]):
+        """Show the timer the needles rest at between two cycles"""
+        self.timeline = None
+        self.schedule(0, lambda: self.draw(timer))
+
+class DisplayCore:
+    """Plan each cycle once and fan its timeline out to any number of renderers"""
+
+    def __init__(self, animation_time: int = ANIMATION_TIME,
+                 options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a display core
+
+        Args:
+            animation_time: The animation time of the shapes
+            options: The other planning options, from planning.get_plan_options
+        """
+        self.options = dict(options or {}, animation_time=animation_time)
+        self.renderers: List[SamplingRenderer] = []
+        self.timer = get_time_timer()
+        self.timeline = None
+        self.cycle_start = 0
+        self.cycle_count = 0
+        self.is_running = False
+        self.timeout = None
+        self.cycle_timeout = None
+
+    def add_renderer(self, renderer: SamplingRenderer) -> SamplingRenderer:
+        """Add a renderer, which joins the running cycle if there is one"""
+        self.renderers.append(renderer)
+        if self.timeline is not None:
+            renderer.start_cycle(self.timeline, self.cycle_start)
+        else:
+            renderer.end_cycle(self.timer)
+        return renderer
+
+    def remove_renderer(self, renderer: SamplingRenderer):
+        """Stop sending the cycles to a renderer"""
+        self.renderers.remove(renderer)
+        renderer.stop()
+
+    def start(self, time_ms: int = 1000) -> "DisplayCore":
+        """Start the first cycle after a delay"""
+        self.start_next_cycle(time_ms)
+        return self
+
+    def stop(self):
+        """Cancel the running and the next cycles"""
+        for timeout in (self.timeout, self.cycle_timeout):
+            if timeout:
+                timeout.cancel()
+        self.timeout = None
+        self.cycle_timeout = None
+        self.is_running = False
+
+    def start_next_cycle(self, time_ms: int, is_minute: bool = False):
+        """Start a cycle after a delay"""
+        if self.timeout:
+            self.timeout.cancel()
+        self.timeout = start_timeout(time_ms)
+        self.timeout.then(lambda: self.start_cycle(is_minute=is_minute))
+
+    def interrupt_cycle(self):
+        """Cancel the running cycle and keep the needles where they are at this moment"""
+        events.log.record("interrupt", cycle=self.cycle_count)
+        if self.cycle_timeout:
+            self.cycle_timeout.cancel()
+            self.cycle_timeout = None
+        if self.timeline is not None:
+            self.timer = self.timeline.state_at(get_time_ms() - self.cycle_start)
+        self.is_running = False
+
+    def start_cycle(self, is_minute: bool = False, interrupt: bool = False):
+        """
+        Plan a cycle and send its timeline to every renderer
+
+        Args:
+            is_minute: The cycle was started for a minute change
+            interrupt: Retarget a running cycle from the current needle angles
+                instead of skipping the new one
+        """
+        if self.is_running:
+            if not interrupt:
+                events.log.record("skip", cycle=self.cycle_count, reason="running")
+                return
+            self.interrupt_cycle()
+        if self.timeout:
+            self.timeout.cancel()
+            self.timeout = None
+
+        # The core only counts as running once the cycle is planned
+        cycle = self.cycle_count + 1
+        sequences = plan_cycle(self.timer, cycle, self.options, is_minute)
+        self.is_running = True
+        self.cycle_count = cycle
+
+        events.log.record("animation_start", cycle=cycle)
+        self.timeline = get_timeline(self.timer, sequences)
+        self.cycle_start = get_time_ms()
+        for renderer in list(self.renderers):
+            renderer.start_cycle(self.timeline, self.cycle_start)
+
+        def on_complete():
+            if sequences:
+                self.timer = reset_timer(sequences[-1])
+            self.timeline = None
+            for renderer in list(self.renderers):
+                renderer.end_cycle(self.timer)
+            events.log.record("animation_end", cycle=cycle)
+            self.is_running = False
+            self.start_next_cycle(get_remaining_time(), True)
+
+        self.cycle_timeout = start_timeout(self.timeline.duration)
+        self.cycle_timeout.then(on_complete)
@@ -0,0 +1,138 @@
+import functools
+import math
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from clockclock24_py.utils.layout import NB_NUMBERS, NB_LINES, NB_CLOCKS_PER_LINE
+
+# A generator function gets the x and y of every clock of the grid, the grid
+# width and height, and returns the hours and the minutes of every clock
+GridFunction = Callable[..., Tuple[List[float], List[float]]]
+
+def normalize_angle(angle: float) -> int:
+    """Round an angle to a degree in ]0, 360], the shapes use 360 for the top"""
+    return round(angle) % 360 or 360
+
+def get_direction(dx: float, dy: float) -> float:
+    """Get the angle of a vector, clockwise from the top with y going down"""
+    return math.degrees(math.atan2(dx, -dy))
+
+@functools.lru_cache(maxsize=32)
+def get_grid(nb_numbers: int, nb_lines: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Get the x and y of every clock, in the order of the timer"""
+    xs = []
+    ys = []
+    for number_idx in range(nb_numbers):
+        for line_idx in range(nb_lines):
+            for clock_idx in range(NB_CLOCKS_PER_LINE):
+                xs.append(number_idx * NB_CLOCKS_PER_LINE + clock_idx)
+                ys.append(line_idx)
+    return tuple(xs), tuple(ys)
+
+def wave(xs: List[int], ys: List[int], width: int, height: int,
+         amplitude: float = 40, wavelength: float = 8,
+         base: float = 90) -> Tuple[List[float], List[float]]:
+    """Lines that follow a sine wave along x"""
+    step = 2 * math.pi / wavelength
+    hours = [base + amplitude * math.sin(x * step) for x in xs]
+    return hours, [angle + 180 for angle in hours]
+
+def spiral(xs: List[int], ys: List[int], width: int, height: int,
+           twist: float = 30) -> Tuple[List[float], List[float]]:
+    """Needles turning around the center, more with the distance"""
+    center_x = (width - 1) / 2
+    center_y = (height - 1) / 2
+    hours = [
+        get_direction(x - center_x, y - center_y) + 90
+        + twist * math.hypot(x - center_x, y - center_y)
+        for x, y in zip(xs, ys)
+    ]
+    return hours, hours
+
+def burst(xs: List[int], ys: List[int], width: int, height: int) -> Tuple[List[float], List[float]]:
+    """Needles pointing away from the center"""
+    center_x = (width - 1) / 2
+    center_y = (height - 1) / 2
+    hours = [get_direction(x - center_x, y - center_y) for x, y in zip(xs, ys)]
+    return hours, hours
+
+def rotation(xs: List[int], ys: List[int], width: int, height: int,
+             step: float = 22.5, start: float = 0) -> Tuple[List[float], List[float]]:
+    """Lines rotating a little more at each column and line"""
+    hours = [start + step * (x + y) for x, y in zip(xs, ys)]
+    return hours, [angle + 180 for angle in hours]
+
+class ShapeGenerator:
+    """A shape computed from the grid coordinates of the clocks, for any grid size"""
+
+    def __init__(self, name: str, function: GridFunction, **params: Any):
+        """
+        Initialize a shape generator
+
+        Args:
+            name: The name of the shape
+            function: Computes the angles of every clock of the grid at once
+            params: The parameters of the function
+        """
+        self.name = name
+        self.function = function
+        self.params = params
+        self.cache: Dict[Tuple[int, int], List[List[List[Dict[str, Any]]]]] = {}
+
+    def __repr__(self) -> str:
+        return f"ShapeGenerator({self.name!r})"
+
+    def __call__(self, nb_numbers: int = NB_NUMBERS,
+                 nb_lines: int = NB_LINES) -> List[List[List[Dict[str, Any]]]]:
+        """Get the shape for a grid size, computed once per size"""
+        size = (nb_numbers, nb_lines)
+        timer = self.cache.get(size)
+        if timer is None:
+            timer = self.generate(nb_numbers, nb_lines)
+            self.cache[size] = timer
+        return timer
+
+    def generate(self, nb_numbers: int, nb_lines: int) -> List[List[List[Dict[str, Any]]]]:
+        """Compute the shape for a grid size"""
+        xs, ys = get_grid(nb_numbers, nb_lines)
+        hours, minutes = self.function(
+            xs, ys, nb_numbers * NB_CLOCKS_PER_LINE, nb_lines, **self.params
+        )
+        clocks = iter([
+            {"hours": normalize_angle(hour), "minutes": normalize_angle(minute)}
+            for hour, minute in zip(hours, minutes)
+        ])
+        return [
+            [[next(clocks) for _ in range(NB_CLOCKS_PER_LINE)] for _ in range(nb_lines)]
+            for _ in range(nb_numbers)
+        ]
+
+    def is_generated(self, timer: List[List[List[Dict[str, Any]]]]) -> bool:
+        """Check if a timer was computed by this generator"""
+        return any(timer is cached for cached in self.cache.values())
+
+# Built-in generators by the shape type they are registered into
+GENERATORS = {
+    "LINEAR": [
+        ShapeGenerator("WAVE", wave),
+        ShapeGenerator("ROTATION", rotation),
+    ],
+    "SYMMETRICAL": [
+        ShapeGenerator("SPIRAL", spiral),
+        ShapeGenerator("BURST", burst),
+    ],
+}
+
+def register_generators(generators: Optional[Dict[str, List[ShapeGenerator]]] = None):
+    """Add generators to the shapes that get_timers picks from"""
+    from clockclock24_py.utils.timers import get_shapes
+
+    shape_types = get_shapes().SHAPE_TYPES
+    for shape_type, shape_list in (generators or GENERATORS).items():
+        current = shape_types.get(shape_type, [])
+        # Keep the shapes of a catalogue lazy, only its generators are compared
+        registered = getattr(current, "generators", current)
+        new = [generator for generator in shape_list if generator not in registered]
+        if isinstance(current, list):
+            shape_types[shape_type] = current + new
+        else:
+            current.extend(new)
@@ -0,0 +1,143 @@
+import json
+import time
+from typing import List, Dict, Any, Optional
+
+# Upper bounds of the histogram buckets in milliseconds, the last one catches the rest
+BUCKET_BOUNDS = [1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000, 5000, float("inf")]
+
+# The active frame recorder, None while recording is disabled
+recorder = None
+
+class Histogram:
+    """A fixed-size histogram of durations in milliseconds"""
+
+    def __init__(self, bounds: List[float] = BUCKET_BOUNDS):
+        """
+        Initialize a histogram
+
+        Args:
+            bounds: The upper bound of each bucket, in increasing order
+        """
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        """Add a value to the histogram"""
+        index = 0
+        while value > self.bounds[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, ratio: float) -> float:
+        """Get the upper bound of the bucket holding the given quantile"""
+        if not self.count:
+            return 0.0
+        rank = ratio * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the count, mean, quantiles and buckets of the histogram"""
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": self.max,
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(self.bounds, self.counts)
+            },
+        }
+
+class FrameRecorder:
+    """Record frame durations, gaps between frames and deadline misses"""
+
+    def __init__(self, deadline_ms: float = 50):
+        """
+        Initialize a frame recorder
+
+        Args:
+            deadline_ms: The time a frame may take before it counts as missed
+        """
+        self.deadline_ms = deadline_ms
+        self.histograms = {
+            "frame": Histogram(),
+            "gap": Histogram(),
+            "number_update": Histogram(),
+            "clock_update": Histogram(),
+        }
+        self.deadline_misses = 0
+        self.last_frame_start = None
+        self.started = time.time()
+
+    def add(self, name: str, start: float):
+        """Record the duration of a step started at the given perf_counter time"""
+        self.histograms[name].add((time.perf_counter() - start) * 1000)
+
+    def begin_frame(self) -> float:
+        """Record the gap since the previous frame and return the frame start"""
+        start = time.perf_counter()
+        if self.last_frame_start is not None:
+            self.histograms["gap"].add((start - self.last_frame_start) * 1000)
+        self.last_frame_start = start
+        return start
+
+    def end_frame(self, start: float):
+        """Record the duration of a frame and whether it missed its deadline"""
+        duration = (time.perf_counter() - start) * 1000
+        self.histograms["frame"].add(duration)
+        if duration > self.deadline_ms:
+            self.deadline_misses += 1
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get a summary of everything recorded so far"""
+        return {
+            "since": self.started,
+            "deadline_ms": self.deadline_ms,
+            "deadline_misses": self.deadline_misses,
+            **{name: histogram.get_summary() for name, histogram in self.histograms.items()},
+        }
+
+    def format_summary(self) -> str:
+        """Get a short human readable summary"""
+        lines = [f"deadline misses: {self.deadline_misses} (> {self.deadline_ms} ms)"]
+        for name, histogram in self.histograms.items():
+            summary = histogram.get_summary()
+            lines.append(
+                f"{name:<14} n={summary['count']:<8} mean={summary['mean_ms']:.2f} "
+                f"p50={summary['p50_ms']:.2f} p90={summary['p90_ms']:.2f} "
+                f"p99={summary['p99_ms']:.2f} max={summary['max_ms']:.2f} ms"
+            )
+        return "\n".join(lines)
+
+    def write_summary(self, path: str, extra: Optional[Dict[str, Any]] = None):
+        """Write the summary to a JSON file"""
+        summary = self.get_summary()
+        if extra:
+            summary.update(extra)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+
+def enable(deadline_ms: float = 50) -> FrameRecorder:
+    """Start recording frame timings"""
+    global recorder
+    recorder = FrameRecorder(deadline_ms)
+    return recorder
+
+def disable():
+    """Stop recording frame timings"""
+    global recorder
+    recorder = None
@@ -0,0 +1,121 @@
+from typing import List, Dict, Any, Iterator, Tuple
+
+from clockclock24_py.constants.config import (
+    CLOCK_MAX_SIZE,
+    CLOCK_PADDING,
+    GLOBAL_PADDING_CLOCK
+)
+
+NB_NUMBERS = 4
+NB_LINES = 3
+NB_CLOCKS_PER_LINE = 2
+LABEL_SPACE = 80  # Space for labels
+MIN_CLOCK_SIZE = 30
+
+def get_nb_colons(nb_numbers: int) -> int:
+    """Get the number of colons drawn between pairs of numbers"""
+    return max(0, (nb_numbers + 1) // 2 - 1)
+
+def get_clock_size(window_width: float, window_height: float,
+                   nb_numbers: int = NB_NUMBERS, nb_lines: int = NB_LINES,
+                   label_space: float = LABEL_SPACE,
+                   min_size: float = MIN_CLOCK_SIZE) -> float:
+    """Calculate the appropriate clock size based on window dimensions"""
+    # Calculate available width for all numbers (each with 2 clocks side by side)
+    # Total width = clocks in a row + spacing between hours and minutes
+    horizontal_clocks = nb_numbers * NB_CLOCKS_PER_LINE
+    horizontal_padding = GLOBAL_PADDING_CLOCK * 2  # Left and right padding
+    horizontal_spacing = CLOCK_PADDING * (horizontal_clocks - 1)  # Between clocks
+    colon_spacing = CLOCK_PADDING * 4 * get_nb_colons(nb_numbers)  # Extra space for colons
+
+    available_width = window_width - horizontal_padding - horizontal_spacing - colon_spacing
+    clock_size_width = available_width / horizontal_clocks
+
+    # Calculate available height for the clocks of a number vertically
+    vertical_padding = GLOBAL_PADDING_CLOCK * 2  # Top and bottom padding
+    vertical_spacing = CLOCK_PADDING * (nb_lines - 1)  # Between clocks
+
+    available_height = window_height - vertical_padding - vertical_spacing - label_space
+    clock_size_height = available_height / nb_lines
+
+    # Use the smaller size to ensure everything fits
+    clock_size = min(clock_size_width, clock_size_height, CLOCK_MAX_SIZE)
+
+    return max(clock_size, min_size)
+
+def get_number_size(clock_size: float, nb_lines: int = NB_LINES) -> Tuple[float, float]:
+    """Get the width and height of a number"""
+    return (NB_CLOCKS_PER_LINE * (clock_size + CLOCK_PADDING),
+            nb_lines * (clock_size + CLOCK_PADDING))
+
+def get_number_positions(width: float, height: float, clock_size: float,
+                         nb_numbers: int = NB_NUMBERS,
+                         nb_lines: int = NB_LINES) -> List[Tuple[float, float]]:
+    """Get the top-left corner of every number, centered in the given area"""
+    number_width, number_height = get_number_size(clock_size, nb_lines)
+
+    # Add spacing between each pair of numbers (colon space)
+    colon_spacing = clock_size
+
+    total_width = nb_numbers * number_width + get_nb_colons(nb_numbers) * colon_spacing
+    start_x = (width - total_width) / 2
+    start_y = (height - number_height) / 2
+
+    return [
+        (start_x + i * number_width + (i // 2) * colon_spacing, start_y)
+        for i in range(nb_numbers)
+    ]
+
+def get_colon_dots(width: float, height: float, clock_size: float,
+                   nb_numbers: int = NB_NUMBERS,
+                   nb_lines: int = NB_LINES) -> List[Tuple[float, float, float]]:
+    """Get the center and radius of the colon dots between pairs of numbers"""
+    number_width, number_height = get_number_size(clock_size, nb_lines)
+    positions = get_number_positions(width, height, clock_size, nb_numbers, nb_lines)
+    colon_spacing = clock_size
+    dot_radius = clock_size / 8
+    dot_spacing = clock_size / 3
+
+    dots = []
+    for colon in range(1, get_nb_colons(nb_numbers) + 1):
+        number_x, number_y = positions[colon * 2 - 1]
+        colon_x = number_x + number_width + colon_spacing / 2
+        middle_y = number_y + number_height / 2
+        dots.append((colon_x, middle_y - dot_spacing, dot_radius))
+        dots.append((colon_x, middle_y + dot_spacing, dot_radius))
+    return dots
+
+def get_clock_center(number_x: float, number_y: float, line_idx: int,
+                     clock_idx: int, clock_size: float) -> Tuple[float, float]:
+    """Get the center of a clock inside a number"""
+    return (number_x + clock_idx * (clock_size + CLOCK_PADDING) + clock_size / 2,
+            number_y + line_idx * (clock_size + CLOCK_PADDING) + clock_size / 2)
+
+def get_needle_sizes(clock_size: float) -> Tuple[float, float, float]:
+    """Get the width, hours length and minutes length of the needles"""
+    needle_width = max(2, clock_size / 25)  # Ensure needle is visible
+    hours_needle_length = clock_size * 0.35  # Shorter hour hand
+    minutes_needle_length = clock_size * 0.45  # Longer minute hand
+    return needle_width, hours_needle_length, minutes_needle_length
+
+def get_center_dot_size(clock_size: float) -> float:
+    """Get the diameter of the dot in the middle of a clock"""
+    return max(3, clock_size / 20)
+
+def iter_clocks(timer: List[List[List[Dict[str, Any]]]],
+                positions: List[Tuple[float, float]],
+                clock_size: float) -> Iterator[Tuple[float, float, Dict[str, Any]]]:
+    """Iterate over the center and data of every clock in the timer"""
+    for (number_x, number_y), number in zip(positions, timer):
+        for line_idx, line in enumerate(number):
+            for clock_idx, clock in enumerate(line):
+                x, y = get_clock_center(number_x, number_y, line_idx, clock_idx, clock_size)
+                yield x, y, clock
+
+def get_grid_size(timer: List[List[List[Dict[str, Any]]]]) -> Tuple[int, int]:
+    """Get the number of numbers and lines of a timer"""
+    return len(timer), len(timer[0]) if timer else 0
+
+def get_nb_clocks(timer: List[List[List[Dict[str, Any]]]]) -> int:
+    """Count the clocks in a timer"""
+    return sum(len(line) for number in timer for line in number)
@@ -0,0 +1,188 @@
+import collections
+import os
+import time
+from typing import List, Dict, Any, Callable, Optional
+
+from clockclock24_py.utils.utils import get_pending_timeouts
+
+# Quantiles exported by the summaries
+QUANTILES = [0.5, 0.9, 0.99]
+
+# Observations kept by a summary to compute its quantiles
+WINDOW_SIZE = 1024
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# The active metrics registry, None while metrics are disabled
+registry = None
+
+def format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format"""
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+# Updates are plain attribute writes and deque appends, so the animation threads
+# never wait on a lock. Collecting reads a copy of the values.
+
+class Counter:
+    """A value that only goes up"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        """Increase the counter"""
+        self.value += amount
+
+    def get_samples(self) -> List[tuple]:
+        """Get the (name, labels, value) samples of the metric"""
+        return [(self.name, "", self.value)]
+
+class Gauge:
+    """A value that is set, or read from a function when collected"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, description: str,
+                 function: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.description = description
+        self.function = function
+        self.value = 0
+
+    def set(self, value: float):
+        """Set the gauge"""
+        self.value = value
+
+    def get_samples(self) -> List[tuple]:
+        """Get the (name, labels, value) samples of the metric"""
+        value = self.function() if self.function else self.value
+        return [(self.name, "", value)]
+
+class Summary:
+    """Observed values with a total, a count and quantiles over the latest values"""
+
+    type_name = "summary"
+
+    def __init__(self, name: str, description: str, window_size: int = WINDOW_SIZE):
+        self.name = name
+        self.description = description
+        self.window = collections.deque(maxlen=window_size)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        """Add an observed value"""
+        self.window.append(value)
+        self.count += 1
+        self.total += value
+
+    def get_quantiles(self, ratios: List[float] = QUANTILES) -> List[float]:
+        """Get quantiles of the values in the window, NaN while it is empty"""
+        # Copy the window first, observations may be added while sorting
+        values = sorted(list(self.window))
+        if not values:
+            return [float("nan")] * len(ratios)
+        return [values[min(len(values) - 1, int(ratio * len(values)))] for ratio in ratios]
+
+    def get_samples(self) -> List[tuple]:
+        """Get the (name, labels, value) samples of the metric"""
+        samples = [
+            (self.name, f'{{quantile="{ratio}"}}', value)
+            for ratio, value in zip(QUANTILES, self.get_quantiles())
+        ]
+        samples.append((self.name + "_sum", "", self.total))
+        samples.append((self.name + "_count", "", self.count))
+        return samples
+
+class Registry:
+    """A set of metrics exported together"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+
+    def register(self, metric: Any) -> Any:
+        """Add a metric to the registry"""
+        if metric.name in self.metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        """Create and register a counter"""
+        return self.register(Counter(name, description))
+
+    def gauge(self, name: str, description: str,
+              function: Optional[Callable[[], float]] = None) -> Gauge:
+        """Create and register a gauge"""
+        return self.register(Gauge(name, description, function))
+
+    def summary(self, name: str, description: str) -> Summary:
+        """Create and register a summary"""
+        return self.register(Summary(name, description))
+
+    def collect(self) -> str:
+        """Get every metric in the Prometheus text format"""
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labels, value in metric.get_samples():
+                lines.append(f"{name}{labels} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        """Write the metrics for a textfile collector, replacing the file atomically"""
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(self.collect())
+        os.replace(temporary_path, path)
+
+class ClockMetrics(Registry):
+    """The metrics of the ClockClock24 animation"""
+
+    def __init__(self):
+        super().__init__()
+        self.cycles = self.counter(
+            "clockclock24_cycles_total", "Animation cycles started")
+        self.plan_seconds = self.summary(
+            "clockclock24_plan_compute_seconds", "Time spent planning a cycle")
+        self.frames = self.counter(
+            "clockclock24_frames_total", "Frames drawn")
+        self.frame_seconds = self.summary(
+            "clockclock24_frame_seconds", "Time spent drawing a frame")
+        self.minute_lateness = self.summary(
+            "clockclock24_minute_lateness_seconds",
+            "Delay between a minute change and the start of its cycle")
+        self.pending_timeouts = self.gauge(
+            "clockclock24_pending_timeouts", "Timeouts waiting to complete",
+            get_pending_timeouts)
+        self.canvas_items = self.gauge(
+            "clockclock24_canvas_items", "Items on the canvas after the last cycle")
+        self.stalls = self.counter(
+            "clockclock24_stalls_total", "Main loop stalls longer than the watchdog threshold")
+
+    def observe_frame(self, start: float):
+        """Count a frame started at the given perf_counter time"""
+        self.frames.inc()
+        self.frame_seconds.observe(time.perf_counter() - start)
+
+def enable() -> ClockMetrics:
+    """Start collecting metrics"""
+    global registry
+    registry = ClockMetrics()
+    return registry
+
+def disable():
+    """Stop collecting metrics"""
+    global registry
+    registry = None
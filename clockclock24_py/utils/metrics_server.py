@@ -0,0 +1,52 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any
+
+from clockclock24_py.utils.metrics import CONTENT_TYPE, Registry
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serve the metrics of the server registry"""
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.registry.collect().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):
+        """Do not log every scrape"""
+
+class MetricsServer(ThreadingMixIn, HTTPServer):
+    """A local HTTP listener serving the metrics in a background thread"""
+
+    daemon_threads = True
+
+    def __init__(self, registry: Registry, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize a metrics server
+
+        Args:
+            registry: The metrics to serve
+            host: The address to listen on, local only by default
+            port: The port to listen on, any free port with 0
+        """
+        super().__init__((host, port), MetricsHandler)
+        self.registry = registry
+        self.thread = None
+
+    def start(self) -> "MetricsServer":
+        """Serve requests in a background thread"""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.shutdown()
+        self.server_close()
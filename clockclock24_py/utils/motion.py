@@ -0,0 +1,199 @@
+import functools
+import math
+from typing import List, Dict, Any, Optional, Tuple
+
+# Steps of the bisections on the peak velocity
+BISECTION_STEPS = 60
+
+class MotionLimits:
+    """The velocity, acceleration and jerk limits of a needle motor"""
+
+    def __init__(self, max_velocity: float, max_acceleration: float,
+                 max_jerk: Optional[float] = None):
+        """
+        Initialize motion limits
+
+        Args:
+            max_velocity: The maximum velocity in degrees per second
+            max_acceleration: The maximum acceleration in degrees per second squared
+            max_jerk: The maximum jerk in degrees per second cubed, None for a
+                trapezoidal velocity profile, a value for an S-curve
+        """
+        if max_velocity <= 0 or max_acceleration <= 0 or (max_jerk is not None and max_jerk <= 0):
+            raise ValueError("Motion limits must be positive")
+        self.max_velocity = max_velocity
+        self.max_acceleration = max_acceleration
+        self.max_jerk = max_jerk
+
+    def get_key(self) -> Tuple[float, float, Optional[float]]:
+        """Get the limits as a hashable tuple"""
+        return self.max_velocity, self.max_acceleration, self.max_jerk
+
+def get_acceleration_segments(peak_velocity: float, acceleration: float,
+                              jerk: Optional[float]) -> List[Tuple[float, float, float]]:
+    """Get the (duration, start acceleration, jerk) segments from rest to a velocity"""
+    if jerk is None:
+        return [(peak_velocity / acceleration, acceleration, 0.0)]
+    if peak_velocity * jerk >= acceleration ** 2:
+        jerk_time = acceleration / jerk
+        return [
+            (jerk_time, 0.0, jerk),
+            (peak_velocity / acceleration - jerk_time, acceleration, 0.0),
+            (jerk_time, acceleration, -jerk),
+        ]
+    # The velocity is reached before the acceleration limit
+    jerk_time = math.sqrt(peak_velocity / jerk)
+    return [(jerk_time, 0.0, jerk), (jerk_time, jerk * jerk_time, -jerk)]
+
+class MotionProfile:
+    """A rest to rest velocity profile over a distance, as segments of constant jerk"""
+
+    def __init__(self, distance: float, peak_velocity: float, limits: MotionLimits):
+        """
+        Initialize a motion profile
+
+        Args:
+            distance: The distance in degrees
+            peak_velocity: The cruise velocity, reachable within the distance
+            limits: The motor limits
+        """
+        self.distance = distance
+        self.peak_velocity = peak_velocity
+        accelerate = get_acceleration_segments(
+            peak_velocity, limits.max_acceleration, limits.max_jerk
+        ) if peak_velocity > 0 else []
+        ramp_time = sum(duration for duration, _, _ in accelerate)
+        cruise_time = (distance - peak_velocity * ramp_time) / peak_velocity if peak_velocity > 0 else 0
+        decelerate = [(duration, -acceleration, -jerk) for duration, acceleration, jerk in accelerate]
+        self.segments = accelerate + [(max(0.0, cruise_time), 0.0, 0.0)] + decelerate
+        self.duration = sum(duration for duration, _, _ in self.segments)
+
+    def get_state(self, time_s: float) -> Tuple[float, float]:
+        """Get the position and velocity after a time in seconds"""
+        position = 0.0
+        velocity = 0.0
+        for duration, acceleration, jerk in self.segments:
+            step = min(duration, max(0.0, time_s))
+            position += velocity * step + acceleration * step ** 2 / 2 + jerk * step ** 3 / 6
+            velocity += acceleration * step + jerk * step ** 2 / 2
+            time_s -= duration
+            if time_s <= 0:
+                break
+        return position, velocity
+
+    def position(self, time_s: float) -> float:
+        """Get the position after a time in seconds"""
+        return self.get_state(time_s)[0]
+
+def get_ramp_distance(peak_velocity: float, limits: MotionLimits) -> float:
+    """Get the distance needed to accelerate from rest to a velocity and back to rest"""
+    segments = get_acceleration_segments(peak_velocity, limits.max_acceleration, limits.max_jerk)
+    return peak_velocity * sum(duration for duration, _, _ in segments)
+
+def get_max_velocity(distance: float, limits: MotionLimits) -> float:
+    """Get the highest peak velocity that can be reached and left within a distance"""
+    if get_ramp_distance(limits.max_velocity, limits) <= distance:
+        return limits.max_velocity
+    low, high = 0.0, limits.max_velocity
+    for _ in range(BISECTION_STEPS):
+        middle = (low + high) / 2
+        if get_ramp_distance(middle, limits) <= distance:
+            low = middle
+        else:
+            high = middle
+    return low
+
+@functools.lru_cache(maxsize=4096)
+def get_min_duration_for(distance: float, limits_key: Tuple[float, float, Optional[float]]) -> float:
+    """Get the shortest duration of a motion in milliseconds, cached by distance"""
+    if distance <= 0:
+        return 0.0
+    limits = MotionLimits(*limits_key)
+    return MotionProfile(distance, get_max_velocity(distance, limits), limits).duration * 1000
+
+def get_min_duration(distance: float, limits: MotionLimits) -> float:
+    """Get the shortest duration of a motion over a distance in milliseconds"""
+    return get_min_duration_for(abs(distance), limits.get_key())
+
+def fit_profile(distance: float, duration_ms: float, limits: MotionLimits) -> MotionProfile:
+    """Get the profile that covers a distance in a duration, as fast as possible if too short"""
+    distance = abs(distance)
+    high = get_max_velocity(distance, limits)
+    profile = MotionProfile(distance, high, limits)
+    if distance <= 0 or profile.duration * 1000 >= duration_ms:
+        return profile
+
+    # Lower the peak velocity until the motion takes the whole duration
+    low = 0.0
+    for _ in range(BISECTION_STEPS):
+        middle = (low + high) / 2
+        if MotionProfile(distance, middle, limits).duration * 1000 > duration_ms:
+            low = middle
+        else:
+            high = middle
+    return MotionProfile(distance, high, limits)
+
+def get_needle_motions(timer: List[List[List[Dict[str, Any]]]],
+                       previous_timer: List[List[List[Dict[str, Any]]]]) -> List[Tuple[float, int, int]]:
+    """Get the distance, animation time and delay of every needle between two timer states"""
+    motions = []
+    for number, previous_number in zip(timer, previous_timer):
+        for line, previous_line in zip(number, previous_number):
+            for clock, previous_clock in zip(line, previous_line):
+                for needle in ("hours", "minutes"):
+                    motions.append((
+                        abs(clock[needle] - previous_clock[needle]),
+                        clock.get("animation_time", 0),
+                        clock.get("animation_delay", 0),
+                    ))
+    return motions
+
+def get_required_extension(timer: List[List[List[Dict[str, Any]]]],
+                           previous_timer: List[List[List[Dict[str, Any]]]],
+                           limits: MotionLimits) -> Tuple[float, float]:
+    """
+    Get the shortest feasible duration of a timer state and the time to add to its
+    animation time so that every needle can follow its motion
+    """
+    min_duration = 0.0
+    extension = 0.0
+    for distance, animation_time, delay in get_needle_motions(timer, previous_timer):
+        duration = get_min_duration(distance, limits)
+        min_duration = max(min_duration, delay + duration)
+        extension = max(extension, duration - animation_time)
+    return min_duration, extension
+
+def extend_timer(timer: List[List[List[Dict[str, Any]]]],
+                 extension: int) -> List[List[List[Dict[str, Any]]]]:
+    """Add a time to the animation time of every clock of a timer"""
+    return [
+        [
+            [dict(clock, animation_time=clock.get("animation_time", 0) + extension)
+             for clock in line]
+            for line in number
+        ]
+        for number in timer
+    ]
+
+def apply_motion_limits(timers: List[List[List[List[Dict[str, Any]]]]],
+                        start_timer: List[List[List[Dict[str, Any]]]],
+                        limits: MotionLimits) -> Tuple[List[List[List[List[Dict[str, Any]]]]],
+                                                       List[Dict[str, Any]]]:
+    """
+    Stretch the animation time of the timer states that are too short for the motors
+
+    Returns the timer states and, for each of them, the shortest feasible duration
+    and the time added to every clock.
+    """
+    result = []
+    report = []
+    previous_timer = start_timer
+    for timer in timers:
+        min_duration, extension = get_required_extension(timer, previous_timer, limits)
+        extension = math.ceil(extension)
+        if extension > 0:
+            timer = extend_timer(timer, extension)
+        result.append(timer)
+        report.append({"min_duration_ms": min_duration, "extension_ms": max(0, extension)})
+        previous_timer = timer
+    return result, report
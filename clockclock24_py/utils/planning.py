@@ -0,0 +1,113 @@
+import os
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Union
+
+from clockclock24_py.constants.config import (
+    ANIMATION_TIME,
+    DELAY_PATTERNS,
+    ROTATION_MODE,
+    CHOREOGRAPHY_ENV,
+    GENERATED_SHAPES,
+    SPLINE_TRAJECTORIES,
+    MOTION_MAX_VELOCITY,
+    MOTION_MAX_ACCELERATION,
+    MOTION_MAX_JERK
+)
+from clockclock24_py.utils import choreography, events, metrics
+from clockclock24_py.utils.delays import check_patterns
+from clockclock24_py.utils.engine import (
+    get_sequences,
+    compute_sequences,
+    describe_sequences,
+    get_cycle_travel,
+    wrap_timer
+)
+from clockclock24_py.utils.generators import register_generators
+from clockclock24_py.utils.motion import MotionLimits, apply_motion_limits
+from clockclock24_py.utils.splines import SplineTimeline
+from clockclock24_py.utils.timeline import Timeline
+from clockclock24_py.utils.utils import get_max_animation_time
+
+def get_plan_options(animation_time: int = ANIMATION_TIME) -> Dict[str, Any]:
+    """
+    Get the planning options of the configuration and the environment
+
+    Invalid delay patterns and choreographies raise ValueError here, at startup,
+    rather than in the thread of a cycle. With GENERATED_SHAPES, the procedural
+    shapes are registered for the random cycles.
+    """
+    if GENERATED_SHAPES:
+        register_generators()
+    path = os.environ.get(CHOREOGRAPHY_ENV)
+    options = {
+        "animation_time": animation_time,
+        "delay_patterns": check_patterns(DELAY_PATTERNS),
+        "rotation": ROTATION_MODE,
+        "motion_limits": MotionLimits(
+            MOTION_MAX_VELOCITY, MOTION_MAX_ACCELERATION, MOTION_MAX_JERK or None
+        ) if MOTION_MAX_VELOCITY else None,
+        "choreography": choreography.load_choreography(path) if path else None,
+    }
+    if options["choreography"] is not None:
+        choreography.get_compiled(options["choreography"])
+    return options
+
+def plan_cycle(timer: List[List[List[Dict[str, Any]]]], cycle: int, options: Dict[str, Any],
+               is_minute: bool = False) -> List[List[List[List[Dict[str, Any]]]]]:
+    """
+    Plan the timer states of a cycle and record its plan event and metrics
+
+    Args:
+        timer: The timer the needles rest at
+        cycle: The number of the cycle in the events
+        options: The options of get_plan_options, or of engine.get_sequences
+        is_minute: The cycle was started for a minute change
+    """
+    start = time.perf_counter()
+    cycle_choreography = options.get("choreography")
+    if cycle_choreography is not None:
+        plan = choreography.get_sequences(cycle_choreography)
+        sequences = choreography.run(timer, cycle_choreography, plan)
+    else:
+        plan = get_sequences(options)
+        sequences = compute_sequences(plan, timer)
+    # The timer of an interrupted cycle may hold whole turns, the states start from its wrap
+    wrapped = wrap_timer(timer)
+    motion = {}
+    if options.get("motion_limits"):
+        sequences, report = apply_motion_limits(sequences, wrapped, options["motion_limits"])
+        motion = {
+            "min_durations_ms": [entry["min_duration_ms"] for entry in report],
+            "extensions_ms": [entry["extension_ms"] for entry in report],
+        }
+    compute_time = time.perf_counter() - start
+
+    registry = metrics.registry
+    if registry is not None:
+        registry.cycles.inc()
+        if is_minute:
+            # Seconds since the minute changed, negative when started early
+            lateness = time.time() % 60
+            registry.minute_lateness.observe(lateness - 60 if lateness > 30 else lateness)
+        registry.plan_seconds.observe(compute_time)
+    events.log.record(
+        "plan",
+        cycle=cycle,
+        compute_ms=compute_time * 1000,
+        duration_ms=sum(get_max_animation_time(state) for state in sequences),
+        travel_degrees=get_cycle_travel(sequences, wrapped),
+        **describe_sequences(plan),
+        **motion
+    )
+    return sequences
+
+def get_timeline(timer: List[List[List[Dict[str, Any]]]],
+                 sequences: List[List[List[List[Dict[str, Any]]]]]) -> Union[Timeline, SplineTimeline]:
+    """Lay out the timer states of a cycle in time, along splines with SPLINE_TRAJECTORIES"""
+    timeline_class = SplineTimeline if SPLINE_TRAJECTORIES else Timeline
+    return timeline_class(timer, sequences)
+
+def get_remaining_time() -> int:
+    """Get the remaining time before the next minute change"""
+    return 60 * 1000 - datetime.now().second * 1000
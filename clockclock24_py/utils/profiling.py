@@ -0,0 +1,172 @@
+import cProfile
+import functools
+import marshal
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from clockclock24_py.utils.utils import start_timeout
+
+# The running profiling session, None when nothing is profiled
+session = None
+
+def get_default_path() -> str:
+    """Get a new path for a profile file in the temporary directory"""
+    name = time.strftime("clockclock24-%Y%m%d-%H%M%S.pstats")
+    return os.path.join(tempfile.gettempdir(), name)
+
+def get_function_key(code: Any) -> Tuple[str, int, str]:
+    """Get the pstats key of a code object"""
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+class Sampler:
+    """A sampling profiler that walks the stack of every thread at a fixed interval"""
+
+    def __init__(self, interval_ms: float = 5):
+        """
+        Initialize a sampler
+
+        Args:
+            interval_ms: The time between two samples in milliseconds
+        """
+        self.interval = interval_ms / 1000
+        self.stats: Dict[Tuple[str, int, str], list] = {}
+        self.callers: Dict[Tuple[str, int, str], Dict[Tuple[str, int, str], list]] = {}
+        self.samples = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Start sampling in a background thread"""
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampling thread"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+
+    def run(self):
+        """Take samples until stopped"""
+        own_id = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.add_sample(frame)
+            self.samples += 1
+
+    def add_sample(self, frame: Any):
+        """Account one interval to every function of a stack"""
+        seen = set()
+        callee = None
+        while frame is not None:
+            key = get_function_key(frame.f_code)
+            entry = self.stats.setdefault(key, [0, 0, 0.0, 0.0])
+            if callee is None:
+                entry[2] += self.interval
+            if key not in seen:
+                seen.add(key)
+                entry[0] += 1
+                entry[1] += 1
+                entry[3] += self.interval
+            if callee is not None:
+                edge = self.callers.setdefault(callee, {}).setdefault(key, [0, 0, 0.0, 0.0])
+                edge[0] += 1
+                edge[1] += 1
+                edge[3] += self.interval
+            callee = key
+            frame = frame.f_back
+
+    def dump_stats(self, path: str):
+        """Write the samples in the pstats file format"""
+        stats = {
+            key: (cc, nc, tt, ct, {
+                caller: tuple(edge) for caller, edge in self.callers.get(key, {}).items()
+            })
+            for key, (cc, nc, tt, ct) in self.stats.items()
+        }
+        with open(path, "wb") as file:
+            marshal.dump(stats, file)
+
+class ProfileSession:
+    """Profile the running process for a limited time and write a .pstats file"""
+
+    def __init__(self, duration_ms: int, path: Optional[str] = None,
+                 mode: str = "cprofile", interval_ms: float = 5):
+        """
+        Initialize a profiling session
+
+        Args:
+            duration_ms: How long to profile in milliseconds
+            path: The .pstats file written at the end, in the temp directory by default
+            mode: "cprofile" to trace the profiled calls, "sample" to sample every thread
+            interval_ms: The time between two samples in sample mode
+        """
+        if mode not in ("cprofile", "sample"):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.duration_ms = duration_ms
+        self.path = path or get_default_path()
+        self.mode = mode
+        self.profile = cProfile.Profile() if mode == "cprofile" else None
+        self.sampler = Sampler(interval_ms) if mode == "sample" else None
+        self.lock = threading.Lock()
+        self.timeout = None
+        self.is_stopped = False
+
+    def start(self) -> "ProfileSession":
+        """Start profiling and schedule the end of the session"""
+        if self.sampler:
+            self.sampler.start()
+        self.timeout = start_timeout(self.duration_ms)
+        self.timeout.then(self.stop)
+        return self
+
+    def call(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a function, tracing it when no other call is being traced"""
+        if self.profile is None or not self.lock.acquire(blocking=False):
+            return function(*args, **kwargs)
+        try:
+            return self.profile.runcall(function, *args, **kwargs)
+        finally:
+            self.lock.release()
+
+    def stop(self):
+        """Stop profiling and write the .pstats file"""
+        global session
+        if self.is_stopped:
+            return
+        self.is_stopped = True
+        if session is self:
+            session = None
+        if self.timeout:
+            self.timeout.cancel()
+        if self.sampler:
+            self.sampler.stop()
+            self.sampler.dump_stats(self.path)
+        else:
+            with self.lock:
+                self.profile.dump_stats(self.path)
+        print(f"Profile written to {self.path}", file=sys.stderr)
+
+def start_profiling(duration_ms: int, path: Optional[str] = None,
+                    mode: str = "cprofile") -> Optional[ProfileSession]:
+    """Start a profiling session unless one is already running"""
+    global session
+    if session is not None:
+        return None
+    session = ProfileSession(duration_ms, path, mode)
+    return session.start()
+
+def profiled(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a function so that it is traced while a session is running"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        current = session
+        if current is None:
+            return function(*args, **kwargs)
+        return current.call(function, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,143 @@
+import array
+import bisect
+from typing import List, Dict, Any, Tuple
+
+from clockclock24_py.utils.engine import wrap_timer
+from clockclock24_py.utils.timeline import get_timer_from_angles
+from clockclock24_py.utils.utils import get_max_animation_time
+
+NEEDLES = ("hours", "minutes")
+
+def get_tangents(times: List[float], values: List[float]) -> List[float]:
+    """
+    Get the slopes of a C1 curve through points, without overshoot
+
+    The needles are at rest at the first and last points, and at the points where
+    they stop or turn back, so that a needle never passes its targets.
+    """
+    slopes = [
+        (values[index + 1] - values[index]) / (times[index + 1] - times[index])
+        for index in range(len(times) - 1)
+    ]
+    tangents = [0.0]
+    for before, after in zip(slopes, slopes[1:]):
+        if before * after <= 0:
+            tangents.append(0.0)
+        else:
+            # Harmonic mean, smaller than both slopes
+            tangents.append(2 / (1 / before + 1 / after))
+    tangents.append(0.0)
+    return tangents
+
+class NeedleSpline:
+    """The piecewise cubic angle of a needle over time"""
+
+    def __init__(self, times: List[float], values: List[float]):
+        """
+        Fit a spline through the targets of a needle
+
+        Args:
+            times: The increasing times the needle reaches each target, in milliseconds
+            values: The angles of the targets
+        """
+        tangents = get_tangents(times, values) if len(times) > 1 else [0.0]
+        self.times = array.array("d", times)
+        # Per interval: value, slope, second and third order coefficients
+        self.coefficients = array.array("d")
+        for index in range(len(times) - 1):
+            duration = times[index + 1] - times[index]
+            start, end = values[index], values[index + 1]
+            start_slope = tangents[index] * duration
+            end_slope = tangents[index + 1] * duration
+            self.coefficients.extend((
+                start,
+                start_slope,
+                3 * (end - start) - 2 * start_slope - end_slope,
+                2 * (start - end) + start_slope + end_slope,
+            ))
+        self.end = values[-1]
+
+    def __len__(self) -> int:
+        return len(self.times) - 1
+
+    def get_angle(self, time_ms: float) -> float:
+        """Get the angle of the needle at a time"""
+        index = bisect.bisect_right(self.times, time_ms) - 1
+        if index >= len(self):
+            return self.end
+        index = max(index, 0)
+        start = self.times[index]
+        progress = min(1.0, max(0.0, (time_ms - start) / (self.times[index + 1] - start)))
+        a, b, c, d = self.coefficients[index * 4:index * 4 + 4]
+        return ((d * progress + c) * progress + b) * progress + a
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """Get the knot times and the coefficients, to store or stream the spline"""
+        return {"times": self.times.tolist(), "coefficients": self.coefficients.tolist()}
+
+class SplineTimeline:
+    """
+    The timer states of engine.run joined into one continuous motion per needle
+
+    Each needle reaches its target of every timer state at the same time as with
+    the separate animations, but flows through the intermediate ones instead of
+    stopping. It has the same interface as Timeline.
+    """
+
+    def __init__(self, start_timer: List[List[List[Dict[str, Any]]]],
+                 timers: List[List[List[List[Dict[str, Any]]]]]):
+        """
+        Initialize a spline timeline
+
+        Args:
+            start_timer: The timer the sequences were computed from
+            timers: The timer states returned by engine.run, played one after another
+        """
+        self.start_timer = wrap_timer(start_timer)
+        clocks = [clock for number in self.start_timer for line in number for clock in line]
+        knots = [
+            ([0.0], [float(clock[needle])]) for clock in clocks for needle in NEEDLES
+        ]
+
+        start = 0
+        for timer in timers:
+            needle_index = 0
+            for number in timer:
+                for line in number:
+                    for clock in line:
+                        arrival = start + clock.get("animation_delay", 0) + clock.get("animation_time", 0)
+                        for needle in NEEDLES:
+                            times, values = knots[needle_index]
+                            value = float(clock[needle])
+                            if arrival <= times[-1]:
+                                values[-1] = value
+                            elif len(values) > 1 and values[-2] == values[-1] == value:
+                                # A needle at rest keeps a single interval
+                                times[-1] = float(arrival)
+                            else:
+                                times.append(float(arrival))
+                                values.append(value)
+                            needle_index += 1
+            start += get_max_animation_time(timer)
+        self.duration = start
+        self.splines = [NeedleSpline(times, values) for times, values in knots]
+
+    def get_angles(self, time_ms: float) -> List[Tuple[float, float]]:
+        """Get the hours and minutes of every clock at a time, in the order of the timer"""
+        angles = [spline.get_angle(time_ms) for spline in self.splines]
+        return list(zip(angles[::2], angles[1::2]))
+
+    def state_at(self, time_ms: float) -> List[List[List[Dict[str, Any]]]]:
+        """Get the timer of the needle angles at a time from the start of the sequences"""
+        return get_timer_from_angles(self.start_timer, self.get_angles(time_ms))
+
+    def get_keyframe_count(self) -> int:
+        """Get the number of spline intervals of all the needles"""
+        return sum(len(spline) for spline in self.splines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the splines of all the needles, in the order of the timer, hours first"""
+        return {
+            "duration": self.duration,
+            "needles": [spline.to_dict() for spline in self.splines],
+        }
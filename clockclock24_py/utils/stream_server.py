@@ -0,0 +1,516 @@
+#!/usr/bin/env python
+"""
+ClockClock24 Python - Stream server
+
+Stream the cycles of a DisplayCore to browser displays over WebSocket, from an
+asyncio loop in a background thread.
+
+    python -m clockclock24_py.utils.stream_server --port 8024
+
+Open http://127.0.0.1:8024/ for a canvas display, connect to /stream for the
+messages, or get /snapshot for the current state. The messages are JSON objects
+with the angles of every needle in tenths of a degree, in the order of the timer
+with the hours first:
+
+    {"type": "hello", "numbers": 4, "lines": 3, "clocks": 2, "angle_scale": 10, "frame_ms": 50}
+    {"type": "rest", "angles": [1800, 0, ...]}
+    {"type": "cycle", "cycle": 3, "duration": 31700, "splines": {...}}
+    {"type": "frame", "cycle": 3, "elapsed": 1250, "angles": [1843, 12, ...]}
+
+A client that joins during a cycle gets the cycle and its latest frame. Each
+message is encoded once and shared by every client. A slow client only gets the
+latest frame when it catches up, and is disconnected when it falls behind by
+more than STREAM_MAX_QUEUE cycle messages.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import sys
+import threading
+from collections import deque
+from typing import List, Dict, Any, Optional, Set
+
+from clockclock24_py.constants.config import (
+    STREAM_HOST,
+    STREAM_FRAME_INTERVAL,
+    STREAM_MAX_QUEUE,
+    STREAM_SEND_TIMEOUT,
+    STREAM_MAX_MESSAGE
+)
+from clockclock24_py.utils.angles import ANGLE_SCALE, to_fixed
+from clockclock24_py.utils.utils import get_time_ms
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# asyncio.Task.current_task before Python 3.7
+current_task = getattr(asyncio, "current_task", None) or asyncio.Task.current_task
+
+OPCODE_TEXT = 0x1
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+MAX_CONTROL_PAYLOAD = 125
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_TOO_BIG = 1009
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>ClockClock24</title></head>
+<body style="margin:0;background:#e8e8e8">
+<canvas id="clock"></canvas>
+<script>
+var canvas = document.getElementById("clock"), context = canvas.getContext("2d");
+var layout = null, angles = [];
+var socket = new WebSocket("ws://" + location.host + "/stream");
+socket.onmessage = function (event) {
+  var message = JSON.parse(event.data);
+  if (message.type === "hello") layout = message;
+  if (message.angles) angles = message.angles;
+};
+function draw() {
+  requestAnimationFrame(draw);
+  if (!layout) return;
+  var columns = layout.numbers * layout.clocks;
+  var size = Math.min(innerWidth / columns, innerHeight / layout.lines);
+  canvas.width = innerWidth;
+  canvas.height = innerHeight;
+  for (var index = 0; index * 2 < angles.length; index++) {
+    var clock = index % layout.clocks, line = Math.floor(index / layout.clocks) % layout.lines;
+    var number = Math.floor(index / (layout.clocks * layout.lines));
+    var x = (number * layout.clocks + clock + 0.5) * size, y = (line + 0.5) * size;
+    context.beginPath();
+    context.arc(x, y, size * 0.45, 0, 2 * Math.PI);
+    context.fillStyle = "#f5f5f5";
+    context.fill();
+    for (var needle = 0; needle < 2; needle++) {
+      var radians = (angles[index * 2 + needle] / layout.angle_scale - 90) * Math.PI / 180;
+      context.beginPath();
+      context.moveTo(x, y);
+      context.lineTo(x + size * 0.4 * Math.cos(radians), y + size * 0.4 * Math.sin(radians));
+      context.lineWidth = size * 0.06;
+      context.stroke();
+    }
+  }
+}
+draw();
+</script>
+</body>
+</html>
+"""
+
+def encode_frame(payload: bytes, opcode: int = OPCODE_TEXT) -> bytes:
+    """Encode a WebSocket frame sent by the server, which is not masked"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a message as a WebSocket text frame"""
+    return encode_frame(json.dumps(message, separators=(",", ":")).encode("utf-8"))
+
+def unmask(payload: bytes, mask: bytes) -> bytes:
+    """Unmask the payload of a client frame, as one integer instead of byte by byte"""
+    length = len(payload)
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+
+def get_accept_key(key: str) -> str:
+    """Get the Sec-WebSocket-Accept header of a handshake key"""
+    digest = hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+def get_timer_angles(timer: List[List[List[Dict[str, Any]]]]) -> List[int]:
+    """Get the angles of the needles of a timer, in tenths of a degree"""
+    return [
+        to_fixed(clock[needle])
+        for number in timer for line in number for clock in line
+        for needle in ("hours", "minutes")
+    ]
+
+class StreamClient:
+    """The messages waiting to be sent to a browser display"""
+
+    def __init__(self, writer: Any, max_queue: int = STREAM_MAX_QUEUE):
+        """
+        Initialize a client
+
+        Args:
+            writer: The asyncio stream writer of the connection
+            max_queue: The cycle messages the client may fall behind
+        """
+        self.writer = writer
+        self.max_queue = max_queue
+        self.messages = deque()
+        self.frame = None
+        self.ready = asyncio.Event()
+        self.is_closed = False
+        self.dropped_frames = 0
+
+    def send(self, data: bytes):
+        """Queue a message that every client must get, like a cycle"""
+        # A newer cycle or rest replaces the frame of the previous one
+        self.frame = None
+        self.messages.append(data)
+        if len(self.messages) > self.max_queue:
+            self.messages.clear()
+            self.close()
+            return
+        self.ready.set()
+
+    def send_frame(self, data: bytes):
+        """Queue a frame, replacing the one the client did not get yet"""
+        if self.frame is not None:
+            self.dropped_frames += 1
+        self.frame = data
+        self.ready.set()
+
+    def take(self) -> bytes:
+        """Take all the queued messages, to send them in a single write"""
+        batch = list(self.messages)
+        self.messages.clear()
+        if self.frame is not None:
+            batch.append(self.frame)
+            self.frame = None
+        self.ready.clear()
+        return b"".join(batch)
+
+    def close(self):
+        """Stop sending and close the connection"""
+        self.is_closed = True
+        self.ready.set()
+
+class StreamServer:
+    """
+    A local WebSocket listener streaming the cycles of a DisplayCore
+
+    It is a renderer of the core: add it with core.add_renderer after start.
+    """
+
+    def __init__(self, host: str = STREAM_HOST, port: int = 0,
+                 frame_ms: int = STREAM_FRAME_INTERVAL, max_queue: int = STREAM_MAX_QUEUE,
+                 send_timeout: int = STREAM_SEND_TIMEOUT, max_message: int = STREAM_MAX_MESSAGE):
+        """
+        Initialize a stream server
+
+        Args:
+            host: The address to listen on, local only by default
+            port: The port to listen on, any free port with 0
+            frame_ms: The time between two streamed frames
+            max_queue: The cycle messages a client may fall behind before it is disconnected
+            send_timeout: The milliseconds a client may take to accept a write
+            max_message: The bytes of a client message, larger ones close the connection
+        """
+        self.host = host
+        self.port = port
+        self.frame_ms = frame_ms
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.max_message = max_message
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.clients: Set[StreamClient] = set()
+        self.tasks = set()
+        self.timeline = None
+        self.cycle_start = 0
+        self.cycle_count = 0
+        self.is_sampling = False
+        self.frame_count = 0
+        # Encoded once, shared by every client
+        self.hello = None
+        self.cycle = None
+        self.state = None
+        self.state_json = "null"
+        self.cycle_json = "null"
+
+    def start(self) -> "StreamServer":
+        """Listen in a background thread, and wait until the port is open"""
+        ready = threading.Event()
+        errors = []
+
+        def serve():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.server = self.loop.run_until_complete(
+                    asyncio.start_server(self.handle, self.host, self.port)
+                )
+            except OSError as error:
+                errors.append(error)
+                ready.set()
+                self.loop.close()
+                return
+            self.port = self.server.sockets[0].getsockname()[1]
+            ready.set()
+            self.loop.run_forever()
+
+            # Finish the connections before closing the loop
+            for task in list(self.tasks):
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*self.tasks, return_exceptions=True))
+            self.server.close()
+            self.loop.run_until_complete(self.server.wait_closed())
+            self.loop.close()
+
+        self.thread = threading.Thread(target=serve, daemon=True)
+        self.thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self
+
+    def close(self):
+        """Close the connections and stop listening"""
+        if self.thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.thread = None
+
+    def call(self, function: Any, *args: Any):
+        """Run a function on the loop of the server, from any thread"""
+        if self.thread is not None:
+            self.loop.call_soon_threadsafe(function, *args)
+
+    def start_cycle(self, timeline: Any, start_ms: float):
+        """Stream the timeline of a cycle that started at a time of get_time_ms"""
+        self.call(self.begin_cycle, timeline, start_ms)
+
+    def end_cycle(self, timer: List[List[List[Dict[str, Any]]]]):
+        """Stream the timer the needles rest at between two cycles"""
+        self.call(self.show_rest, timer)
+
+    def stop(self):
+        """Stop streaming frames after the current one"""
+        self.call(setattr, self, "timeline", None)
+
+    def broadcast(self, data: bytes):
+        """Send a message to every client"""
+        for client in list(self.clients):
+            client.send(data)
+
+    def set_layout(self, timer: List[List[List[Dict[str, Any]]]]):
+        """Encode the hello message of the layout of a timer"""
+        self.hello = encode_message({
+            "type": "hello",
+            "numbers": len(timer),
+            "lines": len(timer[0]),
+            "clocks": len(timer[0][0]),
+            "angle_scale": ANGLE_SCALE,
+            "frame_ms": self.frame_ms,
+        })
+
+    def show_rest(self, timer: List[List[List[Dict[str, Any]]]]):
+        """Send the rest angles between two cycles"""
+        if self.hello is None:
+            self.set_layout(timer)
+        self.timeline = None
+        self.cycle = None
+        self.cycle_json = "null"
+        message = {"type": "rest", "angles": get_timer_angles(timer)}
+        self.state_json = json.dumps(message, separators=(",", ":"))
+        self.state = encode_frame(self.state_json.encode("utf-8"))
+        self.broadcast(self.state)
+
+    def begin_cycle(self, timeline: Any, start_ms: float):
+        """Send a new cycle, then sample its frames"""
+        if self.hello is None:
+            self.set_layout(timeline.start_timer)
+        self.timeline = timeline
+        self.cycle_start = start_ms
+        self.cycle_count += 1
+        message = {"type": "cycle", "cycle": self.cycle_count, "duration": timeline.duration}
+        # Clients that interpolate themselves only need the splines
+        if hasattr(timeline, "to_dict"):
+            message["splines"] = timeline.to_dict()
+        self.cycle_json = json.dumps(message, separators=(",", ":"))
+        self.cycle = encode_frame(self.cycle_json.encode("utf-8"))
+        self.broadcast(self.cycle)
+        if not self.is_sampling:
+            self.is_sampling = True
+            self.sample()
+
+    def encode_state(self, elapsed: float):
+        """Encode the frame of the running cycle at a time since its start"""
+        message = {
+            "type": "frame",
+            "cycle": self.cycle_count,
+            "elapsed": round(elapsed),
+            "angles": [to_fixed(angle) for clock in self.timeline.get_angles(elapsed) for angle in clock],
+        }
+        self.state_json = json.dumps(message, separators=(",", ":"))
+        self.state = encode_frame(self.state_json.encode("utf-8"))
+
+    def sample(self):
+        """Send the angles at the current time and schedule the next frame"""
+        timeline = self.timeline
+        if timeline is None:
+            self.is_sampling = False
+            return
+        elapsed = get_time_ms() - self.cycle_start
+        # Without clients, the frame is only encoded when one joins
+        if self.clients:
+            self.encode_state(elapsed)
+            self.frame_count += 1
+            for client in list(self.clients):
+                client.send_frame(self.state)
+        if elapsed < timeline.duration:
+            self.loop.call_later(self.frame_ms / 1000, self.sample)
+        else:
+            self.is_sampling = False
+
+    def update_state(self):
+        """Encode the current frame of a running cycle, which is skipped without clients"""
+        if self.timeline is not None:
+            self.encode_state(min(get_time_ms() - self.cycle_start, self.timeline.duration))
+
+    def get_snapshot(self) -> List[bytes]:
+        """Get the messages a joining client needs to show the current state"""
+        self.update_state()
+        return [data for data in (self.hello, self.cycle, self.state) if data is not None]
+
+    async def drain(self, writer: asyncio.StreamWriter) -> bool:
+        """Wait until a client accepted the written data, False when it took too long"""
+        try:
+            await asyncio.wait_for(writer.drain(), self.send_timeout / 1000)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve a connection: the page, the snapshot or the stream"""
+        task = current_task()
+        self.tasks.add(task)
+        try:
+            try:
+                request = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+            lines = request.decode("latin-1").split("\r\n")
+            parts = lines[0].split()
+            path = parts[1].split("?")[0] if len(parts) > 1 else ""
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if path == "/stream" and headers.get("upgrade", "").lower() == "websocket":
+                await self.stream(reader, writer, headers.get("sec-websocket-key", ""))
+            elif path == "/snapshot":
+                self.update_state()
+                body = '{"cycle":%s,"state":%s}' % (self.cycle_json, self.state_json)
+                self.respond(writer, "200 OK", "application/json", body.encode("utf-8"))
+            elif path == "/":
+                self.respond(writer, "200 OK", "text/html; charset=utf-8", PAGE.encode("utf-8"))
+            else:
+                self.respond(writer, "404 Not Found", "text/plain", b"Not Found")
+            await self.drain(writer)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            self.tasks.discard(task)
+
+    def respond(self, writer: asyncio.StreamWriter, status: str, content_type: str, body: bytes):
+        """Write an HTTP response and close the connection"""
+        writer.write((
+            "HTTP/1.1 %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n"
+            "Cache-Control: no-cache\r\nConnection: close\r\n\r\n" % (status, content_type, len(body))
+        ).encode("latin-1") + body)
+
+    async def stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, key: str):
+        """Send the snapshot then the messages to a WebSocket client"""
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+            "Connection: Upgrade\r\nSec-WebSocket-Accept: %s\r\n\r\n" % get_accept_key(key)
+        ).encode("latin-1"))
+        client = StreamClient(writer, self.max_queue)
+        for data in self.get_snapshot():
+            client.send(data)
+        self.clients.add(client)
+        receiver = asyncio.ensure_future(self.receive(reader, client))
+        self.tasks.add(receiver)
+        try:
+            while True:
+                await client.ready.wait()
+                data = client.take()
+                if data:
+                    writer.write(data)
+                    # Frames queued while the client is slow replace each other,
+                    # a client that stops reading is disconnected
+                    if not await self.drain(writer):
+                        break
+                # The close frame may be queued while the writes drain
+                if client.is_closed and not client.messages:
+                    break
+        finally:
+            self.clients.discard(client)
+            receiver.cancel()
+
+    async def receive(self, reader: asyncio.StreamReader, client: StreamClient):
+        """Read the frames of a client until it closes the connection"""
+        try:
+            while True:
+                first, second = await reader.readexactly(2)
+                opcode = first & 0x0F
+                length = second & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", await reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", await reader.readexactly(8))[0]
+                # Close before reading a payload the server never asked for
+                if opcode & 0x8 and length > MAX_CONTROL_PAYLOAD:
+                    client.send(encode_frame(struct.pack("!H", CLOSE_PROTOCOL_ERROR), OPCODE_CLOSE))
+                    break
+                if length > self.max_message:
+                    client.send(encode_frame(struct.pack("!H", CLOSE_TOO_BIG), OPCODE_CLOSE))
+                    break
+                mask = await reader.readexactly(4) if second & 0x80 else bytes(4)
+                payload = unmask(await reader.readexactly(length), mask)
+                if opcode == OPCODE_CLOSE:
+                    client.send(encode_frame(payload[:2], OPCODE_CLOSE))
+                    break
+                if opcode == OPCODE_PING:
+                    client.send(encode_frame(payload, OPCODE_PONG))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.tasks.discard(current_task())
+        client.close()
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Stream the cycles without a window"""
+    from clockclock24_py.utils.fanout import DisplayCore
+    from clockclock24_py.utils.planning import get_plan_options
+
+    parser = argparse.ArgumentParser(description="Stream the ClockClock24 cycles to browsers")
+    parser.add_argument("--host", default=STREAM_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=8024, help="port to listen on")
+    parser.add_argument("--frame-ms", type=int, default=STREAM_FRAME_INTERVAL,
+                        help="milliseconds between two streamed frames")
+    options = parser.parse_args(args)
+
+    server = StreamServer(options.host, options.port, options.frame_ms).start()
+    core = DisplayCore(options=get_plan_options())
+    core.add_renderer(server)
+    core.start()
+    print(f"Streaming on http://{options.host}:{server.port}/")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    core.stop()
+    server.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
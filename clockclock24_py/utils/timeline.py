@@ -0,0 +1,170 @@
+import bisect
+import functools
+import re
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from clockclock24_py.constants.config import ANIMATION_DEFAULT_TIMING, ANIMATION_TIMING_CONFIG
+from clockclock24_py.utils.engine import wrap_timer
+from clockclock24_py.utils.utils import get_max_animation_time
+
+# Newton steps and bisection steps used to invert the x curve of a cubic bezier
+NEWTON_STEPS = 8
+BISECTION_STEPS = 30
+EPSILON = 1e-7
+
+CUBIC_BEZIER = re.compile(r"cubic-bezier\(([^,]+),([^,]+),([^,]+),([^)]+)\)")
+
+def get_bezier(p1: float, p2: float, s: float) -> float:
+    """Get a coordinate of a cubic bezier from (0, 0) to (1, 1)"""
+    return ((1 - 3 * p2 + 3 * p1) * s + (3 * p2 - 6 * p1)) * s * s + 3 * p1 * s
+
+def get_bezier_slope(p1: float, p2: float, s: float) -> float:
+    """Get the derivative of a coordinate of a cubic bezier"""
+    return 3 * (1 - 3 * p2 + 3 * p1) * s * s + 2 * (3 * p2 - 6 * p1) * s + 3 * p1
+
+def cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> Callable[[float], float]:
+    """Get the easing function of a CSS cubic-bezier timing"""
+    def easing(progress: float) -> float:
+        # Find the curve parameter whose x is the progress, then get its y
+        s = progress
+        for _ in range(NEWTON_STEPS):
+            error = get_bezier(x1, x2, s) - progress
+            if abs(error) < EPSILON:
+                return get_bezier(y1, y2, s)
+            slope = get_bezier_slope(x1, x2, s)
+            if abs(slope) < EPSILON:
+                break
+            s -= error / slope
+
+        low, high = 0.0, 1.0
+        s = progress
+        for _ in range(BISECTION_STEPS):
+            x = get_bezier(x1, x2, s)
+            if abs(x - progress) < EPSILON:
+                break
+            if x < progress:
+                low = s
+            else:
+                high = s
+            s = (low + high) / 2
+        return get_bezier(y1, y2, s)
+
+    return easing
+
+def linear(progress: float) -> float:
+    return progress
+
+@functools.lru_cache(maxsize=32)
+def get_easing(timing: str) -> Callable[[float], float]:
+    """Get the easing function of a CSS timing, linear or cubic-bezier"""
+    match = CUBIC_BEZIER.fullmatch(timing.replace(" ", ""))
+    if match:
+        return cubic_bezier(*(float(value) for value in match.groups()))
+    if timing == "linear":
+        return linear
+    raise ValueError(f"Unsupported animation timing: {timing}")
+
+def get_clock_easing(clock: Dict[str, Any]) -> Callable[[float], float]:
+    """Get the easing function of the animation type of a clock"""
+    return get_easing(ANIMATION_TIMING_CONFIG.get(clock.get("animation_type"), ANIMATION_DEFAULT_TIMING))
+
+def get_timer_from_angles(shape_timer: List[List[List[Dict[str, Any]]]],
+                          angles: List[Tuple[float, float]]) -> List[List[List[Dict[str, Any]]]]:
+    """Build a timer of the shape of another one from the hours and minutes of its clocks"""
+    angles = iter(angles)
+    result = []
+    for number in shape_timer:
+        result.append([])
+        for line in number:
+            result[-1].append([])
+            for _ in line:
+                hours, minutes = next(angles)
+                result[-1][-1].append({"hours": hours, "minutes": minutes})
+    return result
+
+class Segment:
+    """The needle motions of one timer state, flattened in the order of the timer"""
+
+    def __init__(self, start_ms: int, previous_timer: List[List[List[Dict[str, Any]]]],
+                 timer: List[List[List[Dict[str, Any]]]]):
+        self.start = start_ms
+        self.duration = get_max_animation_time(timer)
+        self.motions: List[Tuple[float, float, float, float, int, int, Callable[[float], float]]] = []
+        for number, previous_number in zip(timer, previous_timer):
+            for line, previous_line in zip(number, previous_number):
+                for clock, previous_clock in zip(line, previous_line):
+                    self.motions.append((
+                        previous_clock["hours"], clock["hours"],
+                        previous_clock["minutes"], clock["minutes"],
+                        clock.get("animation_delay", 0), clock.get("animation_time", 0),
+                        get_clock_easing(clock),
+                    ))
+
+    def get_angles(self, time_ms: float) -> List[Tuple[float, float]]:
+        """Get the hours and minutes of every clock at a time from the segment start"""
+        angles = []
+        for hours_from, hours_to, minutes_from, minutes_to, delay, duration, easing in self.motions:
+            elapsed = time_ms - delay
+            if elapsed <= 0:
+                progress = 0.0
+            elif elapsed >= duration:
+                progress = 1.0
+            else:
+                progress = easing(elapsed / duration)
+            angles.append((
+                hours_from + (hours_to - hours_from) * progress,
+                minutes_from + (minutes_to - minutes_from) * progress,
+            ))
+        return angles
+
+class Timeline:
+    """The timer states of engine.run laid out in time, to get the needles at any instant"""
+
+    def __init__(self, start_timer: List[List[List[Dict[str, Any]]]],
+                 timers: List[List[List[List[Dict[str, Any]]]]]):
+        """
+        Initialize a timeline
+
+        Args:
+            start_timer: The timer the sequences were computed from
+            timers: The timer states returned by engine.run, played one after another
+        """
+        self.start_timer = wrap_timer(start_timer)
+        self.segments: List[Segment] = []
+        self.starts: List[int] = []
+        start = 0
+        previous_timer = self.start_timer
+        for timer in timers:
+            segment = Segment(start, previous_timer, timer)
+            self.segments.append(segment)
+            self.starts.append(start)
+            start += segment.duration
+            previous_timer = timer
+        self.duration = start
+
+    def get_segment(self, time_ms: float) -> Optional[Segment]:
+        """Get the segment running at a time, None before the first one"""
+        if time_ms < 0 or not self.segments:
+            return None
+        index = bisect.bisect_right(self.starts, min(time_ms, self.duration)) - 1
+        return self.segments[index]
+
+    def get_angles(self, time_ms: float) -> List[Tuple[float, float]]:
+        """Get the hours and minutes of every clock at a time, in the order of the timer"""
+        segment = self.get_segment(time_ms)
+        if segment is None:
+            return [
+                (clock["hours"], clock["minutes"])
+                for number in self.start_timer for line in number for clock in line
+            ]
+        return segment.get_angles(min(time_ms, self.duration) - segment.start)
+
+    def state_at(self, time_ms: float) -> List[List[List[Dict[str, Any]]]]:
+        """Get the timer of the needle angles at a time from the start of the sequences"""
+        return get_timer_from_angles(self.start_timer, self.get_angles(time_ms))
+
+def state_at(start_timer: List[List[List[Dict[str, Any]]]],
+             timers: List[List[List[List[Dict[str, Any]]]]],
+             time_ms: float) -> List[List[List[Dict[str, Any]]]]:
+    """Get the needle angles at a time of the timer states returned by engine.run"""
+    return Timeline(start_timer, timers).state_at(time_ms)
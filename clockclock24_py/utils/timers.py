@@ -1,9 +1,18 @@
 import datetime
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from clockclock24_py.constants import numbers
-from clockclock24_py.constants import shapes
+from clockclock24_py.utils.layout import NB_NUMBERS, NB_LINES
+
+def get_numbers() -> Any:
+    """Get the numbers module, the tables are built on first use"""
+    from clockclock24_py.constants import numbers
+    return numbers
+
+def get_shapes() -> Any:
+    """Get the shapes module, the tables are built on first use"""
+    from clockclock24_py.constants import shapes
+    return shapes
 
 def get_arr_time() -> List[int]:
     """Get the current time as an array of digits"""
@@ -13,28 +22,75 @@ def get_arr_time() -> List[int]:
 
 def get_time_timer() -> List[List[List[Dict[str, Any]]]]:
     """Get the current time in a timer format"""
-    return [numbers.NUMBERS[digit] for digit in get_arr_time()]
+    return [get_numbers().NUMBERS[digit] for digit in get_arr_time()]
 
-def get_random_shaped_timer(shape_type: str) -> List[List[List[Dict[str, Any]]]]:
+def get_random_shaped_timer(shape_type: str, nb_numbers: int = NB_NUMBERS,
+                            nb_lines: int = NB_LINES) -> List[List[List[Dict[str, Any]]]]:
     """Get a random shape from the specified shape type"""
-    shape_list = shapes.SHAPE_TYPES[shape_type]
+    shape_list = get_shapes().SHAPE_TYPES[shape_type]
+    
+    # The hand-written shapes only fit the default grid, generators fit any size
+    if (nb_numbers, nb_lines) != (NB_NUMBERS, NB_LINES):
+        shape_list = get_generators(shape_list)
+        if not shape_list:
+            raise ValueError(f"No {shape_type} shape generator for a {nb_numbers}x{nb_lines} grid")
+            
     random_index = random.randint(0, len(shape_list) - 1)
-    return shape_list[random_index]
+    shape = shape_list[random_index]
+    return shape(nb_numbers, nb_lines) if callable(shape) else shape
+
+def get_generators(shape_list: Any) -> List[Any]:
+    """Get the shape generators of a shape type, without building catalogue shapes"""
+    generators = getattr(shape_list, "generators", None)
+    if generators is not None:
+        return list(generators)
+    return [shape for shape in shape_list if callable(shape)]
+
+def get_shape_name(timer: List[List[List[Dict[str, Any]]]]) -> Optional[str]:
+    """Get the name of a shape of the shapes module, None for any other timer"""
+    for name, value in vars(get_shapes()).items():
+        if value is timer and name.isupper():
+            return name
+    for shape_list in get_shapes().SHAPE_TYPES.values():
+        for shape in get_generators(shape_list):
+            if shape.is_generated(timer):
+                return shape.name
+    return None
+
+def get_shape(name: str, nb_numbers: int = NB_NUMBERS,
+              nb_lines: int = NB_LINES) -> List[List[List[Dict[str, Any]]]]:
+    """Get a shape of SHAPE_TYPES by name"""
+    for shape_list in get_shapes().SHAPE_TYPES.values():
+        names = getattr(shape_list, "names", None)
+        if names is not None:
+            if name in names:
+                return shape_list[names.index(name)]
+            shape_list = shape_list.generators
+        for shape in shape_list:
+            if callable(shape):
+                if shape.name == name:
+                    return shape(nb_numbers, nb_lines)
+            elif get_shape_name(shape) == name:
+                return shape
+    raise ValueError(f"Unknown shape: {name}")
 
-def get_same_shape(count: int, shape_type: str) -> List[List[List[List[Dict[str, Any]]]]]:
+def get_same_shape(count: int, shape_type: str, nb_numbers: int = NB_NUMBERS,
+                   nb_lines: int = NB_LINES) -> List[List[List[List[Dict[str, Any]]]]]:
     """Get multiple instances of the same shape"""
-    shape = get_random_shaped_timer(shape_type)
+    shape = get_random_shaped_timer(shape_type, nb_numbers, nb_lines)
     return [shape] * count
 
-def get_different_shape(count: int, shape_type: str) -> List[List[List[List[Dict[str, Any]]]]]:
+def get_different_shape(count: int, shape_type: str, nb_numbers: int = NB_NUMBERS,
+                        nb_lines: int = NB_LINES) -> List[List[List[List[Dict[str, Any]]]]]:
     """Get multiple different shapes of the same type"""
-    return [get_random_shaped_timer(shape_type) for _ in range(count)]
+    return [get_random_shaped_timer(shape_type, nb_numbers, nb_lines) for _ in range(count)]
 
-def get_timers(is_same: bool, count: int = 2) -> List[List[List[List[Dict[str, Any]]]]]:
+def get_timers(is_same: bool, count: int = 2, nb_numbers: int = NB_NUMBERS,
+               nb_lines: int = NB_LINES) -> List[List[List[List[Dict[str, Any]]]]]:
     """Get a list of timer configurations based on the is_same parameter"""
     shape_type = "SYMMETRICAL" if is_same else "LINEAR"
     
     if is_same:
-        return get_same_shape(count, shape_type)
+        return get_same_shape(count, shape_type, nb_numbers, nb_lines)
     else:
-        return get_different_shape(count, shape_type) 
\ No newline at end of file
+        return get_different_shape(count, shape_type, nb_numbers, nb_lines) 
\ No newline at end of file
@@ -1,4 +1,7 @@
+import heapq
+import os
 import random
+import sys
 import time
 import threading
 from typing import List, Dict, Any, Callable, Optional, Tuple, Union
@@ -22,37 +25,113 @@ def get_max_animation_time(timer: List[List[List[Dict[str, Any]]]]) -> int:
                     max_time = anim_time
     return max_time
 
+class VirtualScheduler:
+    """Complete timeouts on a virtual clock instead of sleeping threads"""
+    
+    def __init__(self):
+        self.now = 0
+        self.queue = []
+        self.counter = 0
+        
+    def schedule(self, timeout: "Timeout"):
+        """Schedule a timeout relative to the virtual time"""
+        self.counter += 1
+        heapq.heappush(self.queue, (self.now + timeout.time_ms, self.counter, timeout))
+        
+    def get_pending(self) -> int:
+        """Count the scheduled timeouts that were not cancelled"""
+        return sum(1 for _, _, timeout in self.queue if not timeout.is_cancelled)
+        
+    def run_next(self) -> bool:
+        """Jump to the next timeout and complete it, return False when none is left"""
+        while self.queue:
+            due, _, timeout = heapq.heappop(self.queue)
+            if timeout.is_cancelled:
+                continue
+            self.now = max(self.now, due)
+            timeout.complete()
+            return True
+        return False
+        
+    def advance(self, time_ms: int):
+        """Move the virtual time forward, completing the timeouts that are due"""
+        end = self.now + time_ms
+        while self.queue and self.queue[0][0] <= end:
+            self.run_next()
+        self.now = end
+
+# The scheduler used by new timeouts, None to run each timeout in its own thread
+scheduler = None
+
+def set_scheduler(new_scheduler: Optional[VirtualScheduler]) -> Optional[VirtualScheduler]:
+    """Replace the scheduler used by new timeouts and return the previous one"""
+    global scheduler
+    previous = scheduler
+    scheduler = new_scheduler
+    return previous
+
 class Timeout:
     """A class to handle timeouts with promises"""
     
+    # Timeouts started and finished by the process, their difference is the pending count
+    nb_started = 0
+    nb_finished = 0
+    # Guards the counters and the state changes, made from any timeout thread
+    lock = threading.Lock()
+    
     def __init__(self, time_ms: int):
         self.time_ms = time_ms
+        self.is_started = False
         self.is_cancelled = False
         self.is_completed = False
         self.callbacks = []
         self.error_callbacks = []
+        # Wakes the thread of a cancelled timeout, so that it does not outlive it
+        self.wakeup = None
         
     def start(self):
         """Start the timeout"""
+        with Timeout.lock:
+            self.is_started = True
+            Timeout.nb_started += 1
+        if scheduler is not None:
+            scheduler.schedule(self)
+            return self
+            
+        wakeup = self.wakeup = threading.Event()
+        
         def run():
-            if not self.is_cancelled:
-                time.sleep(self.time_ms / 1000)
-                if not self.is_cancelled:
-                    self.is_completed = True
-                    for callback in self.callbacks:
-                        callback()
+            if not wakeup.wait(self.time_ms / 1000):
+                self.complete()
         
         thread = threading.Thread(target=run)
         thread.daemon = True
         thread.start()
         return self
         
+    def complete(self):
+        """Complete the timeout unless it was cancelled"""
+        with Timeout.lock:
+            if self.is_cancelled or self.is_completed:
+                return
+            self.is_completed = True
+            if self.is_started:
+                Timeout.nb_finished += 1
+        for callback in self.callbacks:
+            callback()
+        
     def cancel(self):
         """Cancel the timeout"""
-        if not self.is_completed:
+        with Timeout.lock:
+            if self.is_completed or self.is_cancelled:
+                return
             self.is_cancelled = True
-            for callback in self.error_callbacks:
-                callback()
+            if self.is_started:
+                Timeout.nb_finished += 1
+        if self.wakeup is not None:
+            self.wakeup.set()
+        for callback in self.error_callbacks:
+            callback()
                 
     def then(self, callback: Callable[[], None]):
         """Add a callback to be executed when the timeout completes"""
@@ -70,20 +149,58 @@ class Timeout:
             self.error_callbacks.append(callback)
         return self
 
+def get_pending_timeouts() -> int:
+    """Get the number of started timeouts that are neither completed nor cancelled"""
+    return Timeout.nb_started - Timeout.nb_finished
+
 def start_timeout(time_ms: int) -> Timeout:
     """Start a timeout with the given time in milliseconds"""
     return Timeout(time_ms).start()
 
+def get_time_ms() -> float:
+    """Get the time in milliseconds on the clock of the timeouts"""
+    if scheduler is not None:
+        return scheduler.now
+    return time.monotonic() * 1000
+
 def run_sequences(sequence_functions: List[Callable[[], Timeout]]) -> Timeout:
-    """Run a sequence of timeout functions one after another"""
-    if not sequence_functions:
-        timeout = Timeout(0)
-        timeout.is_completed = True
-        return timeout
-        
-    current_timeout = sequence_functions[0]()
+    """
+    Run a sequence of timeout functions one after another
+    
+    The returned timeout completes after the last one, and cancelling it
+    cancels the running timeout and the functions that did not start yet.
+    """
+    chain = Timeout(0)
+    current = None
     
-    for i in range(1, len(sequence_functions)):
-        current_timeout = current_timeout.then(lambda idx=i: sequence_functions[idx]())
+    def run_step(index: int):
+        nonlocal current
+        if chain.is_cancelled:
+            return
+        if index == len(sequence_functions):
+            chain.complete()
+            return
+        current = sequence_functions[index]()
+        current.then(lambda: run_step(index + 1))
         
-    return current_timeout 
\ No newline at end of file
+    def cancel_current():
+        if current is not None:
+            current.cancel()
+        
+    chain.catch(cancel_current)
+    run_step(0)
+    return chain 
+
+def get_env_port(name: str) -> Optional[int]:
+    """Get a port from an environment variable, None when it is unset or invalid"""
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        port = int(value)
+    except ValueError:
+        port = -1
+    if not 0 <= port <= 65535:
+        print(f"Ignoring {name}={value!r}: not a port number", file=sys.stderr)
+        return None
+    return port
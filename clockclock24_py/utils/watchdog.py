@@ -0,0 +1,84 @@
+import sys
+import threading
+import time
+import traceback
+from typing import List, Any, Callable
+
+from clockclock24_py.utils import events, metrics
+
+class Watchdog:
+    """Detect stalls of the Tk main loop from a heartbeat it posts"""
+
+    def __init__(self, schedule: Callable[[int, Callable[[], Any]], Any],
+                 threshold_ms: int = 1000, interval_ms: int = 100):
+        """
+        Initialize a watchdog
+
+        Args:
+            schedule: Runs a function on the main loop after a delay, like root.after
+            threshold_ms: The time without heartbeat reported as a stall
+            interval_ms: The time between two heartbeats and two checks
+        """
+        self.schedule = schedule
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.interval_ms = interval_ms
+        self.last_beat = time.monotonic()
+        self.stall_start = None
+        self.stall_count = 0
+        self.loop_thread_id = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self) -> "Watchdog":
+        """Post the first heartbeat and start checking, called from the main loop thread"""
+        self.loop_thread_id = threading.get_ident()
+        self.beat()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop checking the heartbeat"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+
+    def beat(self):
+        """Record a heartbeat and schedule the next one"""
+        if self.stop_event.is_set():
+            return
+        self.last_beat = time.monotonic()
+        if self.stall_start is not None:
+            events.log.record(
+                "stall_end", stall_ms=(self.last_beat - self.stall_start) * 1000
+            )
+            self.stall_start = None
+        self.schedule(self.interval_ms, self.beat)
+
+    def run(self):
+        """Check the heartbeat until stopped"""
+        while not self.stop_event.wait(self.interval):
+            self.check()
+
+    def check(self) -> bool:
+        """Report a stall once when the heartbeat is late, return whether it is stalled"""
+        last_beat = self.last_beat
+        late = time.monotonic() - last_beat
+        if late < self.threshold:
+            return False
+        if self.stall_start is None:
+            self.stall_start = last_beat
+            self.stall_count += 1
+            events.log.record("stall", stall_ms=late * 1000, stack=self.get_loop_stack())
+            registry = metrics.registry
+            if registry is not None:
+                registry.stalls.inc()
+        return True
+
+    def get_loop_stack(self) -> List[str]:
+        """Get the current stack of the main loop thread"""
+        frame = sys._current_frames().get(self.loop_thread_id)
+        if frame is None:
+            return []
+        return traceback.format_stack(frame)
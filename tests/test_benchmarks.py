@@ -0,0 +1,44 @@
+import unittest
+
+from benchmarks.cases import BENCHMARKS, tile_timer
+from benchmarks.run import time_function, compare_results
+from clockclock24_py.constants.numbers import NUMBERS
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for the benchmarks"""
+    
+    def test_tile_timer(self):
+        """Test the tile_timer function"""
+        timer = [NUMBERS[1], NUMBERS[2], NUMBERS[3], NUMBERS[4]]
+        tiled = tile_timer(timer, 6)
+        
+        self.assertEqual(len(tiled), 6)
+        self.assertIs(tiled[4], NUMBERS[1])
+        self.assertIs(tiled[5], NUMBERS[2])
+    
+    def test_benchmarks_run(self):
+        """Test that every benchmark can be called"""
+        for name, (factory, sizes) in BENCHMARKS.items():
+            for size in sizes or [4, 8]:
+                factory(size)()
+    
+    def test_time_function(self):
+        """Test the time_function function"""
+        calls = []
+        result = time_function(lambda: calls.append(1), repeat=2, min_time=0.001)
+        
+        self.assertGreater(result, 0)
+        self.assertGreater(len(calls), 2)
+    
+    def test_compare_results(self):
+        """Test the compare_results function"""
+        baseline = {"a[4]": 1.0, "b[4]": 2.0}
+        
+        self.assertEqual(compare_results({"a[4]": 1.2, "b[4]": 1.0}, baseline, 0.25), [])
+        
+        regressions = compare_results({"a[4]": 1.5, "c[4]": 9.0}, baseline, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("a[4]"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -192,13 +192,13 @@ class TestEngine(unittest.TestCase):
                 for clock in line:
                     self.assertEqual(clock["animation_type"], "start")
     
-    @patch('clockclock24_py.utils.engine.rotate')
-    @patch('clockclock24_py.utils.engine.rotate_reverse')
+    @patch('clockclock24_py.utils.engine.rotate_fixed')
+    @patch('clockclock24_py.utils.engine.rotate_reverse_fixed')
     def test_rotate_clock(self, mock_rotate_reverse, mock_rotate):
         """Test the rotate_clock function"""
-        # Mock the rotate functions to return expected values
-        mock_rotate.side_effect = lambda start, end: end
-        mock_rotate_reverse.side_effect = lambda start, end: -end if end > 0 else end
+        # Mock the rotate functions, in tenths of a degree, to return expected values
+        mock_rotate.side_effect = lambda start, end, min_rotation: end
+        mock_rotate_reverse.side_effect = lambda start, end, min_rotation: -end if end > 0 else end
         
         # Create a test clock and current clock
         clock = {"hours": 90, "minutes": 180}
@@ -0,0 +1,234 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+from benchmarks.soak import StubCanvas, StubRoot, run_soak, run_thread_soak
+from clockclock24_py.constants.config import (
+    CHOREOGRAPHY_ENV,
+    METRICS_PORT_ENV,
+    PROFILE_ENV,
+    SAMPLE_INTERVAL
+)
+from clockclock24_py.components.clockclock24 import ClockClock24
+from clockclock24_py.utils import events, profiling, utils
+from clockclock24_py.utils.fanout import DisplayCore
+from clockclock24_py.utils.splines import SplineTimeline
+
+class TestSoak(unittest.TestCase):
+    """Test cases for the soak harness"""
+    
+    def test_stub_canvas(self):
+        """Test that the stub canvas applies batched scripts"""
+        canvas = StubCanvas()
+        item = canvas.create_line(0, 0, 1, 1)
+        canvas.create_oval(0, 0, 2, 2)
+        
+        canvas.tk.eval(f"{canvas} coords {item} 1.00 2.00 3.00 4.00")
+        self.assertEqual(canvas.items[item], [1, 2, 3, 4])
+        
+        canvas.delete(item)
+        self.assertEqual(len(canvas.find_all()), 1)
+        canvas.delete("all")
+        self.assertEqual(canvas.find_all(), [])
+    
+    def test_stub_root_after(self):
+        """Test that after callbacks run on the virtual clock"""
+        scheduler = utils.VirtualScheduler()
+        previous = utils.set_scheduler(scheduler)
+        try:
+            root = StubRoot()
+            calls = []
+            root.after(100, lambda: calls.append("a"))
+            job = root.after(50, lambda: calls.append("b"))
+            root.after_cancel(job)
+            scheduler.advance(200)
+        finally:
+            utils.set_scheduler(previous)
+        
+        self.assertEqual(calls, ["a"])
+        self.assertEqual(root.jobs, {})
+    
+    def test_run_soak(self):
+        """Test that a short soak runs without unbounded growth"""
+        result = run_soak(cycles=40, checkpoints=4)
+        
+        self.assertEqual(result["failures"], [])
+        self.assertEqual(result["cycles"], 40)
+        self.assertEqual(len(result["checkpoints"]), 4)
+        items = {checkpoint["canvas_items"] for checkpoint in result["checkpoints"]}
+        self.assertEqual(len(items), 1)
+        self.assertIsNot(utils.scheduler, result)
+        self.assertIsNone(utils.scheduler)
+
+    def test_run_thread_soak(self):
+        """Test that retargeting cycles on real threads does not leave threads behind"""
+        result = run_thread_soak(cycles=60, checkpoints=3, interval_ms=10)
+        
+        self.assertEqual(result["failures"], [])
+        self.assertEqual(len(result["checkpoints"]), 3)
+        self.assertIsNone(utils.scheduler)
+
+    def test_invalid_settings(self):
+        """Test that invalid environment settings are reported without stopping the clock"""
+        scheduler = utils.VirtualScheduler()
+        previous = utils.set_scheduler(scheduler)
+        try:
+            for name, setting in [(PROFILE_ENV, "abc"), (PROFILE_ENV, "5:nope"),
+                                  (METRICS_PORT_ENV, "abc")]:
+                output = io.StringIO()
+                with patch.dict(os.environ, {name: setting}), redirect_stderr(output):
+                    clock = ClockClock24(StubRoot(), StubCanvas())
+                if clock.watchdog:
+                    clock.watchdog.stop()
+                self.assertIn(name, output.getvalue())
+                self.assertIsNone(profiling.session)
+                self.assertIsNone(clock.metrics_server)
+            
+            # Invalid delay patterns fail at startup, not in the cycle thread
+            with patch("clockclock24_py.utils.planning.DELAY_PATTERNS", ["radial:x"]):
+                with self.assertRaises(ValueError):
+                    ClockClock24(StubRoot(), StubCanvas())
+            
+            # So do invalid choreographies
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "cycle.json")
+                with open(path, "w", encoding="utf-8") as file:
+                    json.dump([{"shape": "NOPE"}], file)
+                with patch.dict(os.environ, {CHOREOGRAPHY_ENV: path}):
+                    with self.assertRaises(ValueError):
+                        ClockClock24(StubRoot(), StubCanvas())
+            
+            # A cycle that cannot be planned does not leave the clock running
+            clock = ClockClock24(StubRoot(), StubCanvas())
+            if clock.watchdog:
+                clock.watchdog.stop()
+            with patch("clockclock24_py.utils.planning.get_sequences", side_effect=ValueError):
+                with self.assertRaises(ValueError):
+                    clock.start_cycle()
+            self.assertFalse(clock.is_running)
+            self.assertEqual(clock.cycle_count, 0)
+        finally:
+            utils.set_scheduler(previous)
+
+    def test_interrupt_cycle(self):
+        """Test retargeting a running cycle from the current needle angles"""
+        scheduler = utils.VirtualScheduler()
+        previous = utils.set_scheduler(scheduler)
+        clock = None
+        try:
+            clock = ClockClock24(StubRoot(), StubCanvas())
+            scheduler.advance(1000)
+            self.assertTrue(clock.is_running)
+            first_timeout = clock.sequence_timeout
+            first_timeline = clock.timeline
+            
+            scheduler.advance(2500)
+            expected = first_timeline.state_at(2500)
+            clock.start_cycle(interrupt=True)
+            
+            self.assertTrue(first_timeout.is_cancelled)
+            self.assertTrue(clock.is_running)
+            self.assertEqual(clock.cycle_count, 2)
+            self.assertEqual(events.log.get_events("interrupt")[-1]["cycle"], 1)
+            
+            # The new plan starts where the needles were interrupted
+            for number, expected_number in zip(clock.timeline.start_timer, expected):
+                for line, expected_line in zip(number, expected_number):
+                    for needle, expected_needle in zip(line, expected_line):
+                        # Angles are planned in tenths of a degree
+                        difference = (needle["hours"] - expected_needle["hours"]) % 360
+                        self.assertLessEqual(min(difference, 360 - difference), 0.05)
+            
+            # The frames are sampled every SAMPLE_INTERVAL since the first cycle started,
+            # the next one follows the new timeline instead of jumping back
+            scheduler.advance(SAMPLE_INTERVAL - 2500 % SAMPLE_INTERVAL)
+            self.assertEqual(clock.timer, clock.timeline.state_at(scheduler.now - clock.cycle_start))
+            
+            # Without interrupt, a trigger during a cycle is skipped
+            clock.start_cycle()
+            self.assertEqual(clock.cycle_count, 2)
+        finally:
+            if clock is not None and clock.watchdog:
+                clock.watchdog.stop()
+            utils.set_scheduler(previous)
+
+    def test_sampled_cycle(self):
+        """Test that a standalone clock draws the needles along the timeline"""
+        scheduler = utils.VirtualScheduler()
+        previous = utils.set_scheduler(scheduler)
+        clock = None
+        try:
+            clock = ClockClock24(StubRoot(), StubCanvas())
+            scheduler.advance(1000)
+            self.assertTrue(clock.is_running)
+            
+            scheduler.advance(12 * SAMPLE_INTERVAL)
+            self.assertEqual(clock.timer, clock.timeline.state_at(12 * SAMPLE_INTERVAL))
+            self.assertEqual(clock.renderer.frame_count, 13)
+            
+            # The rest timer is drawn once the cycle completes
+            scheduler.advance(clock.timeline.duration)
+            self.assertFalse(clock.is_running)
+            self.assertFalse(clock.renderer.is_sampling)
+            end = clock.timeline.state_at(clock.timeline.duration)
+            for number, end_number in zip(clock.timer, end):
+                for line, end_line in zip(number, end_number):
+                    for needle, end_needle in zip(line, end_line):
+                        self.assertEqual(needle["animation_time"], 0)
+                        self.assertAlmostEqual(needle["hours"], end_needle["hours"] % 360)
+        finally:
+            if clock is not None and clock.watchdog:
+                clock.watchdog.stop()
+            utils.set_scheduler(previous)
+
+    def test_spline_cycle(self):
+        """Test that SPLINE_TRAJECTORIES moves the drawn needles along splines"""
+        scheduler = utils.VirtualScheduler()
+        previous = utils.set_scheduler(scheduler)
+        clock = None
+        try:
+            with patch("clockclock24_py.utils.planning.SPLINE_TRAJECTORIES", True):
+                clock = ClockClock24(StubRoot(), StubCanvas())
+                scheduler.advance(1000)
+            self.assertIsInstance(clock.timeline, SplineTimeline)
+            
+            scheduler.advance(12 * SAMPLE_INTERVAL)
+            self.assertEqual(clock.timer, clock.timeline.state_at(12 * SAMPLE_INTERVAL))
+        finally:
+            if clock is not None and clock.watchdog:
+                clock.watchdog.stop()
+            utils.set_scheduler(previous)
+
+    def test_mirrored_displays(self):
+        """Test that displays fed by one core show the same frames"""
+        scheduler = utils.VirtualScheduler()
+        previous = utils.set_scheduler(scheduler)
+        clocks = []
+        try:
+            core = DisplayCore(animation_time=1000).start(0)
+            clocks = [ClockClock24(StubRoot(), StubCanvas(), core) for _ in range(3)]
+            scheduler.run_next()
+            self.assertEqual(core.cycle_count, 1)
+            
+            # The frames are sampled every SAMPLE_INTERVAL
+            scheduler.advance(12 * SAMPLE_INTERVAL)
+            self.assertEqual(clocks[0].timer, core.timeline.state_at(12 * SAMPLE_INTERVAL))
+            self.assertEqual(clocks[1].timer, clocks[0].timer)
+            self.assertEqual(clocks[2].timer, clocks[0].timer)
+            self.assertEqual(clocks[0].cycle_count, 0)
+
+            scheduler.advance(core.timeline.duration)
+            self.assertEqual(clocks[2].timer, core.timer)
+            core.stop()
+        finally:
+            for clock in clocks:
+                if clock.watchdog:
+                    clock.watchdog.stop()
+            utils.set_scheduler(previous)
+
+if __name__ == "__main__":
+    unittest.main()